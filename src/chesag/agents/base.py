@@ -4,10 +4,14 @@ from abc import ABC, abstractmethod
 
 from chess import Board, Move
 
+from chesag.parallel import ParallelWorkerManager
+
 
 class BaseAgent(ABC):
   """Abstract base class for chess agents."""
 
+  _worker_pools: tuple[ParallelWorkerManager, ...] = ()
+
   @abstractmethod
   def get_move(self, board: Board) -> Move:
     """Generate a move for the given board position.
@@ -32,8 +36,15 @@ class BaseAgent(ABC):
         The current chess board position.
     """
 
+  def attach_workers(self, workers: ParallelWorkerManager) -> ParallelWorkerManager:
+    """Register a worker pool for `close()` to shut down and return it."""
+    self._worker_pools = (*self._worker_pools, workers)
+    return workers
+
   def close(self) -> None:
-    """Release any external resources held by the agent."""
+    """Release any external resources held by the agent, shutting down its attached worker pools."""
+    for workers in self._worker_pools:
+      workers.shutdown()
 
   def __str__(self) -> str:
     """Return a string representation of the agent."""
@@ -2,14 +2,22 @@
 
 from __future__ import annotations
 
+import os
 import warnings
+from typing import TYPE_CHECKING
 
 from chess import Board, Move
 
 from chesag.agents.base import BaseAgent
-from chesag.agents.mcts.algorithm import MCTSSearcher
+from chesag.agents.mcts.algorithm import MCTSSearcher, ParallelStrategy
+from chesag.agents.mcts.tree import NO_NODE, ROOT, MCTSTree, TreeReuseStats
 from chesag.evaluation import material_balance
 from chesag.logging import get_logger
+from chesag.position_key import PositionKeyMode
+
+if TYPE_CHECKING:
+  from chesag.evaluation import EvaluationProfile
+  from chesag.parallel import ParallelMode
 
 logger = get_logger()
 
@@ -24,18 +32,39 @@ class MCTSConfig:
     use_transposition_table: bool = True,
     resign_threshold: float | None = None,
     *,
+    key_mode: PositionKeyMode = PositionKeyMode.TUPLE,
+    use_staged_ordering: bool = False,
+    use_incremental_eval: bool = True,
+    use_batch_priors: bool = False,
+    profile: EvaluationProfile | str | None = None,
+    use_array_tree: bool = True,
+    reuse_tree: bool = True,
     parallel: bool | None = None,
     num_workers: int | None = None,
+    parallel_mode: ParallelMode | None = None,
+    parallel_strategy: ParallelStrategy = ParallelStrategy.LEAF,
+    seed: int | None = None,
+    evaluation_stats_sample_every: int | None = None,
     rollouts_per_leaf: int | None = None,
     use_pruning: bool | None = None,
   ) -> None:
     """Initialize the MCTS configuration.
 
-    Deprecated knobs are accepted for compatibility, but only live options are stored.
+    `profile` names the evaluation profile the searcher scores leaves with, and
+    `use_array_tree` searches an array-backed `MCTSTree` instead of `Node` objects (see
+    `MCTSSearcher`). `reuse_tree` keeps the array tree between moves and resumes the
+    search from the subtree of the position actually reached. `parallel` searches the
+    array tree with `num_workers` rollout workers, one per CPU by default, on a pool of
+    `parallel_mode` workers; giving more than one worker turns it on.
+    `parallel_strategy` picks leaf parallelism or root parallelism, where each worker
+    process searches its own tree and `seed` seeds their rollouts.
+    `evaluation_stats_sample_every` makes the searcher count its evaluation calls into
+    `MCTSSearcher.evaluation_stats`. Deprecated knobs are accepted for compatibility, but
+    only live options are stored.
     """
-    if parallel is not None or num_workers is not None or rollouts_per_leaf is not None:
+    if rollouts_per_leaf is not None:
       warnings.warn(
-        "parallel, num_workers, and rollouts_per_leaf are no longer supported and are ignored",
+        "rollouts_per_leaf is no longer supported and is ignored",
         DeprecationWarning,
         stacklevel=2,
       )
@@ -50,11 +79,28 @@ class MCTSConfig:
     self.num_simulations = num_simulations
     self.c_puct = c_puct
     self.use_transposition_table = use_transposition_table
+    self.key_mode = key_mode
+    self.use_staged_ordering = use_staged_ordering
+    self.use_incremental_eval = use_incremental_eval
+    self.use_batch_priors = use_batch_priors
+    self.profile = profile
+    self.use_array_tree = use_array_tree
+    self.reuse_tree = reuse_tree
+    if parallel is None:
+      parallel = num_workers is not None and num_workers > 1
+    self.num_workers = (num_workers or os.cpu_count() or 1) if parallel else 1
+    self.parallel_mode = parallel_mode
+    self.parallel_strategy = parallel_strategy
+    self.seed = seed
+    self.evaluation_stats_sample_every = evaluation_stats_sample_every
     self.resign_threshold = min(resign_threshold, -resign_threshold) if resign_threshold is not None else float("-inf")
 
   def __str__(self) -> str:
     """Return a concise string representation of the config."""
-    return f"sims={self.num_simulations}, c_puct={self.c_puct}, tt={self.use_transposition_table}"
+    description = f"sims={self.num_simulations}, c_puct={self.c_puct}, tt={self.use_transposition_table}"
+    if self.num_workers > 1:
+      description += f", workers={self.num_workers} ({self.parallel_strategy.value})"
+    return description
 
 
 class MCTSAgent(BaseAgent):
@@ -68,8 +114,19 @@ class MCTSAgent(BaseAgent):
     c_puct: float = 1.4,
     use_transposition_table: bool = True,
     resign_threshold: float | None = None,
+    key_mode: PositionKeyMode = PositionKeyMode.TUPLE,
+    use_staged_ordering: bool = False,
+    use_incremental_eval: bool = True,
+    use_batch_priors: bool = False,
+    profile: EvaluationProfile | str | None = None,
+    use_array_tree: bool = True,
+    reuse_tree: bool = True,
     parallel: bool | None = None,
     num_workers: int | None = None,
+    parallel_mode: ParallelMode | None = None,
+    parallel_strategy: ParallelStrategy = ParallelStrategy.LEAF,
+    seed: int | None = None,
+    evaluation_stats_sample_every: int | None = None,
     rollouts_per_leaf: int | None = None,
     use_pruning: bool | None = None,
   ) -> None:
@@ -80,13 +137,41 @@ class MCTSAgent(BaseAgent):
         c_puct=c_puct,
         use_transposition_table=use_transposition_table,
         resign_threshold=resign_threshold,
+        key_mode=key_mode,
+        use_staged_ordering=use_staged_ordering,
+        use_incremental_eval=use_incremental_eval,
+        use_batch_priors=use_batch_priors,
+        profile=profile,
+        use_array_tree=use_array_tree,
+        reuse_tree=reuse_tree,
         parallel=parallel,
         num_workers=num_workers,
+        parallel_mode=parallel_mode,
+        parallel_strategy=parallel_strategy,
+        seed=seed,
+        evaluation_stats_sample_every=evaluation_stats_sample_every,
         rollouts_per_leaf=rollouts_per_leaf,
         use_pruning=use_pruning,
       )
     self.config = config
-    self.mcts_searcher = MCTSSearcher(use_transposition_table=self.config.use_transposition_table)
+    self.mcts_searcher = MCTSSearcher(
+      use_transposition_table=self.config.use_transposition_table,
+      key_mode=self.config.key_mode,
+      use_staged_ordering=self.config.use_staged_ordering,
+      use_incremental_eval=self.config.use_incremental_eval,
+      use_batch_priors=self.config.use_batch_priors,
+      profile=self.config.profile,
+      use_array_tree=self.config.use_array_tree,
+      num_workers=self.config.num_workers,
+      parallel_mode=self.config.parallel_mode,
+      parallel_strategy=self.config.parallel_strategy,
+      seed=self.config.seed,
+      evaluation_stats_sample_every=self.config.evaluation_stats_sample_every,
+    )
+    if self.mcts_searcher.workers is not None:
+      self.attach_workers(self.mcts_searcher.workers)
+    self.reuse_stats = TreeReuseStats()
+    self._tree: MCTSTree | None = None
 
   def get_move(self, board: Board) -> Move:
     """Get the best move for the current board position using MCTS."""
@@ -95,13 +180,45 @@ class MCTSAgent(BaseAgent):
     move_and_eval = self.mcts_searcher.should_return_single_move(board)
     if move_and_eval is not None:
       return move_and_eval[0]
+    if self.config.num_workers > 1 and self.config.parallel_strategy is ParallelStrategy.ROOT:
+      return self.mcts_searcher.root_parallel_search(board, self.config.num_simulations, self.config.c_puct)[0]
 
-    root = self.mcts_searcher.create_root_node(board)
+    root = self._reused_tree(board) if self.config.reuse_tree else None
+    if root is None:
+      root = self.mcts_searcher.create_root(board)
     self.mcts_searcher.search(root, self.config.num_simulations, self.config.c_puct)
+    if self.config.reuse_tree and isinstance(root, MCTSTree):
+      self._tree = root
     return self.mcts_searcher.get_best_child(root)[0]
 
+  def _reused_tree(self, board: Board) -> MCTSTree | None:
+    """Return the previous search tree re-rooted at `board`, or `None` to start a fresh one.
+
+    The tree is kept only when `board` continues the game it was searched in and the
+    position reached was expanded. Nodes outside the new root's subtree are released.
+    """
+    self.reuse_stats.searches += 1
+    self.reuse_stats.last_reused_visits = 0
+    tree, self._tree = self._tree, None
+    if tree is None:
+      return None
+    moves = tree.moves_to(board)
+    size = len(tree)
+    if moves is None or tree.reroot(moves) == NO_NODE:
+      return None
+    visits = int(tree.visits[ROOT])
+    self.reuse_stats.reused_searches += 1
+    self.reuse_stats.reused_nodes += len(tree)
+    self.reuse_stats.released_nodes += size - len(tree)
+    self.reuse_stats.reused_visits += visits
+    self.reuse_stats.last_reused_visits = visits
+    logger.debug("Reusing %d nodes with %d visits from the previous search", len(tree), visits)
+    return tree
+
   def close(self) -> None:
-    """Persist any MCTS cache state before shutdown."""
+    """Stop the parallel search workers and persist any MCTS cache state before shutdown."""
+    self._tree = None
+    super().close()
     self.mcts_searcher.save_cache()
     logger.info("Closing MCTSAgent, transposition table saved")
 
@@ -3,22 +3,41 @@
 from __future__ import annotations
 
 import pickle  # noqa: S403
+import threading
+from concurrent.futures import FIRST_COMPLETED, wait
 from dataclasses import dataclass
+from enum import Enum
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import numpy as np
 from cachetools import LRUCache
+from chess import Move
 
 from chesag.agents.mcts.node import Node
-from chesag.evaluation import leaf_evaluate
+from chesag.agents.mcts.tree import NO_NODE, ROOT, MCTSTree
+from chesag.evaluation import (
+  EvaluationStats,
+  IncrementalEvaluator,
+  get_evaluation_weights,
+  leaf_evaluate,
+  record_evaluation_stats,
+  resolve_profile,
+  set_evaluation_weights,
+  use_thread_evaluation_caches,
+)
 from chesag.logging import get_logger
 from chesag.move_priority import HeuristicMovePrioritizer
-from chesag.position_key import build_position_key
+from chesag.parallel import ParallelMode, ParallelWorkerManager, default_parallel_mode
+from chesag.position_key import PositionKeyMode, build_position_key, zobrist_hash
 
 if TYPE_CHECKING:
-  from collections.abc import Hashable
+  from collections.abc import Callable, Hashable
+  from concurrent.futures import Future
 
-  from chess import Board, Move
+  from chess import Board
+
+  from chesag.evaluation import EvaluationProfile, EvaluationWeights
 
 logger = get_logger()
 TRANSPOSITION_TABLE_MAX_SIZE = 500_000
@@ -39,17 +58,138 @@ class CachedNode:
     return self.value / self.visits if self.visits > 0 else 0.0
 
 
+class ParallelStrategy(Enum):
+  """How a parallel MCTS search shares its work between workers."""
+
+  LEAF = "leaf"
+  ROOT = "root"
+
+
+class _RolloutWorker(threading.local):
+  """The rollout evaluators and generator, or the searcher, of the current worker thread or process."""
+
+  def __init__(self) -> None:
+    self.evaluator: IncrementalEvaluator | None = None
+    self.leaf_evaluator: Callable[[Board, bool], float] | None = None
+    self.rng: np.random.Generator | None = None
+    self.searcher: MCTSSearcher | None = None
+
+
+_ROLLOUT_WORKER = _RolloutWorker()
+
+
+def _use_weights(weights: EvaluationWeights) -> None:
+  """Put the parent's evaluation weights in use in a worker that does not share them yet."""
+  if weights != get_evaluation_weights():
+    set_evaluation_weights(weights)
+
+
+def init_rollout_worker(
+  profile: EvaluationProfile | None,
+  use_incremental_eval: bool,
+  verify_incremental_eval: bool,
+  is_process: bool,
+  weights: EvaluationWeights,
+) -> None:
+  """Build the evaluators and the rollout generator of one rollout worker.
+
+  `weights` are the evaluation weights of the parent, which worker processes started
+  by a fork server do not inherit. Worker threads, which `is_process` is false for,
+  take their own evaluation caches, since the shared ones are not safe without the GIL.
+  """
+  _use_weights(weights)
+  if not is_process:
+    use_thread_evaluation_caches()
+  _ROLLOUT_WORKER.rng = np.random.default_rng()
+  _ROLLOUT_WORKER.evaluator = IncrementalEvaluator(verify=verify_incremental_eval) if use_incremental_eval else None
+  _ROLLOUT_WORKER.leaf_evaluator = profile.compile() if profile is not None else None
+
+
+def run_rollout(board: Board) -> float:
+  """Play a rollout with the evaluators of the current worker and return the score for the side to move."""
+  return Node.play_rollout(board, _ROLLOUT_WORKER.evaluator, _ROLLOUT_WORKER.leaf_evaluator, _ROLLOUT_WORKER.rng)
+
+
 class MCTSSearcher:
   """Core MCTS search functionality."""
 
   cache_file = Path("cache/mcts_cache_v2.pickle")
 
-  def __init__(self, use_transposition_table: bool = True) -> None:
-    """Initialize the searcher and optional transposition table."""
+  def __init__(
+    self,
+    use_transposition_table: bool = True,
+    key_mode: PositionKeyMode = PositionKeyMode.TUPLE,
+    use_staged_ordering: bool = False,
+    use_incremental_eval: bool = True,
+    verify_incremental_eval: bool = False,
+    use_batch_priors: bool = False,
+    profile: EvaluationProfile | str | None = None,
+    use_array_tree: bool = True,
+    num_workers: int = 1,
+    parallel_mode: ParallelMode | None = None,
+    virtual_loss: float = 1.0,
+    parallel_strategy: ParallelStrategy = ParallelStrategy.LEAF,
+    seed: int | None = None,
+    evaluation_stats_sample_every: int | None = None,
+  ) -> None:
+    """Initialize the searcher and optional transposition table.
+
+    With `use_incremental_eval`, rollouts carry an `IncrementalEvaluator` instead of
+    recounting material for every candidate move; `verify_incremental_eval` checks each
+    of its scores against a full recomputation. `use_batch_priors` scores the priors of
+    all children of a node in one vectorized call when it is first expanded. `profile`
+    scores terminal nodes and the end of every rollout with a compiled
+    `EvaluationProfile`, given as is, by built-in name or by file path, instead of the
+    leaf tier. `use_array_tree` makes `create_root()` build an `MCTSTree`, which keeps the
+    node statistics in NumPy arrays and walks a single board, instead of a tree of
+    `Node` objects that each hold a board copy; both are searched the same way. Serial
+    rollouts draw their moves from the searcher's own `rollout_rng`, seeded from `seed`,
+    and every rollout worker keeps a generator of its own.
+
+    With `num_workers` above one, an `MCTSTree` is searched leaf-parallel with virtual
+    loss: this thread still does every selection, expansion and backup, marking each
+    selected path with `virtual_loss` so the next selections spread to other leaves,
+    while up to `num_workers` rollouts run on a pool of `parallel_mode` workers, by
+    default threads on free-threaded builds and processes otherwise. The pool, `workers`, is
+    started on the first parallel search and kept until `shutdown()`. A `Node` tree is
+    always searched serially.
+
+    The `ParallelStrategy.ROOT` strategy instead splits the simulations of
+    `root_parallel_search()` between `num_workers` worker processes, each searching an
+    independent tree without a transposition table from its own rollout seed, drawn
+    from `seed`, and merges their root statistics.
+
+    With `evaluation_stats_sample_every`, every `search()` counts the evaluation calls of
+    this thread into the searcher's own `evaluation_stats`, timing one call in that
+    many per tier. Rollouts played by parallel workers are not counted.
+    """
+    if num_workers < 1:
+      msg = "num_workers must be at least 1"
+      raise ValueError(msg)
+    self.key_mode = key_mode
+    self.use_staged_ordering = use_staged_ordering
+    self.use_batch_priors = use_batch_priors
+    self.use_array_tree = use_array_tree
+    self.num_workers = num_workers
+    self.parallel_mode = parallel_mode or default_parallel_mode()
+    self.virtual_loss = virtual_loss
+    self.parallel_strategy = parallel_strategy
+    self._use_incremental_eval = use_incremental_eval
+    self._seeds = np.random.SeedSequence(seed)
+    self.rollout_rng = np.random.default_rng(self._seeds.spawn(1)[0])
+    self._verify_incremental_eval = verify_incremental_eval
+    self.evaluator = IncrementalEvaluator(verify=verify_incremental_eval) if use_incremental_eval else None
+    self.profile = resolve_profile(profile) if profile is not None else None
+    self.leaf_evaluator: Callable[[Board, bool], float] | None = (
+      self.profile.compile() if self.profile is not None else None
+    )
     self.cache_persist_interval = 1000
     self.remaining_simulations_until_cache_persist = self.cache_persist_interval
     self.move_prioritizer = HeuristicMovePrioritizer()
     self.transposition_table = self.load_cache() if use_transposition_table else None
+    self.workers = self._create_workers() if num_workers > 1 else None
+    self.evaluation_stats_sample_every = evaluation_stats_sample_every
+    self.evaluation_stats = EvaluationStats() if evaluation_stats_sample_every is not None else None
 
   @staticmethod
   def load_cache() -> LRUCache[Hashable, CachedNode]:
@@ -102,14 +242,51 @@ class MCTSSearcher:
     """Return a compact transposition key for a chess position."""
     return build_position_key(board)
 
-  def _lookup_tt_entry(self, board: Board) -> CachedNode | None:
+  def node_key(self, node: Node) -> Hashable:
+    """Return the transposition key of a node, reusing its incremental Zobrist key when present."""
+    if node.zobrist_key is not None:
+      return node.zobrist_key
+    return self.position_key(node.board)
+
+  def tree_node_key(self, tree: MCTSTree, index: int) -> Hashable:
+    """Return the transposition key of a tree node; the tree board must stand at the node."""
+    if tree.uses_keys:
+      return int(tree.key[index])
+    return self.position_key(tree.board)
+
+  def _lookup_tt_entry(self, node: Node) -> CachedNode | None:
     if self.transposition_table is None:
       return None
-    return self.transposition_table.get(self.position_key(board))
+    return self.transposition_table.get(self.node_key(node))
+
+  def create_root(self, board: Board) -> Node | MCTSTree:
+    """Create and expand the root of a search: an `MCTSTree` or a root `Node`, per `use_array_tree`."""
+    return self.create_tree(board) if self.use_array_tree else self.create_root_node(board)
+
+  def create_tree(self, board: Board) -> MCTSTree:
+    """Create an array-backed tree for a board and expand its root."""
+    tree = MCTSTree(
+      board,
+      move_prioritizer=self.move_prioritizer,
+      zobrist_key=zobrist_hash(board) if self.key_mode is PositionKeyMode.ZOBRIST else None,
+      staged_ordering=self.use_staged_ordering,
+      batch_priors=self.use_batch_priors,
+      virtual_loss=self.virtual_loss,
+    )
+    if tree.expand(ROOT) == NO_NODE:
+      msg = "Failed to expand root node"
+      raise ValueError(msg)
+    return tree
 
   def create_root_node(self, board: Board) -> Node:
     """Create and expand the root search node."""
-    root = Node(board=board.copy(), move_prioritizer=self.move_prioritizer)
+    root = Node(
+      board=board.copy(),
+      move_prioritizer=self.move_prioritizer,
+      zobrist_key=zobrist_hash(board) if self.key_mode is PositionKeyMode.ZOBRIST else None,
+      staged_ordering=self.use_staged_ordering,
+      batch_priors=self.use_batch_priors,
+    )
     logger.debug("Creating root node")
     if root.expand() is None:
       msg = "Failed to expand root node"
@@ -124,7 +301,7 @@ class MCTSSearcher:
       current = current.select_child(c_puct)
 
     if not current.is_terminal():
-      tt_entry = self._lookup_tt_entry(current.board)
+      tt_entry = self._lookup_tt_entry(current)
       expanded_child = current.expand(tt_move=tt_entry.best_move if tt_entry is not None else None)
       if expanded_child is not None:
         current = expanded_child
@@ -133,48 +310,244 @@ class MCTSSearcher:
     current.backpropagate(result)
     return result
 
+  def tree_step(self, tree: MCTSTree, c_puct: float) -> float:
+    """Run one MCTS simulation through an array-backed tree, leaving its board at the root."""
+    depth = 0
+    try:
+      index, depth = self._select_tree_leaf(tree, c_puct)
+      result = self.simulate_tree_node(tree, index)
+    finally:
+      tree.ascend(depth)
+    tree.backpropagate(index, result)
+    return result
+
+  def _select_tree_leaf(self, tree: MCTSTree, c_puct: float) -> tuple[int, int]:
+    """Select a leaf, expanding one child when allowed, and return it with its depth.
+
+    The tree board is left standing at the leaf; on error it is brought back to the root.
+    """
+    index = ROOT
+    depth = 0
+    try:
+      while not tree.is_terminal(index) and tree.is_expanded(index) and not tree.can_expand(index):
+        index = tree.select_child(index, c_puct)
+        tree.descend(index)
+        depth += 1
+
+      if not tree.is_terminal(index):
+        tt_entry = (
+          self.transposition_table.get(self.tree_node_key(tree, index))
+          if self.transposition_table is not None
+          else None
+        )
+        child = tree.expand(index, depth=depth, tt_move=tt_entry.best_move if tt_entry is not None else None)
+        if child != NO_NODE:
+          index = child
+          tree.descend(index)
+          depth += 1
+    except BaseException:
+      tree.ascend(depth)
+      raise
+    return index, depth
+
   def simulate(self, node: Node) -> float:
     """Evaluate one node by rollout or cached value."""
     if node.is_terminal():
-      return leaf_evaluate(node.board, node.board.turn)
-
-    position_key = self.position_key(node.board)
+      return self._terminal_score(node.board)
+    return self._rollout_score(node.board.copy(), self.node_key(node), node.move)
+
+  def simulate_tree_node(self, tree: MCTSTree, index: int) -> float:
+    """Evaluate one tree node by rollout or cached value; the tree board must stand at the node."""
+    if tree.is_terminal(index):
+      return self._terminal_score(tree.board)
+    plies = len(tree.board.move_stack)
+    try:
+      return self._rollout_score(tree.board, self.tree_node_key(tree, index), tree.move_of(index))
+    finally:
+      tree.ascend(len(tree.board.move_stack) - plies)
+
+  def _terminal_score(self, board: Board) -> float:
+    """Score a finished game for its side to move."""
+    if self.leaf_evaluator is not None:
+      return self.leaf_evaluator(board, board.turn)
+    return leaf_evaluate(board, board.turn)
+
+  def _rollout_score(self, rollout_board: Board, position_key: Hashable, move: Move | None) -> float:
+    """Return the cached score of a position once it is trusted, or else roll out on `rollout_board`."""
+    cached_score = self._trusted_score(position_key)
+    if cached_score is not None:
+      return cached_score
+    result = Node.play_rollout(rollout_board, self.evaluator, self.leaf_evaluator, self.rollout_rng)
+    self._record_rollout(position_key, move, result)
+    return result
 
+  def _trusted_score(self, position_key: Hashable) -> float | None:
+    """Return the cached score of a position once enough rollouts back it, or `None`."""
     if self.transposition_table is not None:
       cached = self.transposition_table.get(position_key)
       if cached is not None and cached.visits >= TT_SCORE_MIN_VISITS:
         return cached.score
+    return None
 
-    result = node.rollout()
-
+  def _record_rollout(self, position_key: Hashable, move: Move | None, result: float) -> None:
+    """Add a rollout result to the transposition table."""
     if self.transposition_table is not None:
       if position_key not in self.transposition_table:
-        self.transposition_table[position_key] = CachedNode(result, 1, node.move)
+        self.transposition_table[position_key] = CachedNode(result, 1, move)
       else:
         entry = self.transposition_table[position_key]
         entry.value += result
         entry.visits += 1
         if entry.best_move is None:
-          entry.best_move = node.move
-
-    return result
-
-  def search(self, root: Node, num_simulations: int, c_puct: float) -> None:
-    """Run repeated MCTS simulations from the root."""
-    for sim in range(num_simulations):
-      logger.debug("Sim %s/%s", sim + 1, num_simulations)
-      if self.transposition_table is not None:
-        self.remaining_simulations_until_cache_persist -= 1
-        logger.debug("Remaining simulations until cache persist: %s", self.remaining_simulations_until_cache_persist)
-      self.single_step(root, c_puct)
+          entry.best_move = move
+
+  def search(self, root: Node | MCTSTree, num_simulations: int, c_puct: float) -> None:
+    """Run repeated MCTS simulations from the root of a `Node` tree or an `MCTSTree`."""
+    if self.evaluation_stats_sample_every is None:
+      self._search(root, num_simulations, c_puct)
+      return
+    with record_evaluation_stats(self.evaluation_stats, sample_every=self.evaluation_stats_sample_every):
+      self._search(root, num_simulations, c_puct)
+
+  def _search(self, root: Node | MCTSTree, num_simulations: int, c_puct: float) -> None:
+    if self.workers is not None and self.parallel_strategy is ParallelStrategy.LEAF and isinstance(root, MCTSTree):
+      self._leaf_parallel_search(root, num_simulations, c_puct)
+    else:
+      for sim in range(num_simulations):
+        self._count_simulation(sim, num_simulations)
+        if isinstance(root, MCTSTree):
+          self.tree_step(root, c_puct)
+        else:
+          self.single_step(root, c_puct)
 
     if self.transposition_table is not None and self.remaining_simulations_until_cache_persist <= 0:
       self.save_cache()
       self.remaining_simulations_until_cache_persist = self.cache_persist_interval
 
+  def _count_simulation(self, sim: int, num_simulations: int) -> None:
+    logger.debug("Sim %s/%s", sim + 1, num_simulations)
+    if self.transposition_table is not None:
+      self.remaining_simulations_until_cache_persist -= 1
+      logger.debug("Remaining simulations until cache persist: %s", self.remaining_simulations_until_cache_persist)
+
+  def _leaf_parallel_search(self, tree: MCTSTree, num_simulations: int, c_puct: float) -> None:
+    """Run the simulations of `search()` with up to `num_workers` rollouts in flight.
+
+    Only this thread touches the tree and the transposition table, so descents are
+    never concurrent. Terminal leaves and trusted cached scores are backed up at once;
+    every other leaf is marked with a virtual loss and its rollout runs in a worker on a
+    copy of the board without its move stack, which keeps what a worker process is sent
+    small, and is backed up when it completes.
+    """
+    workers = self._parallel_workers()
+    pending: dict[Future[float], tuple[int, Hashable, Move | None]] = {}
+    launched = 0
+    try:
+      while launched < num_simulations or pending:
+        while launched < num_simulations and len(pending) < self.num_workers:
+          self._count_simulation(launched, num_simulations)
+          launched += 1
+          index, depth = self._select_tree_leaf(tree, c_puct)
+          try:
+            if tree.is_terminal(index):
+              score = self._terminal_score(tree.board)
+            else:
+              position_key = self.tree_node_key(tree, index)
+              score = self._trusted_score(position_key)
+              rollout_board = tree.board.copy(stack=False) if score is None else None
+          finally:
+            tree.ascend(depth)
+          if score is not None:
+            tree.backpropagate(index, score)
+            continue
+          tree.add_virtual_loss(index)
+          pending[workers.submit(run_rollout, rollout_board)] = (index, position_key, tree.move_of(index))
+
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+          index, position_key, move = pending.pop(future)
+          tree.remove_virtual_loss(index)
+          result = future.result()
+          self._record_rollout(position_key, move, result)
+          tree.backpropagate(index, result)
+    finally:
+      if pending:
+        wait(pending)
+        tree.clear_virtual_loss()
+
+  def root_parallel_search(self, board: Board, num_simulations: int, c_puct: float) -> tuple[Move, int, float]:
+    """Search `board` with independent trees in the worker processes and return the merged best move.
+
+    Returns the move with the most visits over all workers, ties going to the lower
+    average value for the opponent like `get_best_child()`, with its total visits and
+    value.
+    """
+    MCTSSearcher.get_legal_moves(board)
+    distribution = ParallelWorkerManager.distribute_simulations(num_simulations, self.num_workers)
+    seeds = [int(seed.generate_state(1)[0]) for seed in self._seeds.spawn(len(distribution))]
+    tasks = [
+      (board, worker_simulations, c_puct, seed) for worker_simulations, seed in zip(distribution, seeds, strict=True)
+    ]
+    results = [
+      result for worker_results in self._parallel_workers().stream(run_root_search, tasks) for result in worker_results
+    ]
+    return MCTSSearcher.merge_root_results(results)
+
+  def _parallel_workers(self) -> ParallelWorkerManager:
+    if self.workers is None:
+      msg = "Parallel search needs more than one worker"
+      raise ValueError(msg)
+    return self.workers
+
+  def _create_workers(self) -> ParallelWorkerManager:
+    """Return the worker pool of the parallel strategy; it starts on first use.
+
+    Leaf-parallel workers are set up to play rollouts and root-parallel workers, always
+    processes, to run whole searches. Both evaluate with the weights in use now.
+    """
+    weights = get_evaluation_weights()
+    if self.parallel_strategy is ParallelStrategy.ROOT:
+      return ParallelWorkerManager(
+        self.num_workers,
+        mode=ParallelMode.PROCESS,
+        initializer=init_search_worker,
+        initargs=(self._worker_options(), weights),
+      )
+    return ParallelWorkerManager(
+      self.num_workers,
+      mode=self.parallel_mode,
+      initializer=init_rollout_worker,
+      initargs=(
+        self.profile,
+        self._use_incremental_eval,
+        self._verify_incremental_eval,
+        self.parallel_mode is ParallelMode.PROCESS,
+        weights,
+      ),
+    )
+
+  def _worker_options(self) -> dict[str, object]:
+    """Return the options of the serial searcher each root-parallel worker builds."""
+    return {
+      "use_transposition_table": False,
+      "key_mode": self.key_mode,
+      "use_staged_ordering": self.use_staged_ordering,
+      "use_incremental_eval": self._use_incremental_eval,
+      "verify_incremental_eval": self._verify_incremental_eval,
+      "use_batch_priors": self.use_batch_priors,
+      "profile": self.profile,
+    }
+
+  def shutdown(self) -> None:
+    """Stop the worker pool of parallel searches, if it was started."""
+    if self.workers is not None:
+      self.workers.shutdown()
+
   @staticmethod
-  def get_best_child(root: Node) -> tuple[Move, int, float]:
+  def get_best_child(root: Node | MCTSTree) -> tuple[Move, int, float]:
     """Select the best root child using visit count then value."""
+    if isinstance(root, MCTSTree):
+      return MCTSSearcher._best_tree_child(root)
     visited_children = [child for child in root.children if child.visits > 0]
     candidate_children = visited_children or root.children
     best_child = max(candidate_children, key=lambda child: (child.visits, -child.action_value))
@@ -183,6 +556,22 @@ class MCTSSearcher:
       raise ValueError(msg)
     return best_child.move, best_child.visits, best_child.value
 
+  @staticmethod
+  def _best_tree_child(tree: MCTSTree) -> tuple[Move, int, float]:
+    """Select the best root child of an array-backed tree, like `get_best_child()`."""
+    children = tree.children(ROOT)
+    visited_children = [child for child in children if tree.visits[child] > 0]
+    candidate_children = visited_children or children
+    if not candidate_children:
+      msg = "No best move found"
+      raise ValueError(msg)
+    best_child = max(candidate_children, key=lambda child: (int(tree.visits[child]), -tree.action_value(child)))
+    move = tree.move_of(best_child)
+    if move is None:
+      msg = "No best move found"
+      raise ValueError(msg)
+    return move, int(tree.visits[best_child]), float(tree.value_sum[best_child])
+
   @staticmethod
   def aggregate_results(results: list[tuple[str, int, float]]) -> dict[str, float]:
     """Aggregate worker results into average move values."""
@@ -193,3 +582,46 @@ class MCTSSearcher:
         move_visits[move_uci] = move_visits.get(move_uci, 0) + visits
         move_values[move_uci] = move_values.get(move_uci, 0.0) + values
     return {move_uci: move_values[move_uci] / move_visits[move_uci] for move_uci in move_visits}
+
+  @staticmethod
+  def merge_root_results(results: list[tuple[str, int, float]]) -> tuple[Move, int, float]:
+    """Merge the root statistics of several searches and select the best move like `get_best_child()`."""
+    averages = MCTSSearcher.aggregate_results(results)
+    if not averages:
+      msg = "No best move found"
+      raise ValueError(msg)
+    visits: dict[str, int] = dict.fromkeys(averages, 0)
+    for move_uci, move_visits, _ in results:
+      if move_uci in visits:
+        visits[move_uci] += move_visits
+    best_uci = max(sorted(averages), key=lambda move_uci: (visits[move_uci], -averages[move_uci]))
+    return Move.from_uci(best_uci), visits[best_uci], averages[best_uci] * visits[best_uci]
+
+
+def init_search_worker(options: dict[str, object], weights: EvaluationWeights) -> None:
+  """Build the serial searcher a root-parallel worker process keeps for every search it runs.
+
+  `weights` are the evaluation weights of the parent, which the worker does not inherit.
+  """
+  _use_weights(weights)
+  _ROLLOUT_WORKER.searcher = MCTSSearcher(**options)
+
+
+def run_root_search(task: tuple[Board, int, float, int]) -> list[tuple[str, int, float]]:
+  """Run a `(board, num_simulations, c_puct, seed)` search task in a root-parallel worker.
+
+  Returns the `(uci, visits, value)` of every visited root move.
+  """
+  board, num_simulations, c_puct, seed = task
+  searcher = _ROLLOUT_WORKER.searcher
+  if searcher is None:
+    msg = "Search worker was not initialized"
+    raise RuntimeError(msg)
+  searcher.rollout_rng = np.random.default_rng(seed)
+  tree = searcher.create_tree(board)
+  searcher.search(tree, num_simulations, c_puct)
+  return [
+    (tree.move_of(child).uci(), int(tree.visits[child]), float(tree.value_sum[child]))
+    for child in tree.children(ROOT)
+    if tree.visits[child] > 0
+  ]
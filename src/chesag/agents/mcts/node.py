@@ -7,13 +7,20 @@ from typing import TYPE_CHECKING
 
 import numpy as np
 
-from chesag.evaluation import leaf_evaluate, rollout_evaluate
+from chesag.evaluation import IncrementalEvaluator, batch_move_evaluate, leaf_evaluate, rollout_evaluate
 from chesag.move_priority import HeuristicMovePrioritizer
+from chesag.position_key import key_state, zobrist_delta
 
 if TYPE_CHECKING:
+  from collections.abc import Callable, Iterator
+
   from chess import Board, Move
 
 
+MAX_ROLLOUT_MOVES = 24
+DECISIVE_ROLLOUT_SCORE = 8.0
+
+
 class Node:
   """A node in the Monte Carlo Tree Search tree."""
 
@@ -27,8 +34,19 @@ class Node:
     board: Board | None = None,
     move_prioritizer: HeuristicMovePrioritizer | None = None,
     prior: float = 0.0,
+    zobrist_key: int | None = None,
+    staged_ordering: bool | None = None,
+    batch_priors: bool | None = None,
   ) -> None:
-    """Initialize a node from either a parent/move pair or a board copy."""
+    """Initialize a node from either a parent/move pair or a board copy.
+
+    Children of a node that carries a Zobrist key derive their own key incrementally.
+    With `staged_ordering`, moves are drawn from the lazy staged picker one expansion at a
+    time instead of being scored all at once; children inherit the setting by default.
+    With `batch_priors`, the priors of all children are computed in one vectorized call at
+    the first expansion instead of one evaluation per expanded child; it is inherited the
+    same way.
+    """
     if parent is None and board is None:
       msg = "Either parent or board must be provided"
       raise ValueError(msg)
@@ -36,6 +54,13 @@ class Node:
     self.move = move
     self.move_prioritizer = move_prioritizer or HeuristicMovePrioritizer()
     self.prior = prior
+    self.zobrist_key = zobrist_key
+    if staged_ordering is None:
+      staged_ordering = parent.staged_ordering if parent is not None else False
+    self.staged_ordering = staged_ordering
+    if batch_priors is None:
+      batch_priors = parent.batch_priors if parent is not None else False
+    self.batch_priors = batch_priors
 
     if board is not None:
       self.board = board.copy()
@@ -43,11 +68,15 @@ class Node:
       self.board = parent.board.copy()
       if move is not None:
         self.board.push(move)
+      if parent.zobrist_key is not None and zobrist_key is None:
+        self.zobrist_key = parent.zobrist_key ^ zobrist_delta(key_state(parent.board), key_state(self.board))
 
     self.children: list[Node] = []
     self.visits = 0
     self.value = 0.0
-    self._ordered_moves: list[Move] | None = None
+    self._pending_moves: Iterator[Move] | None = None
+    self._next_move: Move | None = None
+    self._priors: dict[Move, float] | None = None
 
   @property
   def depth(self) -> int:
@@ -64,13 +93,13 @@ class Node:
   @property
   def is_fully_expanded(self) -> bool:
     """Return whether all legal moves have been turned into children."""
-    return self._ordered_moves is not None and not self._ordered_moves
+    return self._pending_moves is not None and self._next_move is None
 
   def can_expand(self) -> bool:
     """Return whether the node may add another child under widening limits."""
-    if self._ordered_moves is None:
+    if self._pending_moves is None:
       return True
-    return bool(self._ordered_moves) and len(self.children) < self._expansion_limit()
+    return self._next_move is not None and len(self.children) < self._expansion_limit()
 
   def _expansion_limit(self) -> int:
     """Return the widening limit for this node based on current visits."""
@@ -91,20 +120,16 @@ class Node:
     """Expand exactly one ordered child and return it."""
     if self.is_terminal():
       return None
-    if self._ordered_moves is None:
-      legal_moves = list(self.board.legal_moves)
-      self._ordered_moves = self.move_prioritizer.order_moves(
-        self.board,
-        legal_moves,
-        depth=self.depth,
-        tt_move=tt_move,
-      )
-    if not self._ordered_moves:
+    if self._pending_moves is None:
+      self._pending_moves = self._order_moves(tt_move)
+      self._next_move = next(self._pending_moves, None)
+    if self._next_move is None:
       return None
     if len(self.children) >= self._expansion_limit():
       return None
 
-    move = self._ordered_moves.pop(0)
+    move = self._next_move
+    self._next_move = next(self._pending_moves, None)
     child = Node(
       parent=self,
       move=move,
@@ -114,6 +139,13 @@ class Node:
     self.children.append(child)
     return child
 
+  def _order_moves(self, tt_move: Move | None) -> Iterator[Move]:
+    """Return the iterator that expansion draws moves from, keeping one move of lookahead."""
+    if self.staged_ordering:
+      return self.move_prioritizer.pick_moves(self.board, depth=self.depth, tt_move=tt_move)
+    legal_moves = list(self.board.legal_moves)
+    return iter(self.move_prioritizer.order_moves(self.board, legal_moves, depth=self.depth, tt_move=tt_move))
+
   def select_child(self, c_puct: float) -> Node:
     """Select a child using one consistent PUCT formula."""
     if not self.children:
@@ -126,51 +158,94 @@ class Node:
       key=lambda child: -child.action_value + (c_puct * child.prior * parent_scale / (1 + child.visits)),
     )
 
-  def rollout(self) -> float:
-    """Play a light rollout from the node and return the score for the node side to move."""
-    rollout_board = self.board.copy()
+  def rollout(
+    self,
+    evaluator: IncrementalEvaluator | None = None,
+    leaf_evaluator: Callable[[Board, bool], float] | None = None,
+    rng: np.random.Generator | None = None,
+  ) -> float:
+    """Play a light rollout from the node and return the score for the node side to move.
+
+    With an `evaluator`, it is re-rooted at the node and carried along the rollout, so
+    candidate moves are weighted from incrementally updated material terms. A
+    `leaf_evaluator`, such as a compiled evaluation profile, scores the final position
+    instead of the leaf tier. Rollout moves are drawn with `rng`, or with the class-wide
+    `Node.rollout_rng` when it is not given; searchers always pass their own generator,
+    since a NumPy generator must not be shared between threads.
+    """
+    return self.play_rollout(self.board.copy(), evaluator, leaf_evaluator, rng)
+
+  @staticmethod
+  def play_rollout(
+    rollout_board: Board,
+    evaluator: IncrementalEvaluator | None = None,
+    leaf_evaluator: Callable[[Board, bool], float] | None = None,
+    rng: np.random.Generator | None = None,
+  ) -> float:
+    """Play a light rollout on `rollout_board` itself and return the score for its side to move.
+
+    The rollout moves are left pushed on the board; `rollout()` passes a copy.
+    """
+    if rng is None:
+      rng = Node.rollout_rng
     perspective_color = rollout_board.turn
-    max_rollout_moves = 24
-    decisive_rollout_score = 8.0
+    if evaluator is not None:
+      evaluator.reset(rollout_board)
 
-    for _ in range(max_rollout_moves):
+    for _ in range(MAX_ROLLOUT_MOVES):
       if rollout_board.is_game_over():
         break
       legal_moves = list(rollout_board.legal_moves)
       if not legal_moves:
         break
 
-      move = self._select_rollout_move(rollout_board, legal_moves)
-      rollout_board.push(move)
-
-      eval_score = rollout_evaluate(rollout_board, perspective_color)
-      if abs(eval_score) >= decisive_rollout_score:
+      move = Node._select_rollout_move(rollout_board, legal_moves, rng, evaluator)
+      if evaluator is None:
+        rollout_board.push(move)
+        eval_score = rollout_evaluate(rollout_board, perspective_color)
+      else:
+        evaluator.push(rollout_board, move)
+        eval_score = evaluator.rollout_evaluate(rollout_board, perspective_color)
+      if abs(eval_score) >= DECISIVE_ROLLOUT_SCORE:
         break
 
-    return leaf_evaluate(rollout_board, perspective_color)
+    if leaf_evaluator is not None:
+      return leaf_evaluator(rollout_board, perspective_color)
+    if evaluator is None:
+      return leaf_evaluate(rollout_board, perspective_color)
+    return evaluator.leaf_evaluate(rollout_board, perspective_color)
 
   @staticmethod
-  def _select_rollout_move(board: Board, legal_moves: list[Move]) -> Move:
+  def _select_rollout_move(
+    board: Board, legal_moves: list[Move], rng: np.random.Generator, evaluator: IncrementalEvaluator | None = None
+  ) -> Move:
     weights = []
     mover = board.turn
     for move in legal_moves:
-      board.push(move)
-      try:
-        weights.append(rollout_evaluate(board, mover))
-      finally:
-        board.pop()
+      if evaluator is None:
+        board.push(move)
+        try:
+          weights.append(rollout_evaluate(board, mover))
+        finally:
+          board.pop()
+      else:
+        evaluator.push(board, move)
+        try:
+          weights.append(evaluator.rollout_evaluate(board, mover))
+        finally:
+          evaluator.pop(board)
 
     move_weights = np.array(weights, dtype=float)
     if np.isinf(move_weights).any():
       return legal_moves[int(np.isinf(move_weights).argmax())]
     if np.allclose(move_weights, move_weights[0]):
-      random_index = int(Node.rollout_rng.integers(0, len(legal_moves)))
+      random_index = int(rng.integers(0, len(legal_moves)))
       return legal_moves[random_index]
     if move_weights.min() <= 0:
       move_weights = move_weights - move_weights.min() + 1e-6
 
     normalized_weights = move_weights / move_weights.sum()
-    chosen_index = int(Node.rollout_rng.choice(len(legal_moves), p=normalized_weights))
+    chosen_index = int(rng.choice(len(legal_moves), p=normalized_weights))
     return legal_moves[chosen_index]
 
   def backpropagate(self, result: float) -> None:
@@ -185,10 +260,28 @@ class Node:
 
   def _move_prior(self, move: Move) -> float:
     """Compute and store a cheap prior for the move at expansion time."""
-    mover = self.board.turn
-    self.board.push(move)
-    try:
-      raw_score = rollout_evaluate(self.board, mover)
-    finally:
-      self.board.pop()
-    return 1.0 / (1.0 + math.exp(-raw_score / 2.0))
+    if self.batch_priors:
+      if self._priors is None:
+        self._priors = batch_move_priors(self.board)
+      return self._priors[move]
+    return move_prior(self.board, move)
+
+
+def move_prior(board: Board, move: Move) -> float:
+  """Return the prior of one move: a logistic squash of the rollout evaluation after it."""
+  mover = board.turn
+  board.push(move)
+  try:
+    raw_score = rollout_evaluate(board, mover)
+  finally:
+    board.pop()
+  return 1.0 / (1.0 + math.exp(-raw_score / 2.0))
+
+
+def batch_move_priors(board: Board) -> dict[Move, float]:
+  """Return the priors of every legal move of a board, scored in one vectorized call."""
+  moves = list(board.legal_moves)
+  scores = batch_move_evaluate(board, moves)
+  return {
+    move: 1.0 / (1.0 + math.exp(-raw_score / 2.0)) for move, raw_score in zip(moves, scores.tolist(), strict=True)
+  }
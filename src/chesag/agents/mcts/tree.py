@@ -0,0 +1,426 @@
+"""Array-backed MCTS tree."""
+
+from __future__ import annotations
+
+import math
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING
+
+import chess
+import numpy as np
+
+from chesag.agents.mcts.node import batch_move_priors, move_prior
+from chesag.move_priority import HeuristicMovePrioritizer
+from chesag.position_key import key_state, zobrist_delta
+
+if TYPE_CHECKING:
+  from collections.abc import Iterator, Sequence
+
+  from chess import Board, Move
+
+ROOT = 0
+NO_NODE = -1
+INITIAL_CAPACITY = 1024
+_UNKNOWN = -1
+_UNEXPANDED = 0
+_EXPANDING = 1
+_EXPANDED = 2
+_NODE_ARRAYS = (
+  ("parent", np.int32, NO_NODE),
+  ("move", np.uint16, 0),
+  ("visits", np.int64, 0),
+  ("value_sum", np.float64, 0.0),
+  ("prior", np.float64, 0.0),
+  ("first_child", np.int32, NO_NODE),
+  ("last_child", np.int32, NO_NODE),
+  ("next_sibling", np.int32, NO_NODE),
+  ("num_children", np.int16, 0),
+  ("expansion", np.int8, _UNEXPANDED),
+  ("terminal", np.int8, _UNKNOWN),
+  ("key", np.uint64, 0),
+  ("in_flight", np.int32, 0),
+)
+
+
+def encode_move(move: Move) -> int:
+  """Pack a move into 15 bits: from square, to square and promotion piece type."""
+  return move.from_square | move.to_square << 6 | (move.promotion or 0) << 12
+
+
+def decode_move(code: int) -> Move:
+  """Unpack a move packed by `encode_move()`."""
+  return chess.Move(code & 0x3F, code >> 6 & 0x3F, code >> 12 or None)
+
+
+@dataclass(slots=True)
+class TreeReuseStats:
+  """Counters of the search trees carried over from one move to the next.
+
+  `reused_visits` adds up the root visits inherited by each reused search, which are
+  simulations that search did not have to run again.
+  """
+
+  searches: int = 0
+  reused_searches: int = 0
+  reused_nodes: int = 0
+  reused_visits: int = 0
+  released_nodes: int = 0
+  last_reused_visits: int = 0
+
+  def as_dict(self) -> dict[str, int]:
+    """Return a stable dict view of the counters."""
+    return asdict(self)
+
+
+@dataclass(slots=True)
+class _PendingMoves:
+  """Expansion state of a node that still has legal moves left to turn into children.
+
+  Fully ordered moves are kept packed in `codes`, with their batched priors in
+  `prior_values`, while the staged picker is kept as is in `picker`, with its batched
+  priors by move in `priors`. `next_move` looks one move ahead, like `Node`.
+  """
+
+  next_move: Move | None
+  codes: np.ndarray | None = None
+  cursor: int = 0
+  picker: Iterator[Move] | None = None
+  priors: dict[Move, float] | None = None
+  prior_values: np.ndarray | None = None
+
+  @classmethod
+  def ordered(cls, moves: list[Move]) -> _PendingMoves:
+    """Return the expansion state of a fully ordered move list."""
+    return cls(moves[0] if moves else None, codes=np.array([encode_move(move) for move in moves], dtype=np.uint16))
+
+  @classmethod
+  def staged(cls, picker: Iterator[Move]) -> _PendingMoves:
+    """Return the expansion state of a lazy move picker."""
+    return cls(next(picker, None), picker=picker)
+
+  def advance(self) -> None:
+    """Move the lookahead to the following move, or to `None` past the last one."""
+    if self.picker is not None:
+      self.next_move = next(self.picker, None)
+      return
+    self.cursor += 1
+    codes = self.codes
+    self.next_move = decode_move(int(codes[self.cursor])) if codes is not None and self.cursor < len(codes) else None
+
+
+class MCTSTree:
+  """Monte Carlo search tree kept in parallel NumPy arrays, walked with one board.
+
+  Node `i` is described by the `i`-th entry of each array: its `parent` index, the
+  `move` leading to it (packed by `encode_move()`), its `visits`, `value_sum` and
+  `prior`, and its children as a linked list through `first_child`, `last_child` and
+  `next_sibling`, in expansion order. The root is node `ROOT`. Arrays grow by doubling.
+
+  Instead of a board copy per node, the tree owns a single `board` that the searcher
+  pushes moves onto while descending and pops on the way back, so it always stands at
+  the node being worked on. Methods that read the position, such as `expand()` and
+  `is_terminal()`, expect the board to stand at the node they are given. The only
+  Python objects kept per node are the move iterators of nodes still being widened.
+
+  Expansion, selection and backup follow `Node` exactly: one ordered child per
+  expansion under the same widening limit, the same PUCT formula and ties, and the same
+  alternating-sign backup. With `zobrist_key`, each node keeps an incrementally derived
+  Zobrist key in `key`.
+
+  A parallel search marks the path of every simulation it has handed to a worker with
+  `add_virtual_loss()`. Until `remove_virtual_loss()` clears it, selection counts each
+  pending simulation through a node, `in_flight`, as a visit that lost `virtual_loss`
+  for the side choosing it, which steers the next selections to other paths.
+  """
+
+  def __init__(
+    self,
+    board: Board,
+    *,
+    move_prioritizer: HeuristicMovePrioritizer | None = None,
+    zobrist_key: int | None = None,
+    staged_ordering: bool = False,
+    batch_priors: bool = False,
+    capacity: int = INITIAL_CAPACITY,
+    virtual_loss: float = 1.0,
+  ) -> None:
+    """Create a tree holding only the root, which stands for `board`."""
+    self.board = board.copy()
+    self.move_prioritizer = move_prioritizer or HeuristicMovePrioritizer()
+    self.staged_ordering = staged_ordering
+    self.batch_priors = batch_priors
+    self.uses_keys = zobrist_key is not None
+    self.virtual_loss = virtual_loss
+    self.pending_simulations = 0
+    self.parent: np.ndarray
+    self.move: np.ndarray
+    self.visits: np.ndarray
+    self.value_sum: np.ndarray
+    self.prior: np.ndarray
+    self.first_child: np.ndarray
+    self.last_child: np.ndarray
+    self.next_sibling: np.ndarray
+    self.num_children: np.ndarray
+    self.expansion: np.ndarray
+    self.terminal: np.ndarray
+    self.key: np.ndarray
+    self.in_flight: np.ndarray
+    for name, dtype, fill in _NODE_ARRAYS:
+      setattr(self, name, np.full(max(1, capacity), fill, dtype=dtype))
+    if zobrist_key is not None:
+      self.key[ROOT] = zobrist_key
+    self._pending: dict[int, _PendingMoves] = {}
+    self._size = 1
+
+  def __len__(self) -> int:
+    """Return the number of nodes."""
+    return self._size
+
+  @property
+  def capacity(self) -> int:
+    """Return the number of nodes the arrays can hold before growing."""
+    return len(self.parent)
+
+  @property
+  def nbytes(self) -> int:
+    """Return the size of the node arrays in bytes."""
+    return sum(getattr(self, name).nbytes for name, _, _ in _NODE_ARRAYS)
+
+  def move_of(self, index: int) -> Move | None:
+    """Return the move leading to a node, or `None` for the root."""
+    return None if index == ROOT else decode_move(int(self.move[index]))
+
+  def children(self, index: int) -> list[int]:
+    """Return the children of a node in expansion order."""
+    children = []
+    child = int(self.first_child[index])
+    while child != NO_NODE:
+      children.append(child)
+      child = int(self.next_sibling[child])
+    return children
+
+  def action_value(self, index: int) -> float:
+    """Return the average value accumulated at a node."""
+    visits = int(self.visits[index])
+    return float(self.value_sum[index]) / visits if visits else 0.0
+
+  def descend(self, child: int) -> None:
+    """Push the move leading to `child` onto the board."""
+    self.board.push(decode_move(int(self.move[child])))
+
+  def ascend(self, plies: int) -> None:
+    """Pop `plies` moves off the board."""
+    for _ in range(plies):
+      self.board.pop()
+
+  def is_terminal(self, index: int) -> bool:
+    """Return whether a node is a finished game; the board must stand at the node."""
+    terminal = int(self.terminal[index])
+    if terminal == _UNKNOWN:
+      terminal = int(self.board.is_game_over())
+      self.terminal[index] = terminal
+    return bool(terminal)
+
+  def is_expanded(self, index: int) -> bool:
+    """Return whether a node has created any children."""
+    return bool(self.num_children[index])
+
+  def can_expand(self, index: int) -> bool:
+    """Return whether a node may add another child under widening limits."""
+    expansion = int(self.expansion[index])
+    if expansion == _UNEXPANDED:
+      return True
+    return expansion == _EXPANDING and int(self.num_children[index]) < self._expansion_limit(index)
+
+  def _expansion_limit(self, index: int) -> int:
+    """Return the widening limit of a node based on its current visits."""
+    return max(1, int(math.sqrt(int(self.visits[index]) + 1)))
+
+  def expand(self, index: int, *, depth: int = 0, tt_move: Move | None = None) -> int:
+    """Expand exactly one ordered child of a node and return its index, or `NO_NODE`.
+
+    The board must stand at the node; `depth` is its distance from the root, which
+    keys the killer moves of the staged picker.
+    """
+    if self.is_terminal(index):
+      return NO_NODE
+    pending = self._pending.get(index)
+    if int(self.expansion[index]) == _UNEXPANDED:
+      pending = self._order_moves(depth, tt_move)
+      self._pending[index] = pending
+      self.expansion[index] = _EXPANDING
+    if pending is None or pending.next_move is None:
+      return NO_NODE
+    if int(self.num_children[index]) >= self._expansion_limit(index):
+      return NO_NODE
+
+    move = pending.next_move
+    cursor = pending.cursor
+    pending.advance()
+    if pending.next_move is None:
+      self.expansion[index] = _EXPANDED
+      del self._pending[index]
+    return self._add_child(index, move, self._move_prior(pending, move, cursor))
+
+  def _order_moves(self, depth: int, tt_move: Move | None) -> _PendingMoves:
+    """Return the expansion state that expansion draws moves from."""
+    if self.staged_ordering:
+      return _PendingMoves.staged(self.move_prioritizer.pick_moves(self.board, depth=depth, tt_move=tt_move))
+    legal_moves = list(self.board.legal_moves)
+    return _PendingMoves.ordered(
+      self.move_prioritizer.order_moves(self.board, legal_moves, depth=depth, tt_move=tt_move)
+    )
+
+  def _move_prior(self, pending: _PendingMoves, move: Move, cursor: int) -> float:
+    """Return the prior of a move drawn at `cursor` of a node's expansion state."""
+    if not self.batch_priors:
+      return move_prior(self.board, move)
+    if pending.codes is None:
+      if pending.priors is None:
+        pending.priors = batch_move_priors(self.board)
+      return pending.priors[move]
+    if pending.prior_values is None:
+      priors = batch_move_priors(self.board)
+      pending.prior_values = np.array([priors[decode_move(int(code))] for code in pending.codes])
+    return float(pending.prior_values[cursor])
+
+  def _add_child(self, index: int, move: Move, prior: float) -> int:
+    """Append a child to a node and return its index."""
+    if self._size == self.capacity:
+      self._grow()
+    child = self._size
+    self._size += 1
+    self.parent[child] = index
+    self.move[child] = encode_move(move)
+    self.prior[child] = prior
+    if self.uses_keys:
+      before = key_state(self.board)
+      self.board.push(move)
+      try:
+        self.key[child] = int(self.key[index]) ^ zobrist_delta(before, key_state(self.board))
+      finally:
+        self.board.pop()
+    last = int(self.last_child[index])
+    if last == NO_NODE:
+      self.first_child[index] = child
+    else:
+      self.next_sibling[last] = child
+    self.last_child[index] = child
+    self.num_children[index] += 1
+    return child
+
+  def _grow(self) -> None:
+    """Double the capacity of every node array."""
+    capacity = self.capacity
+    for name, dtype, fill in _NODE_ARRAYS:
+      grown = np.full(capacity * 2, fill, dtype=dtype)
+      grown[:capacity] = getattr(self, name)
+      setattr(self, name, grown)
+
+  def moves_to(self, board: Board) -> list[Move] | None:
+    """Return the moves played from the root position to reach `board`, or `None` if it does not follow it."""
+    played = len(self.board.move_stack)
+    if len(board.move_stack) < played or board.move_stack[:played] != self.board.move_stack:
+      return None
+    if board.root() != self.board.root():
+      return None
+    return board.move_stack[played:]
+
+  def find(self, moves: Sequence[Move]) -> int:
+    """Return the node reached from the root by playing `moves`, or `NO_NODE` if it was never expanded."""
+    index = ROOT
+    for move in moves:
+      code = encode_move(move)
+      index = next((child for child in self.children(index) if int(self.move[child]) == code), NO_NODE)
+      if index == NO_NODE:
+        break
+    return index
+
+  def reroot(self, moves: Sequence[Move]) -> int:
+    """Make the node reached by `moves` the new root and release every node outside its subtree.
+
+    The kept nodes are renumbered from `ROOT` in breadth-first order and keep their
+    statistics, keys and pending moves; the arrays shrink to fit them and the moves are
+    pushed onto the board. Returns the new root's former index, or `NO_NODE`, leaving the
+    tree untouched, when that node was never expanded.
+    """
+    index = self.find(moves)
+    if index == NO_NODE:
+      return NO_NODE
+
+    kept = [index]
+    cursor = 0
+    while cursor < len(kept):
+      kept.extend(self.children(kept[cursor]))
+      cursor += 1
+    order = np.array(kept, dtype=np.int32)
+    renumbered = np.full(self._size, NO_NODE, dtype=np.int32)
+    renumbered[order] = np.arange(len(order), dtype=np.int32)
+    capacity = max(INITIAL_CAPACITY, 1 << (len(order) - 1).bit_length())
+    for name, dtype, fill in _NODE_ARRAYS:
+      compacted = np.full(capacity, fill, dtype=dtype)
+      compacted[: len(order)] = getattr(self, name)[order]
+      setattr(self, name, compacted)
+    # Links to released nodes, like the new root's parent and siblings, renumber to `NO_NODE`.
+    for links in (self.parent, self.first_child, self.last_child, self.next_sibling):
+      linked = links[: len(order)]
+      mask = linked != NO_NODE
+      linked[mask] = renumbered[linked[mask]]
+    self.move[ROOT] = 0
+    self._pending = {
+      int(renumbered[node]): pending for node, pending in self._pending.items() if renumbered[node] != NO_NODE
+    }
+    self._size = len(order)
+    for move in moves:
+      self.board.push(move)
+    return index
+
+  def select_child(self, index: int, c_puct: float) -> int:
+    """Select a child of a node with the PUCT formula of `Node.select_child()`."""
+    children = self.children(index)
+    if not children:
+      msg = "Cannot select child from node with no children"
+      raise ValueError(msg)
+    parent_visits = int(self.visits[index])
+    visits = self.visits[children]
+    value_sums = self.value_sum[children]
+    if self.pending_simulations:
+      parent_visits += int(self.in_flight[index])
+      in_flight = self.in_flight[children]
+      visits += in_flight
+      value_sums += in_flight * self.virtual_loss
+    parent_scale = math.sqrt(max(parent_visits, 1))
+    with np.errstate(invalid="ignore"):
+      action_values = np.divide(value_sums, visits, out=np.zeros(len(children)), where=visits > 0)
+      scores = (-action_values + c_puct * self.prior[children] * parent_scale / (1 + visits)).tolist()
+    # `max()` rather than `np.argmax()`, which would break ties with mate scores differently from `Node`.
+    return children[max(range(len(children)), key=scores.__getitem__)]
+
+  def add_virtual_loss(self, index: int) -> None:
+    """Count a simulation pending at a node on its whole path from the root."""
+    self.pending_simulations += 1
+    while index != NO_NODE:
+      self.in_flight[index] += 1
+      index = int(self.parent[index])
+
+  def remove_virtual_loss(self, index: int) -> None:
+    """Clear a pending simulation counted by `add_virtual_loss()`."""
+    self.pending_simulations -= 1
+    while index != NO_NODE:
+      self.in_flight[index] -= 1
+      index = int(self.parent[index])
+
+  def clear_virtual_loss(self) -> None:
+    """Clear every pending simulation, as when a parallel search is abandoned."""
+    self.pending_simulations = 0
+    self.in_flight[:] = 0
+
+  def backpropagate(self, index: int, result: float) -> None:
+    """Backpropagate a side-to-move score from a node to the root, alternating perspective."""
+    score = result
+    while index != NO_NODE:
+      self.visits[index] += 1
+      # Summed as Python floats, which turn opposite mate scores into NaN silently, like `Node`.
+      self.value_sum[index] = float(self.value_sum[index]) + score
+      score = -score
+      index = int(self.parent[index])
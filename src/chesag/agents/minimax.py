@@ -3,43 +3,112 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from enum import Enum, auto
+from enum import Enum
+from time import perf_counter
+from typing import TYPE_CHECKING
 
+import chess
 from chess import Board, Move
 
 from chesag.agents.base import BaseAgent
-from chesag.evaluation import leaf_evaluate
+from chesag.evaluation import (
+  PIECE_VALUES,
+  EvaluationStats,
+  IncrementalEvaluator,
+  leaf_evaluate,
+  order_evaluate,
+  record_evaluation_stats,
+  resolve_profile,
+  static_exchange_evaluation,
+)
 from chesag.logging import MORE_INFO, get_logger
-from chesag.move_priority import HeuristicMovePrioritizer
-from chesag.position_key import PositionKey, build_position_key
-
-logger = get_logger()
+from chesag.move_priority import HeuristicMovePrioritizer, MovePickStage
+from chesag.position_key import PositionKey, PositionKeyMode, ZobristKeyStack, build_position_key
+from chesag.transposition import (
+  ArrayTranspositionTable,
+  Bound,
+  ReplacementPolicy,
+  TranspositionTableStats,
+  TTEntry,
+)
 
+if TYPE_CHECKING:
+  from collections.abc import Callable, Iterable, Iterator
 
-class Bound(Enum):
-  """Bound type stored in the transposition table."""
+  from chesag.evaluation import EvaluationProfile
 
-  EXACT = auto()
-  LOWER = auto()
-  UPPER = auto()
+logger = get_logger()
+TIME_CHECK_INTERVAL = 128
+PVS_NULL_WINDOW = 1e-3
+ASPIRATION_WINDOW = 1.0
+ASPIRATION_GROWTH = 2.0
+NULL_MOVE_MIN_DEPTH = 3
+NULL_MOVE_REDUCTION = 2
+NULL_MOVE_DEEP_REDUCTION = 3
+NULL_MOVE_DEEP_DEPTH = 6
+# Margins in piece values are read from `PIECE_VALUES` at use time, so they follow `set_evaluation_weights()`.
+NULL_MOVE_VERIFY_PIECE = chess.ROOK
+LMR_MIN_DEPTH = 3
+LMR_MIN_MOVE_INDEX = 3
+LMR_DEEP_MOVE_INDEX = 6
+LMR_HISTORY_THRESHOLD = 64
+QUIESCENCE_MAX_DEPTH = 8
+# Quiescence scores are cut short by the depth cap and by delta and SEE pruning, so
+# they are stored below any depth a main-search probe accepts.
+QUIESCENCE_TT_DEPTH = -1
+DELTA_MARGIN_PAWNS = 2
+
+
+class StandPatEvaluation(Enum):
+  """Evaluation tier used for the quiescence stand-pat score."""
+
+  LEAF = "leaf"
+  ORDER = "order"
+
+
+class SearchAbortedError(Exception):
+  """Raised inside the search when the time or node budget runs out."""
 
 
 @dataclass(slots=True)
-class TTEntry:
-  """Transposition-table entry."""
+class IterationStats:
+  """Statistics of one completed iterative-deepening iteration."""
 
   depth: int
+  nodes: int
+  elapsed_seconds: float
   score: float
-  bound: Bound
-  best_move: Move | None
+  best_move: str
+
+  def as_dict(self) -> dict[str, int | float | str]:
+    """Return a stable dict view for logging and tests."""
+    return {
+      "depth": self.depth,
+      "nodes": self.nodes,
+      "elapsed_seconds": self.elapsed_seconds,
+      "score": self.score,
+      "best_move": self.best_move,
+    }
 
 
 @dataclass(slots=True)
 class DepthStats:
-  """Per-ply search statistics."""
+  """Per-ply search statistics.
+
+  `pruned` counts the moves a beta cutoff skipped when the node's moves were ordered up
+  front; the staged picker never generates most of them, so its nodes only add to
+  `cutoffs`, the number of beta cutoffs at the ply.
+  """
 
   searched: int = 0
   pruned: int = 0
+  cutoffs: int = 0
+
+  def record_cutoff(self, moves: Iterable[Move], index: int) -> None:
+    """Count a beta cutoff at the move `index` of `moves`, and the moves it skipped if they are known."""
+    self.cutoffs += 1
+    if isinstance(moves, list):
+      self.pruned += len(moves) - index - 1
 
 
 @dataclass(slots=True)
@@ -48,38 +117,184 @@ class SearchStats:
 
   tt_hits: int = 0
   tt_cutoffs: int = 0
+  tt_overwrites: int = 0
+  tt_collisions: int = 0
+  tt_fill_rate: float = 0.0
+  nodes: int = 0
+  pvs_researches: int = 0
+  aspiration_researches: int = 0
+  null_move_cutoffs: int = 0
+  null_move_verifications: int = 0
+  lmr_reductions: int = 0
+  lmr_researches: int = 0
+  qnodes: int = 0
+  qtt_hits: int = 0
+  see_prunes: int = 0
+  delta_prunes: int = 0
+  completed_depth: int = 0
+  aborted: bool = False
+  iterations: list[IterationStats] = field(default_factory=list)
   depths: dict[int, DepthStats] = field(default_factory=dict)
 
   def depth(self, ply: int) -> DepthStats:
     """Return per-ply stats, creating them on first use."""
     return self.depths.setdefault(ply, DepthStats())
 
-  def as_dict(self) -> dict[str, int | dict[str, dict[str, int]]]:
+  def as_dict(self) -> dict[str, object]:
     """Return a stable dict view for logging and tests."""
     return {
       "tt_hits": self.tt_hits,
       "tt_cutoffs": self.tt_cutoffs,
+      "tt_overwrites": self.tt_overwrites,
+      "tt_collisions": self.tt_collisions,
+      "tt_fill_rate": self.tt_fill_rate,
+      "nodes": self.nodes,
+      "pvs_researches": self.pvs_researches,
+      "aspiration_researches": self.aspiration_researches,
+      "null_move_cutoffs": self.null_move_cutoffs,
+      "null_move_verifications": self.null_move_verifications,
+      "lmr_reductions": self.lmr_reductions,
+      "lmr_researches": self.lmr_researches,
+      "qnodes": self.qnodes,
+      "qtt_hits": self.qtt_hits,
+      "see_prunes": self.see_prunes,
+      "delta_prunes": self.delta_prunes,
+      "completed_depth": self.completed_depth,
+      "aborted": self.aborted,
+      "iterations": [iteration.as_dict() for iteration in self.iterations],
       "depths": {
-        f"depth_{ply}": {"searched": stats.searched, "pruned": stats.pruned}
+        f"depth_{ply}": {"searched": stats.searched, "pruned": stats.pruned, "cutoffs": stats.cutoffs}
         for ply, stats in sorted(self.depths.items())
       },
     }
 
 
 class MinimaxAgent(BaseAgent):
-  """Depth-limited alpha-beta negamax agent with transposition reuse."""
+  """Iterative-deepening alpha-beta negamax agent with transposition reuse."""
+
+  def __init__(
+    self,
+    maxdepth: int = 4,
+    resign_threshold: float | None = None,
+    *,
+    key_mode: PositionKeyMode | None = None,
+    tt_size_mb: float | None = None,
+    tt_replacement: ReplacementPolicy = ReplacementPolicy.DEPTH_PREFERRED,
+    time_limit: float | None = None,
+    node_limit: int | None = None,
+    use_pvs: bool = True,
+    use_aspiration: bool = True,
+    aspiration_window: float = ASPIRATION_WINDOW,
+    use_null_move: bool = True,
+    use_lmr: bool = True,
+    use_staged_ordering: bool = False,
+    use_see_pruning: bool = True,
+    use_delta_pruning: bool = True,
+    max_quiescence_depth: int | None = QUIESCENCE_MAX_DEPTH,
+    stand_pat: StandPatEvaluation = StandPatEvaluation.LEAF,
+    use_incremental_eval: bool = True,
+    verify_incremental_eval: bool = False,
+    profile: EvaluationProfile | str | None = None,
+    evaluation_stats_sample_every: int | None = None,
+  ) -> None:
+    """Initialize the minimax agent.
+
+    `get_move` deepens one ply at a time up to `maxdepth`. With a `time_limit` (seconds
+    per move) or `node_limit`, the search stops once the budget is spent and returns
+    the best move of the last completed depth.
+
+    `use_pvs` searches every move after the first with a null window and re-searches
+    only on fail-high; `use_aspiration` starts each iteration from a window of
+    `aspiration_window` around the previous iteration's score.
+
+    `use_null_move` enables null-move pruning, verified by a reduced normal search when
+    the side to move has little non-pawn material. `use_lmr` reduces late quiet moves
+    that are neither killers nor strong history moves.
+
+    `use_staged_ordering` orders interior and quiescence moves with the lazy staged picker
+    instead of scoring every legal move up front; root moves are always fully ordered.
+    It is off by default because it drops the check and `order_evaluate` tie-breaks of
+    the full ordering, which can change the move chosen.
+    Quiescence probes and fills the transposition table with entries of depth
+    `QUIESCENCE_TT_DEPTH`, which main-search probes never accept. Besides
+    `use_see_pruning`, which skips captures that lose material by static exchange
+    evaluation, `use_delta_pruning` skips captures that cannot raise alpha even when the
+    captured piece is won for free. `max_quiescence_depth` caps quiescence plies past the
+    horizon (`None` for no cap), and `stand_pat=StandPatEvaluation.ORDER` stands pat on
+    the cheaper ordering evaluation instead of the full leaf evaluation.
+
+    `use_incremental_eval` carries an `IncrementalEvaluator` along the search line of
+    `get_move`, so stand-pat scores reuse material and pawn-structure terms updated per move instead of
+    recounting them; `verify_incremental_eval` checks every such score against a full
+    recomputation, which is only meant for debugging.
+
+    `profile` replaces the leaf evaluation, used for stand-pat scores and the resign
+    check, with a compiled `EvaluationProfile`, given as is, by built-in name or by the
+    path of a profile file (see `resolve_profile()`). The compiled evaluator keeps its own
+    tables instead of riding on the incremental evaluator, and move ordering is unchanged.
+
+    With `evaluation_stats_sample_every`, every `get_move` counts its evaluation calls
+    into the agent's own `evaluation_stats`, timing one call in that many per tier.
+
+    `key_mode=PositionKeyMode.ZOBRIST` replaces the FEN-based tuple keys with 64-bit
+    Zobrist keys that are updated incrementally as the search pushes and pops moves.
+
+    By default the transposition table is an unbounded dict. Passing `tt_size_mb`
+    switches to a fixed-size `ArrayTranspositionTable` within that memory budget,
+    which requires (and defaults to) Zobrist keys.
+    """
+    if key_mode is None:
+      key_mode = PositionKeyMode.TUPLE if tt_size_mb is None else PositionKeyMode.ZOBRIST
+    if tt_size_mb is not None and key_mode is not PositionKeyMode.ZOBRIST:
+      msg = "The array transposition table requires Zobrist position keys"
+      raise ValueError(msg)
 
-  def __init__(self, maxdepth: int = 4, resign_threshold: float | None = None) -> None:
-    """Initialize the minimax agent."""
     self.move_prioritizer = HeuristicMovePrioritizer()
     self.maxdepth = maxdepth
     self.resign_threshold = min(resign_threshold, -resign_threshold) if resign_threshold is not None else float("-inf")
+    self.key_mode = key_mode
+    self.time_limit = time_limit
+    self.node_limit = node_limit
+    self.use_pvs = use_pvs
+    self.use_aspiration = use_aspiration
+    self.aspiration_window = aspiration_window
+    self.use_null_move = use_null_move
+    self.use_lmr = use_lmr
+    self.use_staged_ordering = use_staged_ordering
+    self.use_see_pruning = use_see_pruning
+    self.use_delta_pruning = use_delta_pruning
+    self.max_quiescence_depth = max_quiescence_depth
+    self.stand_pat = stand_pat
     self.last_search = SearchStats()
-    self._tt: dict[PositionKey, TTEntry] = {}
+    self._tt: dict[PositionKey, TTEntry] | ArrayTranspositionTable = (
+      {} if tt_size_mb is None else ArrayTranspositionTable(tt_size_mb, policy=tt_replacement)
+    )
+    self._keys = ZobristKeyStack() if key_mode is PositionKeyMode.ZOBRIST else None
+    self.use_incremental_eval = use_incremental_eval
+    self.verify_incremental_eval = verify_incremental_eval
+    self._evaluator: IncrementalEvaluator | None = None
+    self.profile = resolve_profile(profile) if profile is not None else None
+    self._leaf_evaluator: Callable[[Board, bool], float] | None = (
+      self.profile.compile() if self.profile is not None else None
+    )
+    self._deadline: float | None = None
+    self._node_budget: int | None = None
+    self.evaluation_stats_sample_every = evaluation_stats_sample_every
+    self.evaluation_stats = EvaluationStats() if evaluation_stats_sample_every is not None else None
 
   def get_move(self, board: Board) -> Move:
     """Return the best move for the current side."""
-    if leaf_evaluate(board, board.turn) < self.resign_threshold:
+    if self.evaluation_stats_sample_every is None:
+      return self._best_move(board)
+    with record_evaluation_stats(self.evaluation_stats, sample_every=self.evaluation_stats_sample_every):
+      return self._best_move(board)
+
+  def _best_move(self, board: Board) -> Move:
+    """Search `board` and return the best move for the side to move."""
+    leaf_score = (
+      leaf_evaluate(board, board.turn) if self._leaf_evaluator is None else self._leaf_evaluator(board, board.turn)
+    )
+    if leaf_score < self.resign_threshold:
       return Move.null()
 
     legal_moves = list(board.generate_legal_moves())
@@ -88,45 +303,224 @@ class MinimaxAgent(BaseAgent):
       return legal_moves[0]
 
     self.last_search = SearchStats()
-    root_key = build_position_key(board)
+    table_stats_before = self.transposition_table_stats
+    if isinstance(self._tt, ArrayTranspositionTable):
+      self._tt.new_search()
+    if self._keys is not None:
+      self._keys.reset(board)
+    root_key = self._position_key(board)
     tt_entry = self._tt.get(root_key)
     tt_move = tt_entry.best_move if tt_entry is not None else None
     ordered_moves = self.move_prioritizer.order_moves(board, legal_moves, depth=0, tt_move=tt_move)
+    best_move = ordered_moves[0]
+    best_value = float("-inf")
 
+    start = perf_counter()
+    self._deadline = start + self.time_limit if self.time_limit is not None else None
+    self._node_budget = self.node_limit
+    if self.use_incremental_eval:
+      self._evaluator = IncrementalEvaluator(board, verify=self.verify_incremental_eval, keys=self._keys)
+    try:
+      for depth in range(1, self.maxdepth + 1):
+        iteration_start = perf_counter()
+        iteration_nodes = self.last_search.nodes
+        best_value, best_move = self._aspiration_search(board, ordered_moves, depth, best_value)
+        self._tt[root_key] = TTEntry(depth=depth, score=best_value, bound=Bound.EXACT, best_move=best_move)
+        iteration_seconds = perf_counter() - iteration_start
+        self.last_search.completed_depth = depth
+        self.last_search.iterations.append(
+          IterationStats(
+            depth=depth,
+            nodes=self.last_search.nodes - iteration_nodes,
+            elapsed_seconds=iteration_seconds,
+            score=best_value,
+            best_move=best_move.uci(),
+          )
+        )
+        ordered_moves = self._promote_root_move(ordered_moves, root_key, best_move)
+        if abs(best_value) == float("inf"):
+          break
+        if self._deadline is not None and perf_counter() + iteration_seconds > self._deadline:
+          break
+    except SearchAbortedError:
+      self.last_search.aborted = True
+      logger.debug("Search aborted after completing depth %d", self.last_search.completed_depth)
+    finally:
+      self._deadline = None
+      self._node_budget = None
+      self._evaluator = None
+
+    self._record_table_stats(table_stats_before)
+    logger.log(MORE_INFO, "Search results: %s", self.last_search.as_dict())
+    return best_move
+
+  def _aspiration_search(
+    self,
+    board: Board,
+    ordered_moves: list[Move],
+    depth: int,
+    previous_score: float,
+  ) -> tuple[float, Move]:
+    """Search the root inside a window around the previous score, widening it on failure."""
+    if not self.use_aspiration or depth == 1 or abs(previous_score) == float("inf"):
+      return self._search_root(board, ordered_moves, depth, float("-inf"), float("inf"))
+
+    window = self.aspiration_window
+    alpha = previous_score - window
+    beta = previous_score + window
+    while True:
+      value, move = self._search_root(board, ordered_moves, depth, alpha, beta)
+      if value <= alpha and alpha > float("-inf"):
+        alpha = value - window if abs(value) != float("inf") else float("-inf")
+      elif value >= beta and beta < float("inf"):
+        beta = value + window if abs(value) != float("inf") else float("inf")
+      else:
+        return value, move
+      self.last_search.aspiration_researches += 1
+      window *= ASPIRATION_GROWTH
+
+  def _search_root(
+    self,
+    board: Board,
+    ordered_moves: list[Move],
+    depth: int,
+    alpha: float,
+    beta: float,
+  ) -> tuple[float, Move]:
+    """Search root moves to a fixed depth and return the fail-soft best score and move."""
     best_move = ordered_moves[0]
     best_value = float("-inf")
-    alpha = float("-inf")
-    beta = float("inf")
 
-    for move in ordered_moves:
-      board.push(move)
-      try:
-        value = -self._negamax(board, self.maxdepth - 1, -beta, -alpha, ply=1)
-      finally:
-        board.pop()
+    for index, move in enumerate(ordered_moves):
+      value = self._search_child(board, move, depth - 1, alpha, beta, ply=1, full_window=index == 0)
       self.last_search.depth(0).searched += 1
       if value > best_value:
         best_value = value
         best_move = move
       alpha = max(alpha, best_value)
-
-    self._tt[root_key] = TTEntry(depth=self.maxdepth, score=best_value, bound=Bound.EXACT, best_move=best_move)
-    logger.log(MORE_INFO, "Search results: %s", self.last_search.as_dict())
-    return best_move
+      if alpha >= beta:
+        break
+    return best_value, best_move
+
+  def _search_child(
+    self,
+    board: Board,
+    move: Move,
+    depth: int,
+    alpha: float,
+    beta: float,
+    *,
+    ply: int,
+    full_window: bool,
+    reduction: int = 0,
+  ) -> float:
+    """Search one child from the parent's perspective, using LMR and PVS for non-first moves."""
+    self._push(board, move)
+    try:
+      if reduction and alpha > float("-inf") and not board.is_check():
+        self.last_search.lmr_reductions += 1
+        value = -self._negamax(board, depth - reduction, -alpha - PVS_NULL_WINDOW, -alpha, ply=ply)
+        if value <= alpha:
+          return value
+        self.last_search.lmr_researches += 1
+      if full_window or not self.use_pvs or alpha == float("-inf"):
+        return -self._negamax(board, depth, -beta, -alpha, ply=ply)
+      value = -self._negamax(board, depth, -alpha - PVS_NULL_WINDOW, -alpha, ply=ply)
+      if alpha < value < beta:
+        self.last_search.pvs_researches += 1
+        value = -self._negamax(board, depth, -beta, -alpha, ply=ply)
+      return value
+    finally:
+      self._pop(board)
+
+  def _promote_root_move(self, ordered_moves: list[Move], root_key: PositionKey, best_move: Move) -> list[Move]:
+    """Move the TT best move of the last iteration to the front of the root ordering."""
+    tt_entry = self._tt.get(root_key)
+    pv_move = tt_entry.best_move if tt_entry is not None and tt_entry.best_move is not None else best_move
+    if pv_move not in ordered_moves:
+      return ordered_moves
+    return [pv_move, *(move for move in ordered_moves if move != pv_move)]
+
+  def _count_node(self) -> None:
+    """Count one expanded node and abort the search when a budget is exhausted.
+
+    Interior nodes are counted once expanded and horizon nodes once quiescence starts;
+    transposition cutoffs are not counted.
+    """
+    self.last_search.nodes += 1
+    if self._node_budget is not None and self.last_search.nodes > self._node_budget:
+      raise SearchAbortedError
+    if (
+      self._deadline is not None
+      and self.last_search.nodes % TIME_CHECK_INTERVAL == 0
+      and perf_counter() >= self._deadline
+    ):
+      raise SearchAbortedError
 
   @property
   def transposition_table_size(self) -> int:
     """Return the current transposition-table size."""
     return len(self._tt)
 
-  def _negamax(self, board: Board, depth: int, alpha: float, beta: float, *, ply: int) -> float:
+  @property
+  def transposition_table_stats(self) -> TranspositionTableStats | None:
+    """Return fill rate, collision and overwrite counters of a fixed-size table."""
+    if isinstance(self._tt, ArrayTranspositionTable):
+      return self._tt.stats
+    return None
+
+  def _record_table_stats(self, before: TranspositionTableStats | None) -> None:
+    """Copy the table counters accumulated during the last search into `last_search`."""
+    after = self.transposition_table_stats
+    if before is None or after is None:
+      return
+    self.last_search.tt_overwrites = after.overwrites - before.overwrites
+    self.last_search.tt_collisions = after.collisions - before.collisions
+    self.last_search.tt_fill_rate = after.fill_rate
+
+  def _position_key(self, board: Board) -> PositionKey:
+    """Return the transposition key of the current search board."""
+    if self._keys is not None:
+      return self._keys.current
+    return build_position_key(board)
+
+  def _push(self, board: Board, move: Move) -> None:
+    """Push a search move, keeping incremental keys and evaluation terms in sync."""
+    if self._evaluator is not None:
+      self._evaluator.apply(board, move)
+    if self._keys is not None:
+      self._keys.push(board, move)
+    else:
+      board.push(move)
+
+  def _pop(self, board: Board) -> None:
+    """Pop a search move, keeping incremental keys and evaluation terms in sync."""
+    if self._keys is not None:
+      self._keys.pop(board)
+    else:
+      board.pop()
+    if self._evaluator is not None:
+      self._evaluator.undo()
+
+  def _negamax(
+    self,
+    board: Board,
+    depth: int,
+    alpha: float,
+    beta: float,
+    *,
+    ply: int,
+    allow_null: bool = True,
+  ) -> float:
     """Return the score from the current side-to-move perspective."""
-    key = build_position_key(board)
+    key = self._position_key(board)
     original_alpha = alpha
     original_beta = beta
     tt_move = None
 
     entry = self._tt.get(key)
+    if entry is not None:
+      tt_move = entry.best_move
     if entry is not None and entry.depth >= depth:
       self.last_search.tt_hits += 1
       if entry.bound is Bound.EXACT:
@@ -138,66 +532,229 @@ class MinimaxAgent(BaseAgent):
       if alpha >= beta:
         self.last_search.tt_cutoffs += 1
         return entry.score
-      tt_move = entry.best_move
 
     if depth <= 0 or board.is_game_over():
       return self.quiescence(board, alpha, beta, ply=ply)
 
-    depth_stats = self.last_search.depth(ply)
-    legal_moves = list(board.generate_legal_moves())
-    ordered_moves = self.move_prioritizer.order_moves(board, legal_moves, depth=ply, tt_move=tt_move)
+    self._count_node()
+    in_check = board.is_check()
+    if allow_null and not in_check:
+      null_value = self._null_move_search(board, depth, beta, ply=ply)
+      if null_value is not None:
+        return null_value
 
+    depth_stats = self.last_search.depth(ply)
     best_value = float("-inf")
-    best_move = ordered_moves[0]
-    for index, move in enumerate(ordered_moves):
-      board.push(move)
-      try:
-        child_value = -self._negamax(board, depth - 1, -beta, -alpha, ply=ply + 1)
-      finally:
-        board.pop()
-
+    best_move = None
+    moves = self._ordered_moves(board, ply=ply, tt_move=tt_move)
+    for index, move in enumerate(moves):
+      reduction = 0 if in_check else self._late_move_reduction(board, move, index, depth, ply=ply)
+      child_value = self._search_child(
+        board,
+        move,
+        depth - 1,
+        alpha,
+        beta,
+        ply=ply + 1,
+        full_window=index == 0,
+        reduction=reduction,
+      )
       depth_stats.searched += 1
-      if child_value > best_value:
+      if child_value > best_value or best_move is None:
         best_value = child_value
         best_move = move
       alpha = max(alpha, best_value)
       if alpha >= beta:
-        depth_stats.pruned += len(ordered_moves) - index - 1
-        if not board.is_capture(move) and move.promotion is None:
-          self.move_prioritizer.record_killer(move, ply)
-        self.move_prioritizer.record_history(move, depth)
+        depth_stats.record_cutoff(moves, index)
+        self._record_cutoff(board, move, depth, ply=ply)
         break
 
-    if best_value <= original_alpha:
+    self._store(key, depth, best_value, best_move, original_alpha, original_beta)
+    return best_value
+
+  def _ordered_moves(
+    self,
+    board: Board,
+    *,
+    ply: int,
+    tt_move: Move | None = None,
+    noisy_only: bool = False,
+  ) -> Iterable[Move]:
+    """Return the moves of a node in search order, lazily when staged ordering is on."""
+    if self.use_staged_ordering:
+      return self.move_prioritizer.pick_moves(board, depth=ply, tt_move=tt_move, noisy_only=noisy_only)
+    if noisy_only:
+      moves = [move for move in board.legal_moves if board.is_capture(move) or move.promotion is not None]
+      if tt_move not in moves:
+        tt_move = None
+    else:
+      moves = list(board.generate_legal_moves())
+    return self.move_prioritizer.order_moves(board, moves, depth=ply, tt_move=tt_move)
+
+  def _quiescence_moves(self, board: Board, *, ply: int, tt_move: Move | None = None) -> Iterator[tuple[Move, bool]]:
+    """Yield noisy moves in search order, flagged when SEE pruning should skip them."""
+    if self.use_staged_ordering:
+      for stage, move in self.move_prioritizer.pick_staged_moves(board, depth=ply, tt_move=tt_move, noisy_only=True):
+        yield move, self.use_see_pruning and stage is MovePickStage.BAD_CAPTURES
+      return
+    for move in self._ordered_moves(board, ply=ply, tt_move=tt_move, noisy_only=True):
+      yield move, self.use_see_pruning and static_exchange_evaluation(board, move) < 0
+
+  def _null_move_search(self, board: Board, depth: int, beta: float, *, ply: int) -> float | None:
+    """Return a fail-high score if passing the move still beats beta, else `None`.
+
+    Positions where the side to move has only king and pawns are skipped because
+    zugzwang is common there. With little non-pawn material left, a null-move cutoff
+    is only accepted after a reduced normal search confirms it.
+    """
+    if not self.use_null_move or depth < NULL_MOVE_MIN_DEPTH or beta == float("inf"):
+      return None
+    non_pawn_material = _non_pawn_material(board, board.turn)
+    if non_pawn_material == 0:
+      return None
+
+    reduction = NULL_MOVE_REDUCTION if depth < NULL_MOVE_DEEP_DEPTH else NULL_MOVE_DEEP_REDUCTION
+    self._push(board, Move.null())
+    try:
+      value = -self._negamax(
+        board, depth - 1 - reduction, -beta, -beta + PVS_NULL_WINDOW, ply=ply + 1, allow_null=False
+      )
+    finally:
+      self._pop(board)
+    if value < beta:
+      return None
+
+    if non_pawn_material <= PIECE_VALUES[NULL_MOVE_VERIFY_PIECE]:
+      self.last_search.null_move_verifications += 1
+      value = self._negamax(board, depth - reduction, beta - PVS_NULL_WINDOW, beta, ply=ply, allow_null=False)
+      if value < beta:
+        return None
+    self.last_search.null_move_cutoffs += 1
+    return value if value != float("inf") else beta
+
+  def _late_move_reduction(self, board: Board, move: Move, index: int, depth: int, *, ply: int) -> int:
+    """Return how many plies to reduce a late quiet move by."""
+    if (
+      not self.use_lmr
+      or depth < LMR_MIN_DEPTH
+      or index < LMR_MIN_MOVE_INDEX
+      or move.promotion is not None
+      or board.is_capture(move)
+      or self.move_prioritizer.is_killer(move, ply)
+    ):
+      return 0
+    reduction = 2 if index >= LMR_DEEP_MOVE_INDEX and depth > LMR_MIN_DEPTH else 1
+    if self.move_prioritizer.history_score(move) >= LMR_HISTORY_THRESHOLD:
+      reduction -= 1
+    return reduction
+
+  def _record_cutoff(self, board: Board, move: Move, depth: int, *, ply: int) -> None:
+    """Feed a beta-cutoff move back into the killer and history tables."""
+    if not board.is_capture(move) and move.promotion is None:
+      self.move_prioritizer.record_killer(move, ply)
+    self.move_prioritizer.record_history(move, depth)
+
+  def _store(
+    self,
+    key: PositionKey,
+    depth: int,
+    score: float,
+    best_move: Move | None,
+    original_alpha: float,
+    original_beta: float,
+  ) -> None:
+    """Store a search result with the bound implied by the original window."""
+    if score <= original_alpha:
       bound = Bound.UPPER
-    elif best_value >= original_beta:
+    elif score >= original_beta:
       bound = Bound.LOWER
     else:
       bound = Bound.EXACT
-    self._tt[key] = TTEntry(depth=depth, score=best_value, bound=bound, best_move=best_move)
-    return best_value
+    self._tt[key] = TTEntry(depth=depth, score=score, bound=bound, best_move=best_move)
 
-  def quiescence(self, board: Board, alpha: float, beta: float, *, ply: int = 0) -> float:
-    """Extend the search across tactical moves to reduce horizon effects."""
-    stand_pat = leaf_evaluate(board, board.turn)
-    if stand_pat >= beta:
-      return stand_pat
-    alpha = max(alpha, stand_pat)
+  def quiescence(self, board: Board, alpha: float, beta: float, *, ply: int = 0, qdepth: int = 0) -> float:
+    """Extend the search across tactical moves to reduce horizon effects.
 
-    noisy_moves = [move for move in board.legal_moves if board.is_capture(move) or move.promotion is not None]
-    ordered_moves = self.move_prioritizer.order_moves(board, noisy_moves, depth=ply)
+    `qdepth` counts plies since the main search horizon; at `max_quiescence_depth` the
+    stand-pat score is returned without searching further captures.
+    """
+    self._count_node()
+    self.last_search.qnodes += 1
+    key = self._position_key(board)
+    entry = self._tt.get(key)
+    tt_move = None
+    if entry is not None:
+      tt_move = entry.best_move
+      if (
+        entry.bound is Bound.EXACT
+        or (entry.bound is Bound.LOWER and entry.score >= beta)
+        or (entry.bound is Bound.UPPER and entry.score <= alpha)
+      ):
+        self.last_search.qtt_hits += 1
+        return entry.score
 
-    for move in ordered_moves:
-      board.push(move)
+    stand_pat = self._stand_pat(board)
+    if stand_pat >= beta or (self.max_quiescence_depth is not None and qdepth >= self.max_quiescence_depth):
+      return stand_pat
+    original_alpha = alpha
+    alpha = max(alpha, stand_pat)
+    best_move = None
+
+    for move, losing in self._quiescence_moves(board, ply=ply, tt_move=tt_move):
+      if losing:
+        self.last_search.see_prunes += 1
+        continue
+      if self.use_delta_pruning and move.promotion is None:
+        optimistic = stand_pat + _captured_value(board, move) + DELTA_MARGIN_PAWNS * PIECE_VALUES[chess.PAWN]
+        if optimistic <= alpha:
+          self.last_search.delta_prunes += 1
+          continue
+      self._push(board, move)
       try:
-        score = -self.quiescence(board, -beta, -alpha, ply=ply + 1)
+        score = -self.quiescence(board, -beta, -alpha, ply=ply + 1, qdepth=qdepth + 1)
       finally:
-        board.pop()
+        self._pop(board)
       if score >= beta:
-        return score
-      alpha = max(alpha, score)
+        alpha = score
+        best_move = move
+        break
+      if score > alpha:
+        alpha = score
+        best_move = move
+
+    if entry is None or entry.depth <= QUIESCENCE_TT_DEPTH:
+      self._store(key, QUIESCENCE_TT_DEPTH, alpha, best_move, original_alpha, beta)
     return alpha
 
+  def _stand_pat(self, board: Board) -> float:
+    """Return the static score quiescence may fall back on for the side to move."""
+    evaluator = self._evaluator
+    if self.stand_pat is StandPatEvaluation.ORDER:
+      return order_evaluate(board, board.turn) if evaluator is None else evaluator.order_evaluate(board, board.turn)
+    if self._leaf_evaluator is not None:
+      return self._leaf_evaluator(board, board.turn)
+    return leaf_evaluate(board, board.turn) if evaluator is None else evaluator.leaf_evaluate(board, board.turn)
+
   def __str__(self) -> str:
     """Return a compact agent description."""
-    return f"MinimaxAgent({self.move_prioritizer}, maxdepth={self.maxdepth})"
+    profile = f", profile={self.profile.name!r}" if self.profile is not None else ""
+    return f"MinimaxAgent({self.move_prioritizer}, maxdepth={self.maxdepth}{profile})"
+
+
+def _non_pawn_material(board: Board, color: bool) -> float:
+  """Return the material value of knights, bishops, rooks and queens of one side."""
+  own = board.occupied_co[color]
+  return (
+    PIECE_VALUES[chess.KNIGHT] * (board.knights & own).bit_count()
+    + PIECE_VALUES[chess.BISHOP] * (board.bishops & own).bit_count()
+    + PIECE_VALUES[chess.ROOK] * (board.rooks & own).bit_count()
+    + PIECE_VALUES[chess.QUEEN] * (board.queens & own).bit_count()
+  )
+
+
+def _captured_value(board: Board, move: Move) -> float:
+  """Return the value of the piece a move captures, or zero for a quiet move."""
+  if board.is_en_passant(move):
+    return PIECE_VALUES[chess.PAWN]
+  victim_type = board.piece_type_at(move.to_square)
+  return PIECE_VALUES[victim_type] if victim_type is not None else 0.0
@@ -49,3 +49,4 @@ class StockfishAgent(BaseAgent):
     """Close the underlying Stockfish process."""
     with contextlib.suppress(chess.engine.EngineTerminatedError):
       self.engine.quit()
+    super().close()
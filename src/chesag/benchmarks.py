@@ -3,24 +3,39 @@
 from __future__ import annotations
 
 import argparse
+import gc
 import json
+import os
 import time
+import tracemalloc
 from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING
 
 import chess
 
 from chesag.agents import AGENTS
 from chesag.agents.mcts.agent import MCTSAgent
-from chesag.agents.minimax import MinimaxAgent
+from chesag.agents.mcts.algorithm import MCTSSearcher
+from chesag.agents.mcts.tree import MCTSTree
+from chesag.agents.minimax import QUIESCENCE_MAX_DEPTH, MinimaxAgent, StandPatEvaluation
 from chesag.evaluation import (
-  get_evaluation_stats,
+  batch_evaluate,
+  evaluate,
   leaf_evaluate,
   order_evaluate,
-  reset_evaluation_stats,
+  record_evaluation_stats,
   rollout_evaluate,
+  stack_bitboards,
 )
 from chesag.game import Game
 from chesag.game.statistics import GameStatistics
+from chesag.parallel import ParallelMode, default_parallel_mode, gil_enabled
+from chesag.position_key import PositionKeyMode
+
+if TYPE_CHECKING:
+  from chesag.agents.mcts.node import Node
+
+TACTICAL_FEN = "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1"
 
 
 @dataclass(slots=True)
@@ -36,26 +51,92 @@ class BenchmarkResult:
 def benchmark_evaluation_tiers(fen: str, iterations: int = 200) -> BenchmarkResult:
   """Benchmark all evaluation tiers on a fixed position."""
   board = chess.Board(fen)
-  reset_evaluation_stats()
   start = time.perf_counter()
 
-  for _ in range(iterations):
-    leaf_evaluate(board, board.turn)
-    order_evaluate(board, board.turn)
-    rollout_evaluate(board, board.turn)
+  with record_evaluation_stats() as stats:
+    for _ in range(iterations):
+      leaf_evaluate(board, board.turn)
+      order_evaluate(board, board.turn)
+      rollout_evaluate(board, board.turn)
 
   elapsed = time.perf_counter() - start
   return BenchmarkResult(
     name="evaluation_tiers",
     repetitions=iterations,
     elapsed_seconds=elapsed,
-    details={"fen": fen, "stats": asdict(get_evaluation_stats())},
+    details={"fen": fen, "stats": asdict(stats)},
   )
 
 
-def benchmark_minimax(fen: str, *, depth: int = 3, repetitions: int = 2) -> BenchmarkResult:
+def benchmark_batch_evaluation(fen: str = TACTICAL_FEN, *, positions: int = 1000) -> BenchmarkResult:
+  """Compare scalar and batched evaluation of the placement terms over many positions.
+
+  The positions are the children of `fen`, repeated until `positions` boards are built.
+  """
+  board = chess.Board(fen)
+  children = []
+  for move in board.legal_moves:
+    child = board.copy(stack=False)
+    child.push(move)
+    children.append(child)
+  boards = [children[index % len(children)] for index in range(positions)]
+  start = time.perf_counter()
+
+  scalar_start = time.perf_counter()
+  for child in boards:
+    evaluate(child, chess.WHITE, use_king_safety=False, use_mobility=False)
+  scalar_seconds = time.perf_counter() - scalar_start
+
+  batch_start = time.perf_counter()
+  batch_evaluate(stack_bitboards(boards), chess.WHITE)
+  batch_seconds = time.perf_counter() - batch_start
+
+  elapsed = time.perf_counter() - start
+  return BenchmarkResult(
+    name="batch_evaluation",
+    repetitions=positions,
+    elapsed_seconds=elapsed,
+    details={
+      "fen": fen,
+      "scalar_seconds": scalar_seconds,
+      "batch_seconds": batch_seconds,
+      "speedup": scalar_seconds / batch_seconds if batch_seconds else 0.0,
+    },
+  )
+
+
+def benchmark_minimax(
+  fen: str,
+  *,
+  depth: int = 3,
+  repetitions: int = 2,
+  key_mode: PositionKeyMode | None = None,
+  tt_size_mb: float | None = None,
+  time_limit: float | None = None,
+  node_limit: int | None = None,
+  use_pvs: bool = True,
+  use_aspiration: bool = True,
+  use_null_move: bool = True,
+  use_lmr: bool = True,
+  use_staged_ordering: bool = True,
+  max_quiescence_depth: int | None = QUIESCENCE_MAX_DEPTH,
+  stand_pat: StandPatEvaluation = StandPatEvaluation.LEAF,
+) -> BenchmarkResult:
   """Benchmark minimax search and expose node/TT stats."""
-  agent = MinimaxAgent(maxdepth=depth)
+  agent = MinimaxAgent(
+    maxdepth=depth,
+    key_mode=key_mode,
+    tt_size_mb=tt_size_mb,
+    time_limit=time_limit,
+    node_limit=node_limit,
+    use_pvs=use_pvs,
+    use_aspiration=use_aspiration,
+    use_null_move=use_null_move,
+    use_lmr=use_lmr,
+    use_staged_ordering=use_staged_ordering,
+    max_quiescence_depth=max_quiescence_depth,
+    stand_pat=stand_pat,
+  )
   board = chess.Board(fen)
   runs: list[dict[str, object]] = []
   start = time.perf_counter()
@@ -63,10 +144,12 @@ def benchmark_minimax(fen: str, *, depth: int = 3, repetitions: int = 2) -> Benc
   for _ in range(repetitions):
     run_board = board.copy()
     move = agent.get_move(run_board)
+    table_stats = agent.transposition_table_stats
     runs.append({
       "move": move.uci(),
       "search": agent.last_search.as_dict(),
       "tt_size": agent.transposition_table_size,
+      "tt_stats": table_stats.as_dict() if table_stats is not None else None,
     })
 
   elapsed = time.perf_counter() - start
@@ -74,7 +157,54 @@ def benchmark_minimax(fen: str, *, depth: int = 3, repetitions: int = 2) -> Benc
     name="minimax",
     repetitions=repetitions,
     elapsed_seconds=elapsed,
-    details={"fen": fen, "depth": depth, "runs": runs},
+    details={
+      "fen": fen,
+      "depth": depth,
+      "key_mode": agent.key_mode.value,
+      "tt_size_mb": tt_size_mb,
+      "time_limit": time_limit,
+      "node_limit": node_limit,
+      "use_pvs": use_pvs,
+      "use_aspiration": use_aspiration,
+      "use_null_move": use_null_move,
+      "use_lmr": use_lmr,
+      "use_staged_ordering": use_staged_ordering,
+      "max_quiescence_depth": max_quiescence_depth,
+      "stand_pat": stand_pat.value,
+      "runs": runs,
+    },
+  )
+
+
+def benchmark_quiescence(fen: str = TACTICAL_FEN, *, depth: int = 2) -> BenchmarkResult:
+  """Compare minimax node counts with and without SEE pruning of losing captures in quiescence."""
+  runs: dict[str, dict[str, object]] = {}
+  nodes: dict[str, int] = {}
+  start = time.perf_counter()
+
+  for label, use_see_pruning in (("without_see", False), ("with_see", True)):
+    agent = MinimaxAgent(maxdepth=depth, use_see_pruning=use_see_pruning)
+    run_start = time.perf_counter()
+    move = agent.get_move(chess.Board(fen))
+    nodes[label] = agent.last_search.nodes
+    runs[label] = {
+      "move": move.uci(),
+      "nodes": agent.last_search.nodes,
+      "see_prunes": agent.last_search.see_prunes,
+      "elapsed_seconds": time.perf_counter() - run_start,
+    }
+
+  elapsed = time.perf_counter() - start
+  return BenchmarkResult(
+    name="quiescence",
+    repetitions=1,
+    elapsed_seconds=elapsed,
+    details={
+      "fen": fen,
+      "depth": depth,
+      "node_reduction": 1 - nodes["with_see"] / nodes["without_see"] if nodes["without_see"] else 0.0,
+      "runs": runs,
+    },
   )
 
 
@@ -117,6 +247,118 @@ def benchmark_mcts(
   )
 
 
+def benchmark_mcts_memory(fen: str = chess.STARTING_FEN, *, num_simulations: int = 1000) -> BenchmarkResult:
+  """Compare the memory held by a `Node` tree and an `MCTSTree` after the same search.
+
+  Each tree is searched without a transposition table while `tracemalloc` traces the
+  allocations. The memory released by dropping the tree once the search returns is what
+  the tree itself holds, apart from the evaluation caches it filled; it is reported
+  along with the node count. Tracing slows the searches down several times, so their
+  timings are not reported.
+  """
+  board = chess.Board(fen)
+  runs: dict[str, dict[str, float]] = {}
+  start = time.perf_counter()
+
+  for name, use_array_tree in (("node", False), ("array", True)):
+    searcher = MCTSSearcher(use_transposition_table=False, use_array_tree=use_array_tree)
+    tracemalloc.start()
+    try:
+      root = searcher.create_root(board)
+      searcher.search(root, num_simulations, 1.4)
+      nodes = len(root) if isinstance(root, MCTSTree) else _count_nodes(root)
+      held_bytes, peak_bytes = tracemalloc.get_traced_memory()
+      del root
+      gc.collect()
+      tree_bytes = held_bytes - tracemalloc.get_traced_memory()[0]
+    finally:
+      tracemalloc.stop()
+    runs[name] = {
+      "nodes": nodes,
+      "tree_bytes": tree_bytes,
+      "bytes_per_node": tree_bytes / nodes,
+      "peak_bytes": peak_bytes,
+    }
+
+  elapsed = time.perf_counter() - start
+  node_bytes = runs["node"]["tree_bytes"]
+  array_bytes = runs["array"]["tree_bytes"]
+  return BenchmarkResult(
+    name="mcts_memory",
+    repetitions=1,
+    elapsed_seconds=elapsed,
+    details={
+      "fen": fen,
+      "num_simulations": num_simulations,
+      "runs": runs,
+      "memory_ratio": node_bytes / array_bytes if array_bytes else 0.0,
+    },
+  )
+
+
+def benchmark_mcts_parallel(
+  fen: str = chess.STARTING_FEN,
+  *,
+  num_simulations: int = 200,
+  worker_counts: tuple[int, ...] = (1, 2, 4),
+  parallel_mode: ParallelMode | None = None,
+) -> BenchmarkResult:
+  """Report MCTS simulations per second against the number of parallel rollout workers.
+
+  Each worker count searches a fresh array tree without a transposition table. The
+  worker pool is started by a short warm-up search first, so its startup is not timed.
+  """
+  board = chess.Board(fen)
+  parallel_mode = parallel_mode or default_parallel_mode()
+  runs: dict[str, dict[str, float]] = {}
+  start = time.perf_counter()
+
+  for num_workers in worker_counts:
+    searcher = MCTSSearcher(use_transposition_table=False, num_workers=num_workers, parallel_mode=parallel_mode)
+    try:
+      searcher.search(searcher.create_tree(board), num_workers, 1.4)
+      tree = searcher.create_tree(board)
+      search_start = time.perf_counter()
+      searcher.search(tree, num_simulations, 1.4)
+      search_seconds = time.perf_counter() - search_start
+    finally:
+      searcher.shutdown()
+    runs[str(num_workers)] = {
+      "elapsed_seconds": search_seconds,
+      "simulations_per_second": num_simulations / search_seconds,
+      "nodes": len(tree),
+    }
+
+  elapsed = time.perf_counter() - start
+  baseline = runs[str(worker_counts[0])]["simulations_per_second"]
+  for run in runs.values():
+    run["speedup"] = run["simulations_per_second"] / baseline
+  return BenchmarkResult(
+    name="mcts_parallel",
+    repetitions=1,
+    elapsed_seconds=elapsed,
+    details={
+      "fen": fen,
+      "num_simulations": num_simulations,
+      "parallel_mode": parallel_mode.value,
+      "gil_enabled": gil_enabled(),
+      "cpu_count": os.cpu_count(),
+      "runs": runs,
+    },
+  )
+
+
+def _count_nodes(root: Node) -> int:
+  """Count the nodes of a `Node` tree."""
+  count = 0
+  stack = [root]
+  while stack:
+    node = stack.pop()
+    count += 1
+    stack.extend(node.children)
+  return count
+
+
 def run_smoke_match(
   player1: str,
   player2: str,
@@ -185,10 +427,31 @@ def main() -> None:
   eval_parser.add_argument("--fen", default=chess.STARTING_FEN)
   eval_parser.add_argument("--iterations", type=int, default=200)
 
+  batch_parser = subparsers.add_parser("batch", help="Compare scalar and batched evaluation")
+  batch_parser.add_argument("--fen", default=TACTICAL_FEN)
+  batch_parser.add_argument("--positions", type=int, default=1000)
+
   minimax_parser = subparsers.add_parser("minimax", help="Benchmark minimax search")
   minimax_parser.add_argument("--fen", default=chess.STARTING_FEN)
   minimax_parser.add_argument("--depth", type=int, default=3)
   minimax_parser.add_argument("--repetitions", type=int, default=2)
+  minimax_parser.add_argument("--key-mode", choices=[mode.value for mode in PositionKeyMode], default=None)
+  minimax_parser.add_argument("--tt-mb", type=float, default=None)
+  minimax_parser.add_argument("--time-limit", type=float, default=None, help="Seconds per move")
+  minimax_parser.add_argument("--node-limit", type=int, default=None)
+  minimax_parser.add_argument("--no-pvs", action="store_true")
+  minimax_parser.add_argument("--no-aspiration", action="store_true")
+  minimax_parser.add_argument("--no-null-move", action="store_true")
+  minimax_parser.add_argument("--no-lmr", action="store_true")
+  minimax_parser.add_argument("--no-staged-ordering", action="store_true")
+  minimax_parser.add_argument("--max-qdepth", type=int, default=QUIESCENCE_MAX_DEPTH)
+  minimax_parser.add_argument(
+    "--stand-pat", choices=[mode.value for mode in StandPatEvaluation], default=StandPatEvaluation.LEAF.value
+  )
+
+  quiescence_parser = subparsers.add_parser("quiescence", help="Benchmark SEE pruning in quiescence")
+  quiescence_parser.add_argument("--fen", default=TACTICAL_FEN)
+  quiescence_parser.add_argument("--depth", type=int, default=2)
 
   mcts_parser = subparsers.add_parser("mcts", help="Benchmark MCTS search")
   mcts_parser.add_argument("--fen", default=chess.STARTING_FEN)
@@ -196,6 +459,16 @@ def main() -> None:
   mcts_parser.add_argument("--repetitions", type=int, default=2)
   mcts_parser.add_argument("--no-tt", action="store_true")
 
+  mcts_memory_parser = subparsers.add_parser("mcts-memory", help="Compare Node and array-backed MCTS tree memory")
+  mcts_memory_parser.add_argument("--fen", default=chess.STARTING_FEN)
+  mcts_memory_parser.add_argument("--simulations", type=int, default=1000)
+
+  mcts_parallel_parser = subparsers.add_parser("mcts-parallel", help="Report MCTS simulations/second by worker count")
+  mcts_parallel_parser.add_argument("--fen", default=chess.STARTING_FEN)
+  mcts_parallel_parser.add_argument("--simulations", type=int, default=200)
+  mcts_parallel_parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+  mcts_parallel_parser.add_argument("--mode", choices=[mode.value for mode in ParallelMode], default=None)
+
   smoke_parser = subparsers.add_parser("smoke", help="Run a small agent-vs-agent smoke match")
   smoke_parser.add_argument("player1", choices=sorted(AGENTS))
   smoke_parser.add_argument("player2", choices=sorted(AGENTS))
@@ -206,8 +479,29 @@ def main() -> None:
   if args.command == "eval":
     result = benchmark_evaluation_tiers(args.fen, iterations=args.iterations)
     print(json.dumps(asdict(result), indent=2))
+  elif args.command == "batch":
+    result = benchmark_batch_evaluation(args.fen, positions=args.positions)
+    print(json.dumps(asdict(result), indent=2))
   elif args.command == "minimax":
-    result = benchmark_minimax(args.fen, depth=args.depth, repetitions=args.repetitions)
+    result = benchmark_minimax(
+      args.fen,
+      depth=args.depth,
+      repetitions=args.repetitions,
+      key_mode=PositionKeyMode(args.key_mode) if args.key_mode else None,
+      tt_size_mb=args.tt_mb,
+      time_limit=args.time_limit,
+      node_limit=args.node_limit,
+      use_pvs=not args.no_pvs,
+      use_aspiration=not args.no_aspiration,
+      use_null_move=not args.no_null_move,
+      use_lmr=not args.no_lmr,
+      use_staged_ordering=not args.no_staged_ordering,
+      max_quiescence_depth=args.max_qdepth,
+      stand_pat=StandPatEvaluation(args.stand_pat),
+    )
+    print(json.dumps(asdict(result), indent=2))
+  elif args.command == "quiescence":
+    result = benchmark_quiescence(args.fen, depth=args.depth)
     print(json.dumps(asdict(result), indent=2))
   elif args.command == "mcts":
     result = benchmark_mcts(
@@ -217,6 +511,17 @@ def main() -> None:
       use_transposition_table=not args.no_tt,
     )
     print(json.dumps(asdict(result), indent=2))
+  elif args.command == "mcts-memory":
+    result = benchmark_mcts_memory(args.fen, num_simulations=args.simulations)
+    print(json.dumps(asdict(result), indent=2))
+  elif args.command == "mcts-parallel":
+    result = benchmark_mcts_parallel(
+      args.fen,
+      num_simulations=args.simulations,
+      worker_counts=tuple(args.workers),
+      parallel_mode=ParallelMode(args.mode) if args.mode else None,
+    )
+    print(json.dumps(asdict(result), indent=2))
   else:
     print(json.dumps(run_smoke_match(args.player1, args.player2, games=args.games, fen=args.fen), indent=2))
 
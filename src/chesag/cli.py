@@ -1,17 +1,38 @@
 """Package CLI entrypoint."""
 
 from argparse import ArgumentDefaultsHelpFormatter, ArgumentParser
+from pathlib import Path
 
 from tqdm import tqdm
 
-from chesag.agents import AGENTS
+from chesag.agents import AGENTS, BaseAgent
+from chesag.evaluation import load_weights, save_weights, set_evaluation_weights
 from chesag.game import Game
 from chesag.game.statistics import GameStatistics
 from chesag.logging import get_logger
 from chesag.replay import replay
+from chesag.tuning import (
+  DEFAULT_EPOCHS,
+  DEFAULT_LEARNING_RATE,
+  DEFAULT_SKIP_PLIES,
+  TuningData,
+  extract_features,
+  tune_weights,
+)
 from chesag.viewer import ChessViewer
 
 logger = get_logger()
+PROFILE_AGENTS = ("minimax", "mcts")
+
+
+def build_agent(name: str, profile: str | None = None) -> BaseAgent:
+  """Create a registered agent, scoring leaves with an evaluation profile when one is given."""
+  if profile is None:
+    return AGENTS[name]()
+  if name not in PROFILE_AGENTS:
+    msg = f"Agent {name!r} does not take an evaluation profile"
+    raise ValueError(msg)
+  return AGENTS[name](profile=profile)
 
 
 def play(
@@ -22,10 +43,17 @@ def play(
   verbose: bool = True,
   visual: bool = False,
   move_delay: float = 1.0,
+  *,
+  profile1: str | None = None,
+  profile2: str | None = None,
 ) -> None:
-  """Play one or more games between two agents with color swapping for fairness."""
-  player1_agent = AGENTS[player1]()
-  player2_agent = AGENTS[player2]() if player2 else player1_agent
+  """Play one or more games between two agents with color swapping for fairness.
+
+  `profile1` and `profile2` are evaluation profiles (built-in names or profile files) for
+  the two players, so one agent can be played against itself under two evaluations.
+  """
+  player1_agent = build_agent(player1, profile1)
+  player2_agent = build_agent(player2 or player1, profile2) if player2 or profile2 else player1_agent
 
   viewer = None
   if visual:
@@ -104,6 +132,43 @@ def play(
     logger.info(report)
 
 
+def tune(
+  pgn_files: list[str],
+  output: str,
+  *,
+  features_file: str | None = None,
+  epochs: int = DEFAULT_EPOCHS,
+  learning_rate: float = DEFAULT_LEARNING_RATE,
+  batch_size: int | None = None,
+  skip_plies: int = DEFAULT_SKIP_PLIES,
+  sample_every: int = 1,
+  max_positions: int | None = None,
+) -> None:
+  """Fit the evaluation weights to the outcomes of PGN games and write them to a weights file.
+
+  With `features_file`, an existing feature matrix is reused instead of parsing the PGN
+  files, and a freshly extracted one is saved there for the next run.
+  """
+  if features_file is not None and Path(features_file).exists():
+    data = TuningData.load(features_file)
+    logger.info("Loaded %d positions from %s", len(data), features_file)
+  else:
+    data = extract_features(pgn_files, skip_plies=skip_plies, sample_every=sample_every, max_positions=max_positions)
+    logger.info("Extracted %d positions from %d PGN file(s)", len(data), len(pgn_files))
+    if features_file is not None:
+      data.save(features_file)
+
+  result = tune_weights(data, epochs=epochs, learning_rate=learning_rate, batch_size=batch_size)
+  save_weights(result.weights, output)
+  logger.info(
+    "Loss %.5f -> %.5f at scale %.3f; weights written to %s",
+    result.initial_loss,
+    result.final_loss,
+    result.scale,
+    output,
+  )
+
+
 def train(args: object) -> None:
   """Train the model (not implemented yet)."""
   msg = "Training is not implemented yet"
@@ -129,6 +194,25 @@ def main() -> None:
   play_parser.add_argument("--visual", action="store_true", help="Show visual chess board during games")
   play_parser.add_argument("--move-delay", type=float, default=0.0, help="Delay between moves in visual mode (seconds)")
 
+  play_parser.add_argument("--weights", type=str, default=None, help="Evaluation weights file written by `tune`")
+  play_parser.add_argument(
+    "--profile", type=str, default=None, help="Evaluation profile of player 1: a built-in name or a profile file"
+  )
+  play_parser.add_argument(
+    "--profile2", type=str, default=None, help="Evaluation profile of player 2, who defaults to player 1's agent"
+  )
+
+  tune_parser = subparsers.add_parser("tune", help="Tune evaluation weights on the outcomes of PGN games")
+  tune_parser.add_argument("pgn_files", type=str, nargs="*", help="PGN files to extract positions from")
+  tune_parser.add_argument("--output", type=str, default="weights.json", help="Weights file to write")
+  tune_parser.add_argument("--features", type=str, default=None, help="Feature matrix (.npz) to reuse or create")
+  tune_parser.add_argument("--epochs", type=int, default=DEFAULT_EPOCHS, help="Gradient-descent epochs")
+  tune_parser.add_argument("--learning-rate", type=float, default=DEFAULT_LEARNING_RATE, help="Adam step size")
+  tune_parser.add_argument("--batch-size", type=int, default=None, help="Mini-batch size (default: full batch)")
+  tune_parser.add_argument("--skip-plies", type=int, default=DEFAULT_SKIP_PLIES, help="Opening plies to skip")
+  tune_parser.add_argument("--sample-every", type=int, default=1, help="Keep one position every N plies")
+  tune_parser.add_argument("--max-positions", type=int, default=None, help="Stop extracting after N positions")
+
   replay_parser = subparsers.add_parser("replay", help="Replay game(s) from a PGN file")
   replay_parser.add_argument("pgn_file", type=str, help="PGN file to replay")
   replay_parser.add_argument(
@@ -140,6 +224,8 @@ def main() -> None:
   if args.command == "train":
     train(args)
   elif args.command == "play":
+    if args.weights:
+      set_evaluation_weights(load_weights(args.weights))
     play(
       args.player1,
       args.player2,
@@ -148,6 +234,20 @@ def main() -> None:
       verbose=not args.quiet,
       visual=args.visual,
       move_delay=args.move_delay,
+      profile1=args.profile,
+      profile2=args.profile2,
+    )
+  elif args.command == "tune":
+    tune(
+      args.pgn_files,
+      args.output,
+      features_file=args.features,
+      epochs=args.epochs,
+      learning_rate=args.learning_rate,
+      batch_size=args.batch_size,
+      skip_plies=args.skip_plies,
+      sample_every=args.sample_every,
+      max_positions=args.max_positions,
     )
   elif args.command == "replay":
     replay(pgn_file=args.pgn_file, move_delay=args.move_delay)
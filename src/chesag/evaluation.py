@@ -1,12 +1,41 @@
 """Board evaluation helpers."""
 
-from collections.abc import Iterable
-from dataclasses import asdict, dataclass, field
+import json
+import math
+import os
+import threading
+import tomllib
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field, replace
+from enum import Enum
+from functools import lru_cache, partial
+from pathlib import Path
 from time import perf_counter_ns
+from typing import Self
 
 import chess
+import numpy as np
+import numpy.typing as npt
 from chess import Board, Move
 
+from chesag.piece_square import (
+  CENTIPAWNS_PER_PAWN,
+  MAX_PHASE,
+  PHASE_BY_ROW,
+  PHASE_WEIGHTS,
+  PST_EG,
+  PST_MG,
+  piece_row,
+  piece_square_terms,
+  square_terms,
+  tapered_score,
+)
+from chesag.position_key import ZobristKeyStack, zobrist_hash
+
+type MaterialSignature = tuple[int, ...]
+type PieceSquareSums = tuple[int, int]
+
 PIECE_VALUES = {
   chess.PAWN: 1.0,
   chess.KNIGHT: 3.2,
@@ -25,6 +54,13 @@ PAWN_SHIELD_PENALTY = -0.1
 MOVE_CAPTURE_WEIGHT = 0.1
 MOVE_CHECK_BONUS = 0.3
 MOBILITY_WEIGHT = 0.05
+WEIGHTS_ENV_VAR = "CHESAG_WEIGHTS"
+PAWN_HASH_SIZE = 1 << 14
+LEAF_CACHE_SIZE = 1 << 16
+ORDER_CACHE_SIZE = 1 << 16
+MATERIAL_TABLE_SIZE = 4096
+_KING_AND_MINOR_COUNT = 2
+_BATCH_NDIM = 2
 BISHOP_PAIR_COUNT = 2
 BOARD_EDGE_INDEX = 7
 
@@ -47,15 +83,172 @@ EXTENDED_CENTER = {
   chess.F5,
   chess.F6,
 }
+EXTENDED_CENTER_MASK = sum(chess.BB_SQUARES[square] for square in EXTENDED_CENTER)
+
+
+class MobilityMode(Enum):
+  """How `evaluate` counts mobility."""
+
+  LEGAL = "legal"
+  PSEUDO_LEGAL = "pseudo_legal"
+
+
+def _passed_pawn_masks(color: bool) -> tuple[int, ...]:
+  """Return, per square, the squares ahead of a pawn on its own and adjacent files."""
+  masks = []
+  for square in chess.SQUARES:
+    file = chess.square_file(square)
+    rank = chess.square_rank(square)
+    ahead = range(rank + 1, 8) if color == chess.WHITE else range(rank)
+    mask = 0
+    for next_rank in ahead:
+      for next_file in (file - 1, file, file + 1):
+        if 0 <= next_file <= BOARD_EDGE_INDEX:
+          mask |= chess.BB_SQUARES[chess.square(next_file, next_rank)]
+    masks.append(mask)
+  return tuple(masks)
+
+
+def _king_file_masks() -> tuple[tuple[int, ...], ...]:
+  """Return, per king square, the file masks of the king's file and its neighbours."""
+  return tuple(
+    tuple(
+      chess.BB_FILES[file_idx]
+      for file_idx in (chess.square_file(square) - 1, chess.square_file(square), chess.square_file(square) + 1)
+      if 0 <= file_idx <= BOARD_EDGE_INDEX
+    )
+    for square in chess.SQUARES
+  )
+
+
+def _king_shield_masks(color: bool) -> tuple[tuple[int, ...], ...]:
+  """Return, per king square, the single-square masks of the three shield squares in front."""
+  masks = []
+  for square in chess.SQUARES:
+    king_file = chess.square_file(square)
+    target_rank = chess.square_rank(square) + (1 if color == chess.WHITE else -1)
+    shield: tuple[int, ...] = ()
+    if 0 <= target_rank <= BOARD_EDGE_INDEX:
+      shield = tuple(
+        chess.BB_SQUARES[chess.square(file_idx, target_rank)]
+        for file_idx in (king_file - 1, king_file, king_file + 1)
+        if 0 <= file_idx <= BOARD_EDGE_INDEX
+      )
+    masks.append(shield)
+  return tuple(masks)
+
+
+# Indexed by color first (`chess.BLACK` is 0, `chess.WHITE` is 1), then by square.
+PASSED_PAWN_MASKS = (_passed_pawn_masks(chess.BLACK), _passed_pawn_masks(chess.WHITE))
+KING_FILE_MASKS = _king_file_masks()
+KING_SHIELD_MASKS = (_king_shield_masks(chess.BLACK), _king_shield_masks(chess.WHITE))
+
+# Columns of a batch bitboard row: white pawn to king, then black pawn to king, as in a material signature.
+BATCH_COLUMNS = tuple((color, piece_type) for color in (chess.WHITE, chess.BLACK) for piece_type in chess.PIECE_TYPES)
+_ROOK_DIRECTIONS = ((0, 1), (0, -1), (1, 0), (-1, 0))
+_BISHOP_DIRECTIONS = ((1, 1), (1, -1), (-1, 1), (-1, -1))
+
+
+def _rays(directions: tuple[tuple[int, int], ...]) -> tuple[tuple[tuple[int, ...], ...], ...]:
+  """Return, per square, the squares along each direction, nearest first."""
+  rays = []
+  for square in chess.SQUARES:
+    square_rays = []
+    for file_step, rank_step in directions:
+      file, rank = chess.square_file(square) + file_step, chess.square_rank(square) + rank_step
+      ray = []
+      while 0 <= file <= BOARD_EDGE_INDEX and 0 <= rank <= BOARD_EDGE_INDEX:
+        ray.append(chess.square(file, rank))
+        file, rank = file + file_step, rank + rank_step
+      if ray:
+        square_rays.append(tuple(ray))
+    rays.append(tuple(square_rays))
+  return tuple(rays)
+
+
+ROOK_RAYS = _rays(_ROOK_DIRECTIONS)
+BISHOP_RAYS = _rays(_BISHOP_DIRECTIONS)
+
+
+@dataclass(slots=True)
+class EvaluationWeights:
+  """Weights of the linear evaluation terms, in pawns.
+
+  The defaults are the hand-set module constants. `chesag.tuning` fits new values from
+  game records, and `set_evaluation_weights()` or the `CHESAG_WEIGHTS` environment
+  variable put them in use.
+  """
+
+  pawn: float = PIECE_VALUES[chess.PAWN]
+  knight: float = PIECE_VALUES[chess.KNIGHT]
+  bishop: float = PIECE_VALUES[chess.BISHOP]
+  rook: float = PIECE_VALUES[chess.ROOK]
+  queen: float = PIECE_VALUES[chess.QUEEN]
+  bishop_pair: float = BISHOP_PAIR_BONUS
+  passed_pawn: float = PASSED_PAWN_BONUS
+  center_control: float = CENTER_CONTROL_WEIGHT
+  king_castle: float = KING_CASTLE_BONUS
+  king_open_file: float = KING_OPEN_FILE_PENALTY
+  pawn_shield: float = PAWN_SHIELD_PENALTY
+  mobility: float = MOBILITY_WEIGHT
+
+  @property
+  def piece_values(self) -> dict[chess.PieceType, float]:
+    """Return the material values keyed like `PIECE_VALUES`."""
+    return {
+      chess.PAWN: self.pawn,
+      chess.KNIGHT: self.knight,
+      chess.BISHOP: self.bishop,
+      chess.ROOK: self.rook,
+      chess.QUEEN: self.queen,
+      chess.KING: 0.0,
+    }
+
+  def as_dict(self) -> dict[str, float]:
+    """Return a stable dict view of the weights."""
+    return asdict(self)
+
+  @classmethod
+  def from_dict(cls, values: Mapping[str, float]) -> Self:
+    """Build weights from a mapping, keeping the defaults for missing names."""
+    unknown = set(values) - set(cls.__dataclass_fields__)
+    if unknown:
+      msg = f"Unknown evaluation weights: {', '.join(sorted(unknown))}"
+      raise ValueError(msg)
+    return cls(**{name: float(value) for name, value in values.items()})
 
 
 @dataclass(slots=True)
 class EvaluationTierStats:
-  """Counters for one evaluation tier."""
+  """Counters for one evaluation tier.
+
+  `calls` counts every call, while only the `timed_calls` picked by sampling add to
+  `total_ns`.
+  """
 
   calls: int = 0
+  timed_calls: int = 0
   total_ns: int = 0
 
+  @property
+  def estimated_total_ns(self) -> float:
+    """Return the time spent over all calls, extrapolated from the timed ones."""
+    return self.total_ns * self.calls / self.timed_calls if self.timed_calls else 0.0
+
+
+@dataclass(slots=True)
+class CacheStats:
+  """Hit and miss counters for an evaluation cache."""
+
+  hits: int = 0
+  misses: int = 0
+
+  @property
+  def hit_rate(self) -> float:
+    """Return the fraction of probes answered from the cache."""
+    probes = self.hits + self.misses
+    return self.hits / probes if probes else 0.0
+
 
 @dataclass(slots=True)
 class EvaluationStats:
@@ -64,6 +257,9 @@ class EvaluationStats:
   leaf: EvaluationTierStats = field(default_factory=EvaluationTierStats)
   order: EvaluationTierStats = field(default_factory=EvaluationTierStats)
   rollout: EvaluationTierStats = field(default_factory=EvaluationTierStats)
+  pawn_hash: CacheStats = field(default_factory=CacheStats)
+  leaf_cache: CacheStats = field(default_factory=CacheStats)
+  order_cache: CacheStats = field(default_factory=CacheStats)
 
   def as_dict(self) -> dict[str, dict[str, int]]:
     """Return a stable dict view of the counters."""
@@ -71,10 +267,284 @@ class EvaluationStats:
       "leaf": asdict(self.leaf),
       "order": asdict(self.order),
       "rollout": asdict(self.rollout),
+      "pawn_hash": asdict(self.pawn_hash),
+      "leaf_cache": asdict(self.leaf_cache),
+      "order_cache": asdict(self.order_cache),
     }
 
 
-_EVALUATION_STATS = EvaluationStats()
+@dataclass(slots=True)
+class EvaluationInstrumentation:
+  """Process-wide switch for the evaluation counters.
+
+  While `enabled` is false, the tier functions skip every counter and timer. While it is
+  true, every call is counted and one call in `sample_every` per tier is timed, unless
+  the calling thread set its own sampling. `enabled` is on while `switched_on` is set by
+  `enable_evaluation_stats()` or any `record_evaluation_stats()` block is open, so a
+  block closing in one thread leaves counting on for blocks still open in others.
+  """
+
+  enabled: bool = False
+  sample_every: int = 1
+  switched_on: bool = False
+  open_blocks: int = 0
+
+  def refresh(self) -> None:
+    """Recompute `enabled` from the explicit switch and the open blocks."""
+    self.enabled = self.switched_on or self.open_blocks > 0
+
+
+class _ThreadStats(threading.local):
+  """The evaluation counters of the current thread, and its sampling inside a block."""
+
+  def __init__(self) -> None:
+    self.stats = EvaluationStats()
+    self.sample_every: int | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class SideAttacks:
+  """Attack bitboards of one side.
+
+  Pawn attacks are kept as two shifted bitboards, one per capture direction, and every
+  other piece keeps its own attack mask, so a square attacked by several pieces is
+  counted once per attacker.
+  """
+
+  pawn_left: int
+  pawn_right: int
+  pieces: tuple[int, ...]
+
+  def count(self, mask: int) -> int:
+    """Return the number of attacks landing on the squares of `mask`, one per attacker."""
+    total = (self.pawn_left & mask).bit_count() + (self.pawn_right & mask).bit_count()
+    for piece_attacks in self.pieces:
+      total += (piece_attacks & mask).bit_count()
+    return total
+
+  @property
+  def union(self) -> int:
+    """Return every square the side attacks at least once."""
+    attacked = self.pawn_left | self.pawn_right
+    for piece_attacks in self.pieces:
+      attacked |= piece_attacks
+    return attacked
+
+
+@dataclass(slots=True, frozen=True)
+class AttackMaps:
+  """Attack bitboards of both sides for one position.
+
+  Center control and pseudo-legal mobility read them, and king-zone terms can count
+  attacks into a king's neighbourhood with `side(color).count(mask)`.
+  """
+
+  white: SideAttacks
+  black: SideAttacks
+
+  def side(self, color: bool) -> SideAttacks:
+    """Return the attack maps of one color."""
+    return self.white if color == chess.WHITE else self.black
+
+
+@dataclass(slots=True, frozen=True)
+class MaterialEntry:
+  """Material terms shared by every position with the same material signature."""
+
+  material: float
+  bishop_pair: float
+  insufficient_material: bool
+  phase: int
+
+
+@dataclass(slots=True, frozen=True)
+class PawnHashEntry:
+  """Pawn-structure terms memoized for one pawn placement and pair of king squares."""
+
+  key: tuple[int, int, int, int]
+  passed_pawns: float
+  white_shield: float
+  black_shield: float
+
+
+class PawnHashTable:
+  """Bounded, direct-mapped cache of the pawn-structure evaluation terms.
+
+  Entries are keyed by both sides' pawn bitboards plus the two king squares, which is
+  everything `passed_pawn_score()` and the shield part of `king_safety()` read. A new
+  entry simply replaces whatever occupied its slot.
+  """
+
+  def __init__(self, size: int = PAWN_HASH_SIZE, *, weights: EvaluationWeights | None = None) -> None:
+    """Allocate `size` slots; `size` must be a power of two.
+
+    Entries are weighted with `weights`, or with the weights in use when omitted.
+    """
+    if size <= 0 or size & (size - 1):
+      msg = "Pawn hash size must be a positive power of two"
+      raise ValueError(msg)
+    self._weights = weights
+    self._mask = size - 1
+    self._slots: list[PawnHashEntry | None] = [None] * size
+
+  @property
+  def size(self) -> int:
+    """Return the number of slots."""
+    return len(self._slots)
+
+  def probe(self, board: Board, stats: CacheStats | None = None) -> PawnHashEntry:
+    """Return the pawn-structure terms of a board, computing and storing them on a miss.
+
+    Hits and misses are counted in `stats` when given.
+    """
+    white_king = board.king(chess.WHITE)
+    black_king = board.king(chess.BLACK)
+    key = (
+      board.pawns & board.occupied_co[chess.WHITE],
+      board.pawns & board.occupied_co[chess.BLACK],
+      -1 if white_king is None else white_king,
+      -1 if black_king is None else black_king,
+    )
+    index = hash(key) & self._mask
+    entry = self._slots[index]
+    if entry is not None and entry.key == key:
+      if stats is not None:
+        stats.hits += 1
+      return entry
+
+    if stats is not None:
+      stats.misses += 1
+    entry = PawnHashEntry(
+      key=key,
+      passed_pawns=passed_pawn_score(board, chess.WHITE, weights=self._weights),
+      white_shield=(
+        open_file_and_shield_penalty(board, white_king, chess.WHITE, weights=self._weights)
+        if white_king is not None
+        else 0.0
+      ),
+      black_shield=(
+        open_file_and_shield_penalty(board, black_king, chess.BLACK, weights=self._weights)
+        if black_king is not None
+        else 0.0
+      ),
+    )
+    self._slots[index] = entry
+    return entry
+
+  def clear(self) -> None:
+    """Drop every entry."""
+    self._slots = [None] * len(self._slots)
+
+
+EVAL_CACHE_SLOT_DTYPE = np.dtype([("key", np.uint64), ("score", np.float64)])
+
+
+class EvaluationCache:
+  """Bounded, direct-mapped cache of the scores of one evaluation tier.
+
+  Slots live in a NumPy structured array indexed by the low bits of the position's
+  64-bit Zobrist key, which covers placement, side to move, castling rights and the
+  en-passant square. A caller that keeps the key incrementally passes it to `probe()`;
+  otherwise it is computed with `zobrist_hash()`. The full key is kept to verify a
+  probe, and a new score simply replaces whatever occupied its slot. A slot is written with a single assignment, so
+  threads sharing a cache under the GIL never read one position's key with another's
+  score. Without the GIL that no longer holds, and threads evaluating in parallel take
+  their own caches with `use_thread_evaluation_caches()`.
+
+  Every tier is antisymmetric in the perspective color, so scores are stored from
+  white's point of view and negated for black.
+  """
+
+  def __init__(self, size: int) -> None:
+    """Allocate `size` slots; `size` must be a power of two."""
+    if size <= 0 or size & (size - 1):
+      msg = "Evaluation cache size must be a positive power of two"
+      raise ValueError(msg)
+    self._mask = size - 1
+    self._slots = np.zeros(size, dtype=EVAL_CACHE_SLOT_DTYPE)
+    self._slots["score"] = np.nan
+
+  @property
+  def size(self) -> int:
+    """Return the number of slots."""
+    return len(self._slots)
+
+  @property
+  def nbytes(self) -> int:
+    """Return the size of the slot storage in bytes."""
+    return self._slots.nbytes
+
+  def probe(
+    self,
+    board: Board,
+    perspective_color: bool,
+    evaluator: Callable[[Board, bool], float],
+    stats: CacheStats | None = None,
+    *,
+    key: int | None = None,
+  ) -> float:
+    """Return the cached score of a board, calling `evaluator` and storing its score on a miss.
+
+    `key` is the Zobrist key of `board` when the caller already has it. Hits and misses
+    are counted in `stats` when given.
+    """
+    if key is None:
+      key = zobrist_hash(board)
+    index = key & self._mask
+    slot_key, score = self._slots[index].item()
+    if slot_key == key and not math.isnan(score):
+      if stats is not None:
+        stats.hits += 1
+    else:
+      if stats is not None:
+        stats.misses += 1
+      score = evaluator(board, chess.WHITE)
+      self._slots[index] = (key, score)
+    return score if perspective_color == chess.WHITE else -score
+
+  def clear(self) -> None:
+    """Drop every entry."""
+    self._slots["key"] = 0
+    self._slots["score"] = np.nan
+
+
+@dataclass(slots=True)
+class EvaluationCaches:
+  """The evaluation caches used by the tier helpers; a tier without a cache is `None`."""
+
+  leaf: EvaluationCache | None
+  order: EvaluationCache | None
+
+
+_WEIGHTS = EvaluationWeights()
+_INSTRUMENTATION = EvaluationInstrumentation()
+_INSTRUMENTATION_LOCK = threading.Lock()
+_THREAD_STATS = _ThreadStats()
+_PAWN_HASH = PawnHashTable()
+_EVALUATION_CACHES = EvaluationCaches(leaf=EvaluationCache(LEAF_CACHE_SIZE), order=EvaluationCache(ORDER_CACHE_SIZE))
+
+
+class _ThreadCaches(threading.local):
+  """Caches the current thread uses instead of the shared ones, if it was given its own."""
+
+  def __init__(self) -> None:
+    self.caches: EvaluationCaches | None = None
+    self.pawn_hash: PawnHashTable | None = None
+
+
+_THREAD_CACHES = _ThreadCaches()
+
+
+def _evaluation_caches() -> EvaluationCaches:
+  """Return the evaluation caches of the current thread."""
+  caches = _THREAD_CACHES.caches
+  return _EVALUATION_CACHES if caches is None else caches
+
+
+def _pawn_hash() -> PawnHashTable:
+  """Return the pawn hash of the current thread."""
+  pawn_hash = _THREAD_CACHES.pawn_hash
+  return _PAWN_HASH if pawn_hash is None else pawn_hash
 
 
 def evaluate(
@@ -89,32 +559,85 @@ def evaluate(
   use_center_extended: bool = True,
   use_king_safety: bool = True,
   use_mobility: bool = True,
+  mobility_mode: MobilityMode = MobilityMode.LEGAL,
+  use_piece_squares: bool = False,
 ) -> float:
   """Evaluate a board from the requested perspective.
 
   The keyword toggles are preserved for compatibility, but new search code should
   prefer the explicit tiered helpers: `leaf_evaluate()`, `order_evaluate()`, and
-  `rollout_evaluate()`.
+  `rollout_evaluate()`. `mobility_mode` selects between `mobility_score()` and the
+  cheaper `pseudo_legal_mobility_score()`. Extended center control and pseudo-legal
+  mobility share one set of attack maps per call; the four-square center is cheaper to
+  scan directly. `use_piece_squares` adds the tapered piece-square tables of
+  `chesag.piece_square`, which the cheap tiers use instead of center control.
   """
-  terminal = terminal_evaluation(board, perspective_color)
+  material = material_entry(material_signature(board))
+  terminal = _terminal_evaluation(board, perspective_color, material)
   if terminal is not None:
     return terminal
 
+  pawn_entry = _pawn_hash().probe(board, _pawn_hash_stats()) if use_passed_pawns or use_king_safety else None
+  return _score_terms(
+    board,
+    perspective_color,
+    material,
+    pawn_entry,
+    include_move_bonus=include_move_bonus,
+    use_material=use_material,
+    use_bishop_pair=use_bishop_pair,
+    use_passed_pawns=use_passed_pawns,
+    use_center_basic=use_center_basic,
+    use_center_extended=use_center_extended,
+    use_king_safety=use_king_safety,
+    use_mobility=use_mobility,
+    mobility_mode=mobility_mode,
+    use_piece_squares=use_piece_squares,
+  )
+
+
+def _score_terms(
+  board: Board,
+  perspective_color: bool,
+  material: MaterialEntry,
+  pawn_entry: PawnHashEntry | None,
+  *,
+  include_move_bonus: bool = False,
+  use_material: bool = True,
+  use_bishop_pair: bool = True,
+  use_passed_pawns: bool = True,
+  use_center_basic: bool = False,
+  use_center_extended: bool = True,
+  use_king_safety: bool = True,
+  use_mobility: bool = True,
+  mobility_mode: MobilityMode = MobilityMode.LEGAL,
+  use_piece_squares: bool = False,
+  piece_squares: PieceSquareSums | None = None,
+) -> float:
+  """Sum the enabled terms of a non-terminal board from already looked-up material and pawn entries."""
   score = 0.0
+  attacks = (
+    attack_maps(board) if use_center_extended or (use_mobility and mobility_mode is MobilityMode.PSEUDO_LEGAL) else None
+  )
   if use_material:
-    score += material_balance(board, perspective_color)
+    score += material.material if perspective_color == chess.WHITE else -material.material
+  if use_piece_squares:
+    score += _piece_square_score(board, perspective_color, material, piece_squares)
   if use_bishop_pair:
-    score += bishop_pair_bonus(board, perspective_color)
-  if use_passed_pawns:
-    score += passed_pawn_score(board, perspective_color)
-  if use_center_extended:
-    score += center_control(board, perspective_color, EXTENDED_CENTER)
+    score += material.bishop_pair if perspective_color == chess.WHITE else -material.bishop_pair
+  if use_passed_pawns and pawn_entry is not None:
+    score += pawn_entry.passed_pawns if perspective_color == chess.WHITE else -pawn_entry.passed_pawns
+  if use_center_extended and attacks is not None:
+    score += _mapped_center_control(attacks, perspective_color, EXTENDED_CENTER_MASK)
   elif use_center_basic:
     score += center_control(board, perspective_color, CENTER4)
-  if use_king_safety:
-    score += king_safety(board, perspective_color)
+  if use_king_safety and pawn_entry is not None:
+    score += _king_safety(board, perspective_color, pawn_entry.white_shield, pawn_entry.black_shield)
   if use_mobility:
-    score += mobility_score(board, perspective_color)
+    if mobility_mode is MobilityMode.PSEUDO_LEGAL:
+      score += pseudo_legal_mobility_score(board, perspective_color, attacks=attacks)
+    else:
+      score += mobility_score(board, perspective_color)
   if include_move_bonus and board.move_stack:
     score += move_bonus(board, perspective_color)
   return score
@@ -122,43 +645,78 @@ def evaluate(
 
 def leaf_evaluate(board: Board, perspective_color: bool) -> float:
   """Return the richer leaf evaluation used by minimax leaves and MCTS terminals."""
-  start_ns = perf_counter_ns()
-  try:
+  if not _INSTRUMENTATION.enabled:
+    return _cached_leaf_evaluate(board, perspective_color)
+  return _recorded_call(_THREAD_STATS.stats.leaf, _cached_leaf_evaluate, board, perspective_color)
+
+
+def _cached_leaf_evaluate(board: Board, perspective_color: bool) -> float:
+  """Return the leaf tier through the leaf cache, without touching the call counters."""
+  cache = _evaluation_caches().leaf
+  if cache is None:
     return evaluate(board, perspective_color)
-  finally:
-    _record_tier_stat(_EVALUATION_STATS.leaf, start_ns)
+  return cache.probe(board, perspective_color, evaluate, _cache_stats(leaf=True))
 
 
 def order_evaluate(board: Board, perspective_color: bool) -> float:
-  """Return a cheap static evaluation for move ordering and quiescence."""
-  start_ns = perf_counter_ns()
-  try:
-    return evaluate(
-      board,
-      perspective_color,
-      include_move_bonus=False,
-      use_material=True,
-      use_bishop_pair=False,
-      use_passed_pawns=False,
-      use_center_basic=True,
-      use_center_extended=False,
-      use_king_safety=False,
-      use_mobility=False,
-    )
-  finally:
-    _record_tier_stat(_EVALUATION_STATS.order, start_ns)
+  """Return a cheap static evaluation for move ordering and quiescence: material plus piece-square tables."""
+  if not _INSTRUMENTATION.enabled:
+    return _cached_order_evaluate(board, perspective_color)
+  return _recorded_call(_THREAD_STATS.stats.order, _cached_order_evaluate, board, perspective_color)
+
+
+def _cached_order_evaluate(board: Board, perspective_color: bool) -> float:
+  """Return the order tier through the order cache, without touching the call counters."""
+  cache = _evaluation_caches().order
+  if cache is None:
+    return _order_evaluate(board, perspective_color)
+  return cache.probe(board, perspective_color, _order_evaluate, _cache_stats(leaf=False))
+
+
+def _order_evaluate(board: Board, perspective_color: bool) -> float:
+  """Return the order tier without touching the counters."""
+  return evaluate(
+    board,
+    perspective_color,
+    include_move_bonus=False,
+    use_material=True,
+    use_bishop_pair=False,
+    use_passed_pawns=False,
+    use_center_basic=False,
+    use_center_extended=False,
+    use_king_safety=False,
+    use_mobility=False,
+    use_piece_squares=True,
+  )
 
 
 def rollout_evaluate(board: Board, perspective_color: bool) -> float:
-  """Return a very cheap evaluation for rollout weighting and cutoffs."""
-  start_ns = perf_counter_ns()
-  try:
-    terminal = terminal_evaluation(board, perspective_color)
-    if terminal is not None:
-      return terminal
-    return material_balance(board, perspective_color) + center_control(board, perspective_color, CENTER4)
-  finally:
-    _record_tier_stat(_EVALUATION_STATS.rollout, start_ns)
+  """Return a very cheap evaluation for rollout weighting and cutoffs: material plus piece-square tables."""
+  if not _INSTRUMENTATION.enabled:
+    return _rollout_evaluate(board, perspective_color)
+  return _recorded_call(_THREAD_STATS.stats.rollout, _rollout_evaluate, board, perspective_color)
+
+
+def _rollout_evaluate(board: Board, perspective_color: bool) -> float:
+  """Return the rollout tier without touching the counters."""
+  material = material_entry(material_signature(board))
+  terminal = _terminal_evaluation(board, perspective_color, material)
+  if terminal is not None:
+    return terminal
+  material_score = material.material if perspective_color == chess.WHITE else -material.material
+  return material_score + _piece_square_score(board, perspective_color, material)
+
+
+def _piece_square_score(
+  board: Board, perspective_color: bool, material: MaterialEntry, piece_squares: PieceSquareSums | None = None
+) -> float:
+  """Return the tapered piece-square score, phased by the material entry and reusing carried sums."""
+  if piece_squares is None:
+    middlegame, endgame, _ = piece_square_terms(board)
+  else:
+    middlegame, endgame = piece_squares
+  score = tapered_score(middlegame, endgame, material.phase)
+  return score if perspective_color == chess.WHITE else -score
 
 
 def quick_evaluate(board: Board, perspective_color: bool) -> float:
@@ -166,159 +724,936 @@ def quick_evaluate(board: Board, perspective_color: bool) -> float:
   return order_evaluate(board, perspective_color)
 
 
+class IncrementalEvaluator:
+  """Evaluation tiers that carry their material, piece-square and pawn-structure terms along a search line.
+
+  The searchers push and pop one move between evaluations, so instead of recounting
+  every piece per call the evaluator keeps a stack of material signatures, piece-square
+  sums and pawn-structure entries. Each pushed move adjusts the parent's signature by the
+  piece it captures and the piece it promotes to, moves the piece-square values of the
+  pieces it displaces, and reuses the parent's pawn entry unless it moves a pawn or a king
+  or captures a pawn; popping simply drops the top of the stack. Terms that depend on
+  every piece, like center control, king safety and mobility, are still computed from
+  the board.
+
+  The tier methods return exactly what `leaf_evaluate()`, `order_evaluate()` and
+  `rollout_evaluate()` return and record the same tier stats when instrumentation is on. With `verify`, every
+  evaluation is recomputed from scratch and a mismatch raises `RuntimeError`. With
+  `keys`, the Zobrist keys a searcher pushes and pops along the same line, the
+  evaluation caches are probed with the current key instead of hashing the board.
+  """
+
+  def __init__(self, board: Board | None = None, *, verify: bool = False, keys: ZobristKeyStack | None = None) -> None:
+    """Initialize the evaluator, optionally rooted at a board."""
+    self.verify = verify
+    self.keys = keys
+    self._signatures: list[MaterialSignature] = []
+    self._piece_squares: list[PieceSquareSums] = []
+    self._pawn_entries: list[PawnHashEntry | None] = []
+    if board is not None:
+      self.reset(board)
+
+  def reset(self, board: Board) -> None:
+    """Discard all pushed moves and re-root the evaluator at a board."""
+    middlegame, endgame, _ = piece_square_terms(board)
+    self._signatures = [material_signature(board)]
+    self._piece_squares = [(middlegame, endgame)]
+    self._pawn_entries = [None]
+
+  def apply(self, board: Board, move: Move) -> None:
+    """Record the terms of the position after `move`; call it before pushing the move on `board`."""
+    signature = self._signatures[-1]
+    piece_squares = self._piece_squares[-1]
+    pawn_entry = self._pawn_entries[-1]
+    if move:
+      mover = board.turn
+      from_square = move.from_square
+      to_square = move.to_square
+      to_mask = chess.BB_SQUARES[to_square]
+      moved = board.piece_type_at(from_square) or chess.PAWN
+      captured_square = to_square
+      if board.occupied_co[not mover] & to_mask:
+        captured = board.piece_type_at(to_square)
+      elif moved == chess.PAWN and to_square == board.ep_square:
+        captured = chess.PAWN
+        captured_square = to_square - 8 if mover == chess.WHITE else to_square + 8
+      else:
+        captured = None
+
+      if captured is not None or move.promotion is not None:
+        counts = list(signature)
+        bishops = board.bishops
+        if captured is not None:
+          counts[piece_row(not mover, captured)] -= 1
+          bishops &= ~to_mask
+        if move.promotion is not None:
+          counts[piece_row(mover, chess.PAWN)] -= 1
+          counts[piece_row(mover, move.promotion)] += 1
+          if move.promotion == chess.BISHOP:
+            bishops |= to_mask
+        counts[12] = int(bool(bishops & chess.BB_LIGHT_SQUARES))
+        counts[13] = int(bool(bishops & chess.BB_DARK_SQUARES))
+        signature = tuple(counts)
+
+      piece_squares = _moved_piece_squares(board, move, piece_squares, moved, captured, captured_square)
+      if moved in {chess.PAWN, chess.KING} or captured == chess.PAWN:
+        pawn_entry = None
+    self._signatures.append(signature)
+    self._piece_squares.append(piece_squares)
+    self._pawn_entries.append(pawn_entry)
+
+  def undo(self) -> None:
+    """Drop the terms recorded by the last `apply()`; call it after popping the move."""
+    self._signatures.pop()
+    self._piece_squares.pop()
+    self._pawn_entries.pop()
+
+  def push(self, board: Board, move: Move) -> None:
+    """Push a move on the board and record the terms of the new position."""
+    self.apply(board, move)
+    board.push(move)
+
+  def pop(self, board: Board) -> Move:
+    """Pop the last move from the board and restore the previous terms."""
+    move = board.pop()
+    self.undo()
+    return move
+
+  def __len__(self) -> int:
+    """Return the number of recorded positions, including the root."""
+    return len(self._signatures)
+
+  def leaf_evaluate(self, board: Board, perspective_color: bool) -> float:
+    """Return `leaf_evaluate(board, perspective_color)` from the carried terms."""
+    if not _INSTRUMENTATION.enabled:
+      return self._cached_leaf_evaluate(board, perspective_color)
+    return _recorded_call(_THREAD_STATS.stats.leaf, self._cached_leaf_evaluate, board, perspective_color)
+
+  def order_evaluate(self, board: Board, perspective_color: bool) -> float:
+    """Return `order_evaluate(board, perspective_color)` from the carried terms."""
+    if not _INSTRUMENTATION.enabled:
+      return self._cached_order_evaluate(board, perspective_color)
+    return _recorded_call(_THREAD_STATS.stats.order, self._cached_order_evaluate, board, perspective_color)
+
+  def rollout_evaluate(self, board: Board, perspective_color: bool) -> float:
+    """Return `rollout_evaluate(board, perspective_color)` from the carried terms."""
+    if not _INSTRUMENTATION.enabled:
+      return self._rollout_evaluate(board, perspective_color)
+    return _recorded_call(_THREAD_STATS.stats.rollout, self._rollout_evaluate, board, perspective_color)
+
+  def _cached_leaf_evaluate(self, board: Board, perspective_color: bool) -> float:
+    """Return the leaf tier through the leaf cache, falling back to the carried terms."""
+    cache = _evaluation_caches().leaf
+    if cache is None:
+      return self._leaf_evaluate(board, perspective_color)
+    key = self.keys.current if self.keys is not None else None
+    return cache.probe(board, perspective_color, self._leaf_evaluate, _cache_stats(leaf=True), key=key)
+
+  def _cached_order_evaluate(self, board: Board, perspective_color: bool) -> float:
+    """Return the order tier through the order cache, falling back to the carried terms."""
+    cache = _evaluation_caches().order
+    if cache is None:
+      return self._order_evaluate(board, perspective_color)
+    key = self.keys.current if self.keys is not None else None
+    return cache.probe(board, perspective_color, self._order_evaluate, _cache_stats(leaf=False), key=key)
+
+  def _leaf_evaluate(self, board: Board, perspective_color: bool) -> float:
+    """Return the leaf tier from the carried terms without touching the counters."""
+    material = material_entry(self._signatures[-1])
+    score = _terminal_evaluation(board, perspective_color, material)
+    if score is None:
+      score = _score_terms(board, perspective_color, material, self._pawn_entry(board))
+    if self.verify:
+      self._check(board, score, evaluate(board, perspective_color))
+    return score
+
+  def _order_evaluate(self, board: Board, perspective_color: bool) -> float:
+    """Return the order tier from the carried terms without touching the counters."""
+    score = self._material_and_piece_squares(board, perspective_color)
+    if self.verify:
+      self._check(board, score, _order_evaluate(board, perspective_color))
+    return score
+
+  def _rollout_evaluate(self, board: Board, perspective_color: bool) -> float:
+    """Return the rollout tier from the carried terms without touching the counters."""
+    score = self._material_and_piece_squares(board, perspective_color)
+    if self.verify:
+      self._check(board, score, _rollout_evaluate(board, perspective_color))
+    return score
+
+  def _material_and_piece_squares(self, board: Board, perspective_color: bool) -> float:
+    """Return the terminal score, or material plus the tapered piece-square score."""
+    material = material_entry(self._signatures[-1])
+    terminal = _terminal_evaluation(board, perspective_color, material)
+    if terminal is not None:
+      return terminal
+    material_score = material.material if perspective_color == chess.WHITE else -material.material
+    return material_score + _piece_square_score(board, perspective_color, material, self._piece_squares[-1])
+
+  def _pawn_entry(self, board: Board) -> PawnHashEntry:
+    """Return the pawn entry of the current position, probing the pawn hash on first use."""
+    entry = self._pawn_entries[-1]
+    if entry is None:
+      entry = _pawn_hash().probe(board, _pawn_hash_stats())
+      self._pawn_entries[-1] = entry
+    return entry
+
+  def _check(self, board: Board, score: float, expected: float) -> None:
+    """Raise if the carried terms drifted from a full recomputation."""
+    signature = material_signature(board)
+    middlegame, endgame, _ = piece_square_terms(board)
+    if self._signatures[-1] != signature or self._piece_squares[-1] != (middlegame, endgame) or score != expected:
+      msg = (
+        f"Incremental evaluation diverged on {board.fen()}: "
+        f"{score} != {expected}, signature {self._signatures[-1]} != {signature}, "
+        f"piece squares {self._piece_squares[-1]} != {(middlegame, endgame)}"
+      )
+      raise RuntimeError(msg)
+
+
+def _moved_piece_squares(
+  board: Board,
+  move: Move,
+  piece_squares: PieceSquareSums,
+  moved: chess.PieceType,
+  captured: chess.PieceType | None,
+  captured_square: chess.Square,
+) -> PieceSquareSums:
+  """Return the piece-square sums after `move`, from the sums before it."""
+  mover = board.turn
+  middlegame, endgame = piece_squares
+  to_square = move.to_square
+  if moved == chess.KING and board.is_castling(move):
+    rank = chess.square_rank(move.from_square)
+    kingside = board.is_kingside_castling(move)
+    own_rooks = board.rooks & board.occupied_co[mover]
+    rook_from = to_square if own_rooks & chess.BB_SQUARES[to_square] else chess.square(7 if kingside else 0, rank)
+    to_square = chess.square(6 if kingside else 2, rank)
+    for square, sign in ((rook_from, -1), (chess.square(5 if kingside else 3, rank), 1)):
+      rook_mg, rook_eg = square_terms(mover, chess.ROOK, square)
+      middlegame += sign * rook_mg
+      endgame += sign * rook_eg
+
+  from_mg, from_eg = square_terms(mover, moved, move.from_square)
+  to_mg, to_eg = square_terms(mover, move.promotion or moved, to_square)
+  middlegame += to_mg - from_mg
+  endgame += to_eg - from_eg
+  if captured is not None:
+    captured_mg, captured_eg = square_terms(not mover, captured, captured_square)
+    middlegame -= captured_mg
+    endgame -= captured_eg
+  return middlegame, endgame
+
+
+def enable_evaluation_stats(*, sample_every: int = 1) -> None:
+  """Start counting evaluation calls in every thread, timing one call in `sample_every` per tier."""
+  if sample_every < 1:
+    msg = "sample_every must be at least 1"
+    raise ValueError(msg)
+  with _INSTRUMENTATION_LOCK:
+    _INSTRUMENTATION.sample_every = sample_every
+    _INSTRUMENTATION.switched_on = True
+    _INSTRUMENTATION.refresh()
+
+
+def disable_evaluation_stats() -> None:
+  """Stop counting evaluation calls outside `record_evaluation_stats()` blocks.
+
+  Once no block is open either, the tier functions pay no instrumentation cost.
+  """
+  with _INSTRUMENTATION_LOCK:
+    _INSTRUMENTATION.switched_on = False
+    _INSTRUMENTATION.refresh()
+
+
+def evaluation_stats_enabled() -> bool:
+  """Return whether evaluation calls are being counted."""
+  return _INSTRUMENTATION.enabled
+
+
+@contextmanager
+def record_evaluation_stats(
+  stats: EvaluationStats | None = None, *, sample_every: int = 1
+) -> Iterator[EvaluationStats]:
+  """Count the evaluations made by the current thread inside the block into `stats`.
+
+  Instrumentation stays enabled while any block is open, in any thread, and the
+  counters and sampling of the thread are restored on exit. Passing the same `stats`
+  object to successive blocks accumulates them, which is how searchers keep their own
+  counters. Other threads keep counting into their own `EvaluationStats` while a block
+  is open.
+  """
+  if sample_every < 1:
+    msg = "sample_every must be at least 1"
+    raise ValueError(msg)
+  sink = EvaluationStats() if stats is None else stats
+  previous = (_THREAD_STATS.stats, _THREAD_STATS.sample_every)
+  _THREAD_STATS.stats = sink
+  _THREAD_STATS.sample_every = sample_every
+  with _INSTRUMENTATION_LOCK:
+    _INSTRUMENTATION.open_blocks += 1
+    _INSTRUMENTATION.refresh()
+  try:
+    yield sink
+  finally:
+    with _INSTRUMENTATION_LOCK:
+      _INSTRUMENTATION.open_blocks -= 1
+      _INSTRUMENTATION.refresh()
+    _THREAD_STATS.stats, _THREAD_STATS.sample_every = previous
+
+
 def reset_evaluation_stats() -> None:
-  """Reset all evaluation-tier counters."""
-  _EVALUATION_STATS.leaf.calls = 0
-  _EVALUATION_STATS.leaf.total_ns = 0
-  _EVALUATION_STATS.order.calls = 0
-  _EVALUATION_STATS.order.total_ns = 0
-  _EVALUATION_STATS.rollout.calls = 0
-  _EVALUATION_STATS.rollout.total_ns = 0
+  """Reset the evaluation counters of the current thread."""
+  _THREAD_STATS.stats = EvaluationStats()
+
+
+def clear_pawn_hash() -> None:
+  """Drop every memoized pawn-structure entry, in the shared table and the current thread's own."""
+  _PAWN_HASH.clear()
+  if _THREAD_CACHES.pawn_hash is not None:
+    _THREAD_CACHES.pawn_hash.clear()
+
+
+def configure_evaluation_caches(*, leaf_size: int = LEAF_CACHE_SIZE, order_size: int = ORDER_CACHE_SIZE) -> None:
+  """Replace the leaf and order caches with empty ones of the given sizes; a size of 0 disables a cache.
+
+  A calling thread that had its own caches goes back to the shared ones.
+  """
+  _THREAD_CACHES.caches = None
+  _THREAD_CACHES.pawn_hash = None
+  _EVALUATION_CACHES.leaf = EvaluationCache(leaf_size) if leaf_size else None
+  _EVALUATION_CACHES.order = EvaluationCache(order_size) if order_size else None
+
+
+def clear_evaluation_caches() -> None:
+  """Drop every cached leaf and order score, in the shared caches and the current thread's own."""
+  caches = [_EVALUATION_CACHES.leaf, _EVALUATION_CACHES.order]
+  if _THREAD_CACHES.caches is not None:
+    caches += [_THREAD_CACHES.caches.leaf, _THREAD_CACHES.caches.order]
+  for cache in caches:
+    if cache is not None:
+      cache.clear()
+
+
+def use_thread_evaluation_caches() -> None:
+  """Give the current thread its own empty leaf, order and pawn-hash caches.
+
+  The shared caches are only safe to share while the GIL serializes their reads and
+  writes, so threads evaluating in parallel on free-threaded builds each use their own.
+  The new caches have the sizes of the shared ones. Clearing functions reach only the
+  shared caches and those of the calling thread.
+  """
+  leaf, order = _EVALUATION_CACHES.leaf, _EVALUATION_CACHES.order
+  _THREAD_CACHES.caches = EvaluationCaches(
+    leaf=EvaluationCache(leaf.size) if leaf is not None else None,
+    order=EvaluationCache(order.size) if order is not None else None,
+  )
+  _THREAD_CACHES.pawn_hash = PawnHashTable(_PAWN_HASH.size)
+
+
+def get_evaluation_weights() -> EvaluationWeights:
+  """Return a copy of the weights currently used by the evaluation terms."""
+  return replace(_WEIGHTS)
+
+
+def set_evaluation_weights(weights: EvaluationWeights) -> None:
+  """Use new weights for every evaluation term.
+
+  `PIECE_VALUES` is updated in place, so move ordering and static exchange evaluation
+  follow the new material values. The material table, the pawn hash and the evaluation
+  caches hold weighted terms and are cleared.
+  """
+  for name in EvaluationWeights.__dataclass_fields__:
+    setattr(_WEIGHTS, name, getattr(weights, name))
+  PIECE_VALUES.update(weights.piece_values)
+  material_entry.cache_clear()
+  clear_pawn_hash()
+  clear_evaluation_caches()
+
+
+def load_weights(path: str | Path) -> EvaluationWeights:
+  """Read evaluation weights from a JSON file written by `save_weights()`."""
+  with Path(path).open(encoding="utf-8") as handle:
+    return EvaluationWeights.from_dict(json.load(handle))
+
+
+def save_weights(weights: EvaluationWeights, path: str | Path) -> None:
+  """Write evaluation weights to a JSON file."""
+  with Path(path).open("w", encoding="utf-8") as handle:
+    json.dump(weights.as_dict(), handle, indent=2)
+    handle.write("\n")
+
+
+BUILTIN_PROFILES: dict[str, dict[str, object]] = {
+  "default": {},
+  "fast": {"mobility_mode": MobilityMode.PSEUDO_LEGAL.value},
+  "placement": {"use_center_extended": False, "use_mobility": False, "use_piece_squares": True},
+}
+
+
+@dataclass(slots=True, frozen=True)
+class EvaluationProfile:
+  """A named choice of evaluation terms and weights.
+
+  The toggles mean the same as the keyword arguments of `evaluate()` and default to the
+  same values; the weights default to the ones in use when the profile is made.
+  `compile()` turns a profile into a `CompiledEvaluator`, which is what the agents call.
+  """
+
+  name: str = "default"
+  weights: EvaluationWeights = field(default_factory=get_evaluation_weights)
+  include_move_bonus: bool = False
+  use_material: bool = True
+  use_bishop_pair: bool = True
+  use_passed_pawns: bool = True
+  use_center_basic: bool = False
+  use_center_extended: bool = True
+  use_king_safety: bool = True
+  use_mobility: bool = True
+  mobility_mode: MobilityMode = MobilityMode.LEGAL
+  use_piece_squares: bool = False
+
+  def as_dict(self) -> dict[str, object]:
+    """Return a dict view of the profile that `from_dict()` reads back."""
+    values = {name: getattr(self, name) for name in self.__dataclass_fields__}
+    values["weights"] = self.weights.as_dict()
+    values["mobility_mode"] = self.mobility_mode.value
+    return values
+
+  @classmethod
+  def from_dict(cls, values: Mapping[str, object], *, name: str | None = None) -> Self:
+    """Build a profile from a mapping such as one table of a profile file.
+
+    `weights` is a mapping of weight names; the weights it leaves out keep the values in
+    use. `mobility_mode` is given by value, and `name`, when passed, overrides the one in
+    the mapping.
+    """
+    unknown = set(values) - set(cls.__dataclass_fields__)
+    if unknown:
+      msg = f"Unknown evaluation profile settings: {', '.join(sorted(unknown))}"
+      raise ValueError(msg)
+    settings = dict(values)
+    if name is not None:
+      settings["name"] = name
+    if "weights" in settings:
+      weights = get_evaluation_weights().as_dict()
+      weights.update(settings["weights"])  # type: ignore[call-overload]
+      settings["weights"] = EvaluationWeights.from_dict(weights)
+    if "mobility_mode" in settings:
+      settings["mobility_mode"] = MobilityMode(settings["mobility_mode"])
+    return cls(**settings)  # type: ignore[arg-type]
+
+  def compile(self, *, cache_size: int = LEAF_CACHE_SIZE) -> "CompiledEvaluator":
+    """Return a `CompiledEvaluator` for this profile, with a leaf cache of `cache_size` slots (0 for none)."""
+    return CompiledEvaluator(self, cache_size=cache_size)
+
+
+type _Term = Callable[[Board, MaterialEntry, PawnHashEntry | None, AttackMaps | None], float]
+
+
+class CompiledEvaluator:
+  """A leaf evaluation specialized for one `EvaluationProfile`.
+
+  Every toggle of the profile is resolved once, at construction: the disabled terms are
+  left out and the enabled ones are kept as a tuple of functions bound to a private copy
+  of the weights, so a call runs no flag branches and later calls to
+  `set_evaluation_weights()` do not affect it. The evaluator has its own material table,
+  pawn hash and leaf cache, which lets several profiles play side by side in one process.
+  Calling it returns exactly what `evaluate()` returns for the same toggles and weights,
+  and it records leaf-tier stats when instrumentation is on. A profile with
+  `include_move_bonus` depends on the last move played, so it is never cached.
+  """
+
+  def __init__(self, profile: EvaluationProfile, *, cache_size: int = LEAF_CACHE_SIZE) -> None:
+    """Compile `profile`; `cache_size` must be a power of two, or 0 to evaluate without a cache."""
+    self.profile = profile
+    self.weights = replace(profile.weights)
+    self._material = lru_cache(maxsize=MATERIAL_TABLE_SIZE)(partial(build_material_entry, weights=self.weights))
+    self._pawn_hash = (
+      PawnHashTable(weights=self.weights) if profile.use_passed_pawns or profile.use_king_safety else None
+    )
+    self._needs_attacks = profile.use_center_extended or (
+      profile.use_mobility and profile.mobility_mode is MobilityMode.PSEUDO_LEGAL
+    )
+    self._terms = _compile_terms(profile, self.weights)
+    self._cache = EvaluationCache(cache_size) if cache_size and not profile.include_move_bonus else None
+
+  @property
+  def name(self) -> str:
+    """Return the name of the compiled profile."""
+    return self.profile.name
+
+  def __call__(self, board: Board, perspective_color: bool) -> float:
+    """Evaluate a board from the requested perspective."""
+    if not _INSTRUMENTATION.enabled:
+      return self._cached_evaluate(board, perspective_color)
+    return _recorded_call(_THREAD_STATS.stats.leaf, self._cached_evaluate, board, perspective_color)
+
+  def clear(self) -> None:
+    """Drop every memoized material entry, pawn entry and cached score."""
+    self._material.cache_clear()
+    if self._pawn_hash is not None:
+      self._pawn_hash.clear()
+    if self._cache is not None:
+      self._cache.clear()
+
+  def _cached_evaluate(self, board: Board, perspective_color: bool) -> float:
+    """Return the score through the leaf cache, without touching the call counters."""
+    if self._cache is None:
+      return self._evaluate(board, perspective_color)
+    return self._cache.probe(board, perspective_color, self._evaluate, _cache_stats(leaf=True))
+
+  def _evaluate(self, board: Board, perspective_color: bool) -> float:
+    """Sum the compiled terms of a board, without the cache or the call counters."""
+    material = self._material(material_signature(board))
+    terminal = _terminal_evaluation(board, perspective_color, material)
+    if terminal is not None:
+      return terminal
+    pawn_entry = self._pawn_hash.probe(board, _pawn_hash_stats()) if self._pawn_hash is not None else None
+    attacks = attack_maps(board) if self._needs_attacks else None
+    # A plain loop rather than `sum()`, which compensates rounding and would drift from `evaluate()`.
+    score = 0.0
+    for term in self._terms:
+      score += term(board, material, pawn_entry, attacks)
+    return score if perspective_color == chess.WHITE else -score
+
+  def __repr__(self) -> str:
+    """Return a compact description naming the profile."""
+    return f"CompiledEvaluator({self.profile.name!r}, terms={len(self._terms)})"
+
+
+def _compile_terms(profile: EvaluationProfile, weights: EvaluationWeights) -> tuple[_Term, ...]:
+  """Return the enabled terms of a profile from white's view, in the order `_score_terms()` adds them."""
+  terms: list[_Term] = []
+  if profile.use_material:
+    terms.append(lambda _board, material, _pawns, _attacks: material.material)
+  if profile.use_piece_squares:
+    terms.append(lambda board, material, _pawns, _attacks: _piece_square_score(board, chess.WHITE, material))
+  if profile.use_bishop_pair:
+    terms.append(lambda _board, material, _pawns, _attacks: material.bishop_pair)
+  if profile.use_passed_pawns:
+    terms.append(lambda _board, _material, pawns, _attacks: pawns.passed_pawns)
+  if profile.use_center_extended:
+    terms.append(
+      lambda _board, _material, _pawns, attacks: _mapped_center_control(
+        attacks, chess.WHITE, EXTENDED_CENTER_MASK, weights
+      )
+    )
+  elif profile.use_center_basic:
+    terms.append(
+      lambda board, _material, _pawns, _attacks: center_control(board, chess.WHITE, CENTER4, weights=weights)
+    )
+  if profile.use_king_safety:
+    terms.append(
+      lambda board, _material, pawns, _attacks: _king_safety(
+        board, chess.WHITE, pawns.white_shield, pawns.black_shield, weights
+      )
+    )
+  if profile.use_mobility:
+    if profile.mobility_mode is MobilityMode.PSEUDO_LEGAL:
+      terms.append(
+        lambda board, _material, _pawns, attacks: pseudo_legal_mobility_score(
+          board, chess.WHITE, attacks=attacks, weights=weights
+        )
+      )
+    else:
+      terms.append(lambda board, _material, _pawns, _attacks: mobility_score(board, chess.WHITE, weights=weights))
+  if profile.include_move_bonus:
+    terms.append(lambda board, _material, _pawns, _attacks: move_bonus(board, chess.WHITE))
+  return tuple(terms)
+
+
+def load_profiles(path: str | Path) -> dict[str, EvaluationProfile]:
+  """Read evaluation profiles from a TOML or JSON file, keyed by name.
+
+  The file either describes one profile at its top level, named by its `name` key or
+  else by the file stem, or holds a `profiles` table with one sub-table per profile,
+  named by its key. Each profile is read by `EvaluationProfile.from_dict()`.
+  """
+  path = Path(path)
+  with path.open("rb") as handle:
+    data = tomllib.load(handle) if path.suffix == ".toml" else json.load(handle)
+  if "profiles" in data:
+    return {name: EvaluationProfile.from_dict(values, name=name) for name, values in data["profiles"].items()}
+  profile = EvaluationProfile.from_dict(data, name=data.get("name", path.stem))
+  return {profile.name: profile}
+
+
+def load_profile(path: str | Path, name: str | None = None) -> EvaluationProfile:
+  """Read one evaluation profile from a file; `name` picks it when the file holds several."""
+  profiles = load_profiles(path)
+  if name is None:
+    if len(profiles) == 1:
+      return next(iter(profiles.values()))
+    msg = f"{path} holds several evaluation profiles, pick one of: {', '.join(profiles)}"
+    raise ValueError(msg)
+  if name not in profiles:
+    msg = f"Unknown evaluation profile {name!r} in {path}"
+    raise ValueError(msg)
+  return profiles[name]
+
+
+def resolve_profile(profile: EvaluationProfile | str | Path) -> EvaluationProfile:
+  """Return a profile given as is, by the name of a built-in profile or by the path of a profile file."""
+  if isinstance(profile, EvaluationProfile):
+    return profile
+  if isinstance(profile, str) and profile in BUILTIN_PROFILES:
+    return EvaluationProfile.from_dict(BUILTIN_PROFILES[profile], name=profile)
+  return load_profile(profile)
 
 
 def get_evaluation_stats() -> EvaluationStats:
-  """Return a snapshot of current evaluation-tier counters."""
-  stats = _EVALUATION_STATS.as_dict()
-  snapshot = EvaluationStats()
-  snapshot.leaf.calls = stats["leaf"]["calls"]
-  snapshot.leaf.total_ns = stats["leaf"]["total_ns"]
-  snapshot.order.calls = stats["order"]["calls"]
-  snapshot.order.total_ns = stats["order"]["total_ns"]
-  snapshot.rollout.calls = stats["rollout"]["calls"]
-  snapshot.rollout.total_ns = stats["rollout"]["total_ns"]
-  return snapshot
-
-
-def _record_tier_stat(stats: EvaluationTierStats, start_ns: int) -> None:
-  """Record one evaluation call."""
+  """Return a snapshot of the evaluation counters of the current thread."""
+  stats = _THREAD_STATS.stats
+  return EvaluationStats(
+    leaf=replace(stats.leaf),
+    order=replace(stats.order),
+    rollout=replace(stats.rollout),
+    pawn_hash=replace(stats.pawn_hash),
+    leaf_cache=replace(stats.leaf_cache),
+    order_cache=replace(stats.order_cache),
+  )
+
+
+def _pawn_hash_stats() -> CacheStats | None:
+  """Return the pawn-hash counters to update, or `None` while instrumentation is off."""
+  return _THREAD_STATS.stats.pawn_hash if _INSTRUMENTATION.enabled else None
+
+
+def _cache_stats(*, leaf: bool) -> CacheStats | None:
+  """Return the leaf- or order-cache counters to update, or `None` while instrumentation is off."""
+  if not _INSTRUMENTATION.enabled:
+    return None
+  return _THREAD_STATS.stats.leaf_cache if leaf else _THREAD_STATS.stats.order_cache
+
+
+def _recorded_call(
+  stats: EvaluationTierStats,
+  function: Callable[[Board, bool], float],
+  board: Board,
+  perspective_color: bool,
+) -> float:
+  """Count one evaluation call and time it if it is picked by sampling."""
   stats.calls += 1
-  stats.total_ns += perf_counter_ns() - start_ns
+  if stats.calls % (_THREAD_STATS.sample_every or _INSTRUMENTATION.sample_every):
+    return function(board, perspective_color)
+  start_ns = perf_counter_ns()
+  try:
+    return function(board, perspective_color)
+  finally:
+    stats.timed_calls += 1
+    stats.total_ns += perf_counter_ns() - start_ns
 
 
 def terminal_evaluation(board: Board, perspective_color: bool) -> float | None:
   """Return a terminal score or `None` if the game is still in progress."""
+  return _terminal_evaluation(board, perspective_color, material_entry(material_signature(board)))
+
+
+def _terminal_evaluation(board: Board, perspective_color: bool, material: MaterialEntry) -> float | None:
+  """Return a terminal score using an already looked-up material entry."""
   if board.is_checkmate():
     return float("inf") if board.turn != perspective_color else -float("inf")
-  if board.is_stalemate() or board.is_insufficient_material():
+  if board.is_stalemate() or material.insufficient_material:
     return 0.0
   return None
 
 
+def material_signature(board: Board) -> MaterialSignature:
+  """Return piece counts per color and type, plus which square colors hold bishops.
+
+  The counts are ordered pawn to king, white first. The two trailing flags tell whether
+  any bishop stands on a light or a dark square, which the insufficient-material verdict
+  needs.
+  """
+  white = board.occupied_co[chess.WHITE]
+  black = board.occupied_co[chess.BLACK]
+  return (
+    (board.pawns & white).bit_count(),
+    (board.knights & white).bit_count(),
+    (board.bishops & white).bit_count(),
+    (board.rooks & white).bit_count(),
+    (board.queens & white).bit_count(),
+    (board.kings & white).bit_count(),
+    (board.pawns & black).bit_count(),
+    (board.knights & black).bit_count(),
+    (board.bishops & black).bit_count(),
+    (board.rooks & black).bit_count(),
+    (board.queens & black).bit_count(),
+    (board.kings & black).bit_count(),
+    int(bool(board.bishops & chess.BB_LIGHT_SQUARES)),
+    int(bool(board.bishops & chess.BB_DARK_SQUARES)),
+  )
+
+
+@lru_cache(maxsize=MATERIAL_TABLE_SIZE)
+def material_entry(signature: MaterialSignature) -> MaterialEntry:
+  """Return the material terms of a material signature, memoized per signature."""
+  return build_material_entry(signature, _WEIGHTS)
+
+
+def build_material_entry(signature: MaterialSignature, weights: EvaluationWeights) -> MaterialEntry:
+  """Return the material terms of a material signature under the given weights."""
+  white_counts = signature[:6]
+  black_counts = signature[6:12]
+  material = 0.0
+  for white_count, black_count, value in zip(white_counts, black_counts, weights.piece_values.values(), strict=True):
+    material += value * white_count
+    material -= value * black_count
+
+  bishop_pair = 0.0
+  if white_counts[2] >= BISHOP_PAIR_COUNT:
+    bishop_pair += weights.bishop_pair
+  if black_counts[2] >= BISHOP_PAIR_COUNT:
+    bishop_pair -= weights.bishop_pair
+
+  insufficient = _side_has_insufficient_material(
+    white_counts, black_counts, signature
+  ) and _side_has_insufficient_material(black_counts, white_counts, signature)
+  phase = sum(
+    (white_count + black_count) * PHASE_WEIGHTS[piece_type]
+    for white_count, black_count, piece_type in zip(white_counts, black_counts, chess.PIECE_TYPES, strict=True)
+  )
+  return MaterialEntry(material=material, bishop_pair=bishop_pair, insufficient_material=insufficient, phase=phase)
+
+
+def _side_has_insufficient_material(
+  own: MaterialSignature, other: MaterialSignature, signature: MaterialSignature
+) -> bool:
+  """Mirror `chess.Board.has_insufficient_material()` on piece counts."""
+  pawns, knights, bishops, rooks, queens, kings = own
+  if pawns or rooks or queens:
+    return False
+  if knights:
+    return knights + bishops + kings <= _KING_AND_MINOR_COUNT and not any(other[:4])
+  if bishops:
+    bishops_on_light, bishops_on_dark = signature[12], signature[13]
+    same_color = not bishops_on_light or not bishops_on_dark
+    return same_color and not other[0] and not other[1]
+  return True
+
+
 def material_balance(board: Board, perspective_color: bool) -> float:
   """Return material balance from the requested perspective."""
-  score = 0.0
-  for piece_type, value in PIECE_VALUES.items():
-    score += value * len(board.pieces(piece_type, chess.WHITE))
-    score -= value * len(board.pieces(piece_type, chess.BLACK))
+  score = material_entry(material_signature(board)).material
   return score if perspective_color == chess.WHITE else -score
 
 
 def bishop_pair_bonus(board: Board, perspective_color: bool) -> float:
   """Return the bishop-pair bonus from the requested perspective."""
-  score = 0.0
-  if len(board.pieces(chess.BISHOP, chess.WHITE)) >= BISHOP_PAIR_COUNT:
-    score += BISHOP_PAIR_BONUS
-  if len(board.pieces(chess.BISHOP, chess.BLACK)) >= BISHOP_PAIR_COUNT:
-    score -= BISHOP_PAIR_BONUS
+  score = material_entry(material_signature(board)).bishop_pair
   return score if perspective_color == chess.WHITE else -score
 
 
-def passed_pawn_score(board: Board, perspective_color: bool) -> float:
-  """Return the passed-pawn bonus from the requested perspective."""
+def passed_pawn_score(board: Board, perspective_color: bool, *, weights: EvaluationWeights | None = None) -> float:
+  """Return the passed-pawn bonus from the requested perspective, under `weights` or the weights in use."""
+  bonus = (_WEIGHTS if weights is None else weights).passed_pawn
   score = 0.0
-  for pawn_square in board.pieces(chess.PAWN, chess.WHITE):
-    if is_passed_pawn(board, pawn_square, chess.WHITE):
+  white_pawns = board.pawns & board.occupied_co[chess.WHITE]
+  black_pawns = board.pawns & board.occupied_co[chess.BLACK]
+  for pawn_square in chess.scan_forward(white_pawns):
+    if not PASSED_PAWN_MASKS[chess.WHITE][pawn_square] & black_pawns:
       rank = chess.square_rank(pawn_square)
-      score += PASSED_PAWN_BONUS * (rank / 6)
-  for pawn_square in board.pieces(chess.PAWN, chess.BLACK):
-    if is_passed_pawn(board, pawn_square, chess.BLACK):
+      score += bonus * (rank / 6)
+  for pawn_square in chess.scan_forward(black_pawns):
+    if not PASSED_PAWN_MASKS[chess.BLACK][pawn_square] & white_pawns:
       rank = 7 - chess.square_rank(pawn_square)
-      score -= PASSED_PAWN_BONUS * (rank / 6)
+      score -= bonus * (rank / 6)
   return score if perspective_color == chess.WHITE else -score
 
 
 def is_passed_pawn(board: Board, square: chess.Square, color: bool) -> bool:
   """Check if a pawn has no enemy pawns in front of it or on adjacent files."""
-  file = chess.square_file(square)
-  rank = chess.square_rank(square)
-  direction = 1 if color == chess.WHITE else -1
-  enemy_pawns = board.pieces(chess.PAWN, not color)
-
-  for next_rank in range(rank + direction, 8 if color == chess.WHITE else -1, direction):
-    for next_file in (file - 1, file, file + 1):
-      if 0 <= next_file <= BOARD_EDGE_INDEX and chess.square(next_file, next_rank) in enemy_pawns:
-        return False
-  return True
+  return not PASSED_PAWN_MASKS[color][square] & board.pawns & board.occupied_co[not color]
 
 
-def center_control(board: Board, perspective_color: bool, squares: Iterable[chess.Square]) -> float:
-  """Score control of the supplied central squares."""
-  white_attackers = sum(len(board.attackers(chess.WHITE, square)) for square in squares)
-  black_attackers = sum(len(board.attackers(chess.BLACK, square)) for square in squares)
-  score = (white_attackers - black_attackers) * CENTER_CONTROL_WEIGHT
+def center_control(
+  board: Board,
+  perspective_color: bool,
+  squares: Iterable[chess.Square],
+  *,
+  attacks: AttackMaps | None = None,
+  weights: EvaluationWeights | None = None,
+) -> float:
+  """Score control of the supplied central squares.
+
+  With precomputed `attacks`, the attackers are counted from the attack maps instead of
+  scanning each square; both give the same score.
+  """
+  if attacks is not None:
+    return _mapped_center_control(attacks, perspective_color, squares_mask(squares), weights)
+
+  white_attackers = 0
+  black_attackers = 0
+  for square in squares:
+    white_attackers += board.attackers_mask(chess.WHITE, square).bit_count()
+    black_attackers += board.attackers_mask(chess.BLACK, square).bit_count()
+  score = (white_attackers - black_attackers) * (_WEIGHTS if weights is None else weights).center_control
   return score if perspective_color == chess.WHITE else -score
 
 
-def king_safety(board: Board, perspective_color: bool) -> float:
-  """Score king safety from the requested perspective."""
-  score = 0.0
+def _mapped_center_control(
+  attacks: AttackMaps, perspective_color: bool, mask: int, weights: EvaluationWeights | None = None
+) -> float:
+  """Score control of the squares in `mask` from precomputed attack maps."""
+  weight = (_WEIGHTS if weights is None else weights).center_control
+  score = (attacks.white.count(mask) - attacks.black.count(mask)) * weight
+  return score if perspective_color == chess.WHITE else -score
+
+
+def king_safety(board: Board, perspective_color: bool, *, weights: EvaluationWeights | None = None) -> float:
+  """Score king safety from the requested perspective, under `weights` or the weights in use."""
   white_king = board.king(chess.WHITE)
   black_king = board.king(chess.BLACK)
+  return _king_safety(
+    board,
+    perspective_color,
+    open_file_and_shield_penalty(board, white_king, chess.WHITE, weights=weights) if white_king is not None else 0.0,
+    open_file_and_shield_penalty(board, black_king, chess.BLACK, weights=weights) if black_king is not None else 0.0,
+    weights,
+  )
+
 
+def _king_safety(
+  board: Board,
+  perspective_color: bool,
+  white_shield: float,
+  black_shield: float,
+  weights: EvaluationWeights | None = None,
+) -> float:
+  """Combine castling rights with precomputed open-file and shield penalties."""
+  bonus = (_WEIGHTS if weights is None else weights).king_castle
+  score = 0.0
   if board.has_kingside_castling_rights(chess.WHITE):
-    score += KING_CASTLE_BONUS
+    score += bonus
   if board.has_queenside_castling_rights(chess.WHITE):
-    score += KING_CASTLE_BONUS
+    score += bonus
   if board.has_kingside_castling_rights(chess.BLACK):
-    score -= KING_CASTLE_BONUS
+    score -= bonus
   if board.has_queenside_castling_rights(chess.BLACK):
-    score -= KING_CASTLE_BONUS
+    score -= bonus
 
-  if white_king is not None:
-    score += open_file_and_shield_penalty(board, white_king, chess.WHITE)
-  if black_king is not None:
-    score -= open_file_and_shield_penalty(board, black_king, chess.BLACK)
+  score += white_shield
+  score -= black_shield
   return score if perspective_color == chess.WHITE else -score
 
 
-def open_file_and_shield_penalty(board: Board, king_square: chess.Square, color: bool) -> float:
+def open_file_and_shield_penalty(
+  board: Board, king_square: chess.Square, color: bool, *, weights: EvaluationWeights | None = None
+) -> float:
   """Score open files and pawn shield quality around one king."""
+  weights = _WEIGHTS if weights is None else weights
   score = 0.0
-  king_file = chess.square_file(king_square)
-
-  for file_idx in (king_file - 1, king_file, king_file + 1):
-    if 0 <= file_idx <= BOARD_EDGE_INDEX:
-      file_squares = [chess.square(file_idx, rank) for rank in range(8)]
-      if not any(
-        board.piece_type_at(square) == chess.PAWN and board.color_at(square) == color for square in file_squares
-      ):
-        score += KING_OPEN_FILE_PENALTY
-
-  forward = 1 if color == chess.WHITE else -1
-  target_rank = chess.square_rank(king_square) + forward
-  if 0 <= target_rank <= BOARD_EDGE_INDEX:
-    for file_idx in (king_file - 1, king_file, king_file + 1):
-      if 0 <= file_idx <= BOARD_EDGE_INDEX:
-        square = chess.square(file_idx, target_rank)
-        if board.piece_type_at(square) != chess.PAWN or board.color_at(square) != color:
-          score += PAWN_SHIELD_PENALTY
+  own_pawns = board.pawns & board.occupied_co[color]
+  for file_mask in KING_FILE_MASKS[king_square]:
+    if not own_pawns & file_mask:
+      score += weights.king_open_file
+  for shield_mask in KING_SHIELD_MASKS[color][king_square]:
+    if not own_pawns & shield_mask:
+      score += weights.pawn_shield
   return score
 
 
-def mobility_score(board: Board, perspective_color: bool) -> float:
-  """Score relative mobility from the requested perspective."""
-  white_board = board.copy(stack=False)
-  white_board.turn = chess.WHITE
-  white_mobility = white_board.legal_moves.count()
+def mobility_score(board: Board, perspective_color: bool, *, weights: EvaluationWeights | None = None) -> float:
+  """Score relative mobility from the requested perspective.
+
+  The side to move counts its legal moves on `board` itself, which is never modified,
+  so boards shared with other threads are safe to score. The other side counts them on
+  a single copy without the move stack, handed the move.
+  """
+  opponent_board = board.copy(stack=False)
+  opponent_board.turn = not board.turn
+  mover_mobility = board.legal_moves.count()
+  opponent_mobility = opponent_board.legal_moves.count()
+  white_mobility, black_mobility = (
+    (mover_mobility, opponent_mobility) if board.turn == chess.WHITE else (opponent_mobility, mover_mobility)
+  )
+
+  score = (white_mobility - black_mobility) * (_WEIGHTS if weights is None else weights).mobility
+  return score if perspective_color == chess.WHITE else -score
 
-  black_board = board.copy(stack=False)
-  black_board.turn = chess.BLACK
-  black_mobility = black_board.legal_moves.count()
 
-  score = (white_mobility - black_mobility) * MOBILITY_WEIGHT
+def pseudo_legal_mobility_score(
+  board: Board,
+  perspective_color: bool,
+  *,
+  attacks: AttackMaps | None = None,
+  weights: EvaluationWeights | None = None,
+) -> float:
+  """Score relative pseudo-legal mobility from attack bitboards, without copying the board.
+
+  This approximates `mobility_score()`. Each side counts pawn pushes and captures and
+  every square its other pieces attack that is not occupied by its own pieces. Pins,
+  checks and king moves into attacked squares are not filtered out, castling is not
+  counted and a promotion counts once rather than once per piece. The count is
+  therefore usually a little above the legal move count. It is far above it for a side
+  in check, and slightly below it when castling or promotions are available. On random
+  game positions the counts differ by about two moves on average. The score is weighted
+  the same way as `mobility_score()` and costs roughly a tenth as much.
+  """
+  if attacks is None:
+    attacks = attack_maps(board)
+  score = (
+    _pseudo_legal_move_count(board, chess.WHITE, attacks.white)
+    - _pseudo_legal_move_count(board, chess.BLACK, attacks.black)
+  ) * (_WEIGHTS if weights is None else weights).mobility
   return score if perspective_color == chess.WHITE else -score
 
 
+def _pseudo_legal_move_count(board: Board, color: bool, attacks: SideAttacks) -> int:
+  """Count the pseudo-legal moves of one side from its attack maps and pawn pushes."""
+  own = board.occupied_co[color]
+  empty = ~board.occupied & chess.BB_ALL
+  targets = board.occupied_co[not color]
+  if board.ep_square is not None and board.turn == color:
+    targets |= chess.BB_SQUARES[board.ep_square]
+
+  pawns = board.pawns & own
+  if color == chess.WHITE:
+    single_pushes = (pawns << 8) & empty
+    double_pushes = ((single_pushes & chess.BB_RANK_3) << 8) & empty
+  else:
+    single_pushes = (pawns >> 8) & empty
+    double_pushes = ((single_pushes & chess.BB_RANK_6) >> 8) & empty
+  count = (
+    single_pushes.bit_count()
+    + double_pushes.bit_count()
+    + (attacks.pawn_left & targets).bit_count()
+    + (attacks.pawn_right & targets).bit_count()
+  )
+
+  not_own = ~own & chess.BB_ALL
+  for piece_attacks in attacks.pieces:
+    count += (piece_attacks & not_own).bit_count()
+  return count
+
+
+def attack_maps(board: Board) -> AttackMaps:
+  """Compute both sides' attack bitboards once, for every attack-based evaluation term."""
+  return AttackMaps(white=_side_attacks(board, chess.WHITE), black=_side_attacks(board, chess.BLACK))
+
+
+def _side_attacks(board: Board, color: bool) -> SideAttacks:
+  own = board.occupied_co[color]
+  pawns = board.pawns & own
+  if color == chess.WHITE:
+    pawn_left = ((pawns & ~chess.BB_FILE_A) << 7) & chess.BB_ALL
+    pawn_right = ((pawns & ~chess.BB_FILE_H) << 9) & chess.BB_ALL
+  else:
+    pawn_left = (pawns & ~chess.BB_FILE_A) >> 9
+    pawn_right = (pawns & ~chess.BB_FILE_H) >> 7
+  pieces = tuple(board.attacks_mask(square) for square in chess.scan_forward(own & ~board.pawns))
+  return SideAttacks(pawn_left=pawn_left, pawn_right=pawn_right, pieces=pieces)
+
+
+def squares_mask(squares: Iterable[chess.Square]) -> int:
+  """Return the bitboard of a collection of squares."""
+  mask = 0
+  for square in squares:
+    mask |= chess.BB_SQUARES[square]
+  return mask
+
+
 def mvv_lva_score(board: Board, move: Move) -> float:
   """Score captures using the MVV-LVA heuristic."""
   if not board.is_capture(move):
@@ -336,6 +1671,56 @@ def mvv_lva_score(board: Board, move: Move) -> float:
   return (PIECE_VALUES[victim_type] * 10) - PIECE_VALUES[attacker_type]
 
 
+def static_exchange_evaluation(board: Board, move: Move) -> float:
+  """Return the material the side to move expects to win by playing a move onto a square.
+
+  Both sides alternately recapture on the target square with their least valuable
+  attacker, and either side may stop when continuing would lose material. Sliding
+  attackers hidden behind a piece that has already captured (x-rays) join the exchange
+  as the occupancy is cleared. Pins and checks are ignored.
+  """
+  if board.is_castling(move):
+    return 0.0
+  from_square = move.from_square
+  to_square = move.to_square
+  attacker_type = board.piece_type_at(from_square)
+  if attacker_type is None:
+    return 0.0
+
+  occupied = board.occupied & ~chess.BB_SQUARES[from_square]
+  if board.is_en_passant(move):
+    captured_square = to_square + (-8 if board.turn == chess.WHITE else 8)
+    occupied &= ~chess.BB_SQUARES[captured_square]
+    gains = [PIECE_VALUES[chess.PAWN]]
+  else:
+    victim_type = board.piece_type_at(to_square)
+    gains = [PIECE_VALUES[victim_type] if victim_type is not None else 0.0]
+  if move.promotion is not None:
+    gains[0] += PIECE_VALUES[move.promotion] - PIECE_VALUES[chess.PAWN]
+    attacker_type = move.promotion
+
+  side = not board.turn
+  piece_on_square = attacker_type
+  while True:
+    attackers = board.attackers_mask(side, to_square, occupied) & occupied
+    if not attackers:
+      break
+    for piece_type in chess.PIECE_TYPES:
+      candidates = attackers & board.pieces_mask(piece_type, side)
+      if candidates:
+        break
+    if piece_type == chess.KING and board.attackers_mask(not side, to_square, occupied) & occupied:
+      break
+    gains.append(PIECE_VALUES[piece_on_square] - gains[-1])
+    piece_on_square = piece_type
+    occupied &= ~chess.BB_SQUARES[chess.lsb(candidates)]
+    side = not side
+
+  for index in range(len(gains) - 1, 0, -1):
+    gains[index - 1] = -max(-gains[index - 1], gains[index])
+  return gains[0]
+
+
 def move_bonus(board: Board, perspective_color: bool) -> float:
   """Return move-local tactical bonuses from the last move played."""
   if not board.move_stack:
@@ -350,3 +1735,209 @@ def move_bonus(board: Board, perspective_color: bool) -> float:
   if last_move.promotion is not None:
     score += PIECE_VALUES[last_move.promotion] - PIECE_VALUES[chess.PAWN]
   return score if perspective_color != board.turn else -score
+
+
+def board_bitboards(board: Board) -> tuple[int, ...]:
+  """Return the twelve piece bitboards of a board in `BATCH_COLUMNS` order."""
+  white = board.occupied_co[chess.WHITE]
+  black = board.occupied_co[chess.BLACK]
+  return (
+    board.pawns & white,
+    board.knights & white,
+    board.bishops & white,
+    board.rooks & white,
+    board.queens & white,
+    board.kings & white,
+    board.pawns & black,
+    board.knights & black,
+    board.bishops & black,
+    board.rooks & black,
+    board.queens & black,
+    board.kings & black,
+  )
+
+
+def stack_bitboards(boards: Iterable[Board]) -> npt.NDArray[np.uint64]:
+  """Stack the piece bitboards of many boards into an `(N, 12)` array for `batch_evaluate()`."""
+  rows = [board_bitboards(board) for board in boards]
+  return np.array(rows, dtype=np.uint64).reshape(len(rows), len(BATCH_COLUMNS))
+
+
+def batch_evaluate(
+  bitboards: npt.NDArray[np.uint64],
+  perspective_colors: bool | npt.ArrayLike,
+  *,
+  use_material: bool = True,
+  use_bishop_pair: bool = True,
+  use_passed_pawns: bool = True,
+  use_center_basic: bool = False,
+  use_center_extended: bool = True,
+  use_piece_squares: bool = False,
+) -> npt.NDArray[np.float64]:
+  """Evaluate the piece placement of many positions at once.
+
+  `bitboards` is an `(N, 12)` array from `stack_bitboards()` and `perspective_colors`
+  a color or one color per row. The toggles mirror `evaluate()` for the terms that only
+  depend on piece placement, which are computed with vectorized popcounts and masks and
+  summed in the same order, so each row is exactly what `evaluate()` returns for a
+  non-terminal board with `use_king_safety=False` and `use_mobility=False`. Terminal
+  positions are not detected; `batch_order_evaluate()` and `batch_rollout_evaluate()` add
+  that to match the cheap tiers.
+  """
+  bitboards = np.asarray(bitboards, dtype=np.uint64)
+  if bitboards.ndim != _BATCH_NDIM or bitboards.shape[1] != len(BATCH_COLUMNS):
+    msg = f"Expected an (N, {len(BATCH_COLUMNS)}) bitboard array, got shape {bitboards.shape}"
+    raise ValueError(msg)
+  white_view = np.broadcast_to(np.asarray(perspective_colors, dtype=bool), bitboards.shape[:1])
+  counts = np.bitwise_count(bitboards)
+
+  score = np.zeros(len(bitboards))
+  if use_material:
+    material = np.zeros(len(bitboards))
+    for index, value in enumerate(PIECE_VALUES.values()):
+      material += value * counts[:, index]
+      material -= value * counts[:, 6 + index]
+    score += np.where(white_view, material, -material)
+  if use_piece_squares:
+    piece_squares = _batch_piece_squares(bitboards, counts)
+    score += np.where(white_view, piece_squares, -piece_squares)
+  if use_bishop_pair:
+    bishop_pair = np.zeros(len(bitboards))
+    bishop_pair += np.where(counts[:, 2] >= BISHOP_PAIR_COUNT, _WEIGHTS.bishop_pair, 0.0)
+    bishop_pair -= np.where(counts[:, 8] >= BISHOP_PAIR_COUNT, _WEIGHTS.bishop_pair, 0.0)
+    score += np.where(white_view, bishop_pair, -bishop_pair)
+  if use_passed_pawns:
+    passed_pawns = _batch_passed_pawns(bitboards[:, 0], bitboards[:, 6])
+    score += np.where(white_view, passed_pawns, -passed_pawns)
+  if use_center_extended or use_center_basic:
+    squares = EXTENDED_CENTER if use_center_extended else CENTER4
+    white_attackers, black_attackers = _batch_attacker_counts(bitboards, squares)
+    center = (white_attackers - black_attackers) * _WEIGHTS.center_control
+    score += np.where(white_view, center, -center)
+  return score
+
+
+def batch_order_evaluate(boards: Sequence[Board], perspective_colors: bool | npt.ArrayLike) -> npt.NDArray[np.float64]:
+  """Return `order_evaluate()` of many boards, with the placement terms vectorized."""
+  return _batch_cheap_tier(boards, perspective_colors)
+
+
+def batch_rollout_evaluate(
+  boards: Sequence[Board], perspective_colors: bool | npt.ArrayLike
+) -> npt.NDArray[np.float64]:
+  """Return `rollout_evaluate()` of many boards, with the placement terms vectorized."""
+  return _batch_cheap_tier(boards, perspective_colors)
+
+
+def batch_move_evaluate(board: Board, moves: Iterable[Move]) -> npt.NDArray[np.float64]:
+  """Return `rollout_evaluate()` of every child of a board, from the mover's perspective.
+
+  Each move is pushed only long enough to read its bitboards and check for a terminal
+  position; the placement terms of all children are then scored in one vectorized call.
+  """
+  mover = board.turn
+  rows = []
+  terminals = []
+  for move in moves:
+    board.push(move)
+    try:
+      rows.append(board_bitboards(board))
+      terminals.append(terminal_evaluation(board, mover))
+    finally:
+      board.pop()
+  scores = batch_evaluate(
+    np.array(rows, dtype=np.uint64).reshape(len(rows), len(BATCH_COLUMNS)),
+    mover,
+    use_bishop_pair=False,
+    use_passed_pawns=False,
+    use_center_extended=False,
+    use_piece_squares=True,
+  )
+  for index, terminal in enumerate(terminals):
+    if terminal is not None:
+      scores[index] = terminal
+  return scores
+
+
+def _batch_cheap_tier(boards: Sequence[Board], perspective_colors: bool | npt.ArrayLike) -> npt.NDArray[np.float64]:
+  """Score material plus piece-square tables, overriding terminal boards."""
+  colors = np.broadcast_to(np.asarray(perspective_colors, dtype=bool), (len(boards),))
+  scores = batch_evaluate(
+    stack_bitboards(boards),
+    colors,
+    use_bishop_pair=False,
+    use_passed_pawns=False,
+    use_center_extended=False,
+    use_piece_squares=True,
+  )
+  for index, board in enumerate(boards):
+    terminal = terminal_evaluation(board, bool(colors[index]))
+    if terminal is not None:
+      scores[index] = terminal
+  return scores
+
+
+def _batch_piece_squares(bitboards: npt.NDArray[np.uint64], counts: npt.NDArray[np.uint8]) -> npt.NDArray:
+  """Return the tapered piece-square score of every row from white's view, summed in integer centipawns."""
+  middlegame = np.zeros(len(bitboards), dtype=np.int64)
+  endgame = np.zeros(len(bitboards), dtype=np.int64)
+  for row in range(len(BATCH_COLUMNS)):
+    squares = np.unpackbits(bitboards[:, row].astype("<u8").view(np.uint8).reshape(-1, 8), axis=1, bitorder="little")
+    middlegame += squares @ PST_MG[row].astype(np.int64)
+    endgame += squares @ PST_EG[row].astype(np.int64)
+  phase = np.minimum(counts.astype(np.int64) @ PHASE_BY_ROW.astype(np.int64), MAX_PHASE)
+  return (middlegame * phase + endgame * (MAX_PHASE - phase)) / (MAX_PHASE * CENTIPAWNS_PER_PAWN)
+
+
+def _batch_passed_pawns(white_pawns: npt.NDArray[np.uint64], black_pawns: npt.NDArray[np.uint64]) -> npt.NDArray:
+  """Return `passed_pawn_score(board, chess.WHITE)` for every row, adding pawns in the same order."""
+  score = np.zeros(len(white_pawns))
+  for square in range(chess.A2, chess.A8):
+    passed = (white_pawns & chess.BB_SQUARES[square] != 0) & (black_pawns & PASSED_PAWN_MASKS[chess.WHITE][square] == 0)
+    score += np.where(passed, _WEIGHTS.passed_pawn * (chess.square_rank(square) / 6), 0.0)
+  for square in range(chess.A2, chess.A8):
+    passed = (black_pawns & chess.BB_SQUARES[square] != 0) & (white_pawns & PASSED_PAWN_MASKS[chess.BLACK][square] == 0)
+    score -= np.where(passed, _WEIGHTS.passed_pawn * ((7 - chess.square_rank(square)) / 6), 0.0)
+  return score
+
+
+def _batch_attacker_counts(
+  bitboards: npt.NDArray[np.uint64], squares: Iterable[chess.Square]
+) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]:
+  """Count, per row and color, the attackers of each square summed over `squares`.
+
+  Leapers are masked with the fixed attack tables. Sliders are found by walking each ray
+  out of the square to its first occupied square, as `Board.attackers_mask()` does.
+  """
+  white = [bitboards[:, index] for index in range(6)]
+  black = [bitboards[:, 6 + index] for index in range(6)]
+  occupied = np.bitwise_or.reduce(bitboards, axis=1)
+  white_orthogonal = white[3] | white[4]
+  black_orthogonal = black[3] | black[4]
+  white_diagonal = white[2] | white[4]
+  black_diagonal = black[2] | black[4]
+
+  white_count = np.zeros(len(bitboards), dtype=np.int64)
+  black_count = np.zeros(len(bitboards), dtype=np.int64)
+  for square in squares:
+    white_count += np.bitwise_count(white[0] & chess.BB_PAWN_ATTACKS[chess.BLACK][square])
+    black_count += np.bitwise_count(black[0] & chess.BB_PAWN_ATTACKS[chess.WHITE][square])
+    white_count += np.bitwise_count(white[1] & chess.BB_KNIGHT_ATTACKS[square])
+    black_count += np.bitwise_count(black[1] & chess.BB_KNIGHT_ATTACKS[square])
+    white_count += np.bitwise_count(white[5] & chess.BB_KING_ATTACKS[square])
+    black_count += np.bitwise_count(black[5] & chess.BB_KING_ATTACKS[square])
+    for rays, white_sliders, black_sliders in (
+      (ROOK_RAYS[square], white_orthogonal, black_orthogonal),
+      (BISHOP_RAYS[square], white_diagonal, black_diagonal),
+    ):
+      for ray in rays:
+        blocker = np.zeros(len(bitboards), dtype=np.uint64)
+        for ray_square in ray:
+          blocker |= np.where(blocker == 0, occupied & chess.BB_SQUARES[ray_square], 0)
+        white_count += (white_sliders & blocker) != 0
+        black_count += (black_sliders & blocker) != 0
+  return white_count, black_count
+
+
+if os.environ.get(WEIGHTS_ENV_VAR):
+  set_evaluation_weights(load_weights(os.environ[WEIGHTS_ENV_VAR]))
@@ -3,11 +3,16 @@
 from __future__ import annotations
 
 from collections import defaultdict
+from enum import Enum
 from typing import TYPE_CHECKING
 
-from chesag.evaluation import PIECE_VALUES, mvv_lva_score, order_evaluate
+import chess
+
+from chesag.evaluation import PIECE_VALUES, mvv_lva_score, order_evaluate, static_exchange_evaluation
 
 if TYPE_CHECKING:
+  from collections.abc import Iterator
+
   from chess import Board, Move
 
 TT_MOVE_BONUS = 1_000_000.0
@@ -19,6 +24,16 @@ HISTORY_SCALE = 0.1
 ORDER_TIEBREAK_SCALE = 1.0
 
 
+class MovePickStage(Enum):
+  """Stages of the lazy move picker, in the order they are reached."""
+
+  TT_MOVE = "tt_move"
+  GOOD_CAPTURES = "good_captures"
+  KILLERS = "killers"
+  QUIETS = "quiets"
+  BAD_CAPTURES = "bad_captures"
+
+
 class HeuristicMovePrioritizer:
   """Score and order moves for search algorithms."""
 
@@ -38,6 +53,98 @@ class HeuristicMovePrioritizer:
     """Order moves using cheap tactical and learned heuristics."""
     return sorted(moves, key=lambda move: self.score_move(board, move, depth=depth, tt_move=tt_move), reverse=True)
 
+  def pick_moves(
+    self,
+    board: Board,
+    *,
+    depth: int = 0,
+    tt_move: Move | None = None,
+    noisy_only: bool = False,
+  ) -> Iterator[Move]:
+    """Yield legal moves stage by stage, generating and scoring each stage only when reached.
+
+    Stages follow `MovePickStage`: the TT move, captures and promotions that do not lose
+    material by static exchange evaluation (by MVV-LVA), the killers of `depth`, the
+    remaining quiet moves by history score, and finally the losing captures. Unlike
+    `order_moves()`, no move is pushed to score it, so a search that cuts off after the
+    first few moves never pays for the rest. With `noisy_only`, only captures and
+    promotions are yielded, which is what quiescence needs.
+
+    The board may be pushed and popped between items, but must be back at the same
+    position whenever the iterator is advanced.
+    """
+    for _, move in self.pick_staged_moves(board, depth=depth, tt_move=tt_move, noisy_only=noisy_only):
+      yield move
+
+  def pick_staged_moves(
+    self,
+    board: Board,
+    *,
+    depth: int = 0,
+    tt_move: Move | None = None,
+    noisy_only: bool = False,
+  ) -> Iterator[tuple[MovePickStage, Move]]:
+    """Yield `(stage, move)` pairs in the order used by `pick_moves()`."""
+    picked: set[Move] = set()
+    if (
+      tt_move is not None
+      and tt_move
+      and (not noisy_only or board.is_capture(tt_move) or tt_move.promotion is not None)
+      and board.is_legal(tt_move)
+    ):
+      picked.add(tt_move)
+      yield MovePickStage.TT_MOVE, tt_move
+
+    good_captures: list[Move] = []
+    bad_captures: list[Move] = []
+    for move in self._generate_noisy_moves(board):
+      if move not in picked:
+        (good_captures if static_exchange_evaluation(board, move) >= 0 else bad_captures).append(move)
+    good_captures.sort(key=lambda move: self._noisy_score(board, move), reverse=True)
+    for move in good_captures:
+      yield MovePickStage.GOOD_CAPTURES, move
+    bad_captures.sort(key=lambda move: self._noisy_score(board, move), reverse=True)
+    if noisy_only:
+      for move in bad_captures:
+        yield MovePickStage.BAD_CAPTURES, move
+      return
+
+    for killer in tuple(self.killer_moves.get(depth, ())):
+      if killer not in picked and killer.promotion is None and not board.is_capture(killer) and board.is_legal(killer):
+        picked.add(killer)
+        yield MovePickStage.KILLERS, killer
+
+    quiet_moves = [
+      move
+      for move in board.generate_legal_moves()
+      if move.promotion is None and not board.is_capture(move) and move not in picked
+    ]
+    quiet_moves.sort(key=self.history_score, reverse=True)
+    for move in quiet_moves:
+      yield MovePickStage.QUIETS, move
+    for move in bad_captures:
+      yield MovePickStage.BAD_CAPTURES, move
+
+  @staticmethod
+  def _generate_noisy_moves(board: Board) -> list[Move]:
+    """Return legal captures followed by legal non-capturing promotions."""
+    promotion_rank = chess.BB_RANK_7 if board.turn == chess.WHITE else chess.BB_RANK_2
+    promoting_pawns = board.pawns & board.occupied_co[board.turn] & promotion_rank
+    moves = list(board.generate_legal_captures())
+    if promoting_pawns:
+      moves.extend(board.generate_legal_moves(promoting_pawns, chess.BB_ALL & ~board.occupied))
+    return moves
+
+  @staticmethod
+  def _noisy_score(board: Board, move: Move) -> float:
+    """Score a capture or promotion with the same tactical terms as `score_move()`."""
+    score = 0.0
+    if move.promotion is not None:
+      score += PROMOTION_BONUS + PIECE_VALUES[move.promotion]
+    if board.is_capture(move):
+      score += CAPTURE_BONUS + mvv_lva_score(board, move)
+    return score
+
   @staticmethod
   def evaluate_move(move: Move, board: Board) -> float:
     """Return a cheap static score for a single move."""
@@ -88,6 +195,14 @@ class HeuristicMovePrioritizer:
     killers.insert(0, move)
     del killers[2:]
 
+  def is_killer(self, move: Move, depth: int) -> bool:
+    """Return whether a move is one of the killer moves stored for a ply."""
+    return move in self.killer_moves.get(depth, ())
+
+  def history_score(self, move: Move) -> int:
+    """Return the accumulated history score of a move."""
+    return self.history_heuristic.get(self._history_key(move), 0)
+
   @staticmethod
   def _history_key(move: Move) -> tuple[int, int, int | None]:
     return move.from_square, move.to_square, move.promotion
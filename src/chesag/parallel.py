@@ -2,36 +2,172 @@
 
 from __future__ import annotations
 
-from concurrent.futures import ProcessPoolExecutor, as_completed
-from typing import TYPE_CHECKING
+import multiprocessing
+import os
+import sys
+from concurrent.futures import FIRST_COMPLETED, Executor, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from enum import Enum
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Self
 
 if TYPE_CHECKING:
-  from collections.abc import Callable
+  from collections.abc import Callable, Iterable, Iterator
+  from concurrent.futures import Future
+
+
+class ParallelMode(Enum):
+  """Kind of worker pool a parallel search runs its work on."""
+
+  THREAD = "thread"
+  PROCESS = "process"
+
+
+def gil_enabled() -> bool:
+  """Return whether the interpreter runs with the global interpreter lock."""
+  is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+  return True if is_gil_enabled is None else is_gil_enabled()
+
+
+def default_parallel_mode() -> ParallelMode:
+  """Return threads on free-threaded builds and processes while the GIL serializes Python code."""
+  return ParallelMode.PROCESS if gil_enabled() else ParallelMode.THREAD
+
+
+def create_executor(
+  mode: ParallelMode,
+  max_workers: int,
+  initializer: Callable[..., object] | None = None,
+  initargs: tuple = (),
+) -> Executor:
+  """Create a thread or process pool whose workers each run `initializer(*initargs)` once.
+
+  Worker processes are started by a fork server where the platform has one, since
+  forking a process that already runs threads can deadlock the child.
+  """
+  if mode is ParallelMode.THREAD:
+    return ThreadPoolExecutor(max_workers=max_workers, initializer=initializer, initargs=initargs)
+  context = (
+    multiprocessing.get_context("forkserver") if "forkserver" in multiprocessing.get_all_start_methods() else None
+  )
+  return ProcessPoolExecutor(max_workers=max_workers, mp_context=context, initializer=initializer, initargs=initargs)
+
+
+def _run_chunk(worker_func: Callable[[Any], Any], chunk: list) -> list:
+  """Run a worker function over one chunk of arguments inside a worker."""
+  return [worker_func(args) for args in chunk]
+
+
+def _chunks(worker_args: Iterable, chunksize: int) -> Iterator[list]:
+  """Split arguments into lists of up to `chunksize`, reading only as far as each chunk needs."""
+  iterator = iter(worker_args)
+  while chunk := list(islice(iterator, chunksize)):
+    yield chunk
 
 
 class ParallelWorkerManager:
-  """Manages parallel worker execution for MCTS."""
+  """Long-lived pool of worker threads or processes, shared by every call made through it.
+
+  The pool starts on first use, or on entering the manager as a context manager, and
+  keeps its workers until `shutdown()`, so each worker runs `initializer(*initargs)`
+  once, typically to build the agents or evaluators it needs, instead of paying process
+  startup and imports on every call. A manager that was shut down starts a new pool the
+  next time it is used.
+  """
+
+  def __init__(
+    self,
+    max_workers: int | None = None,
+    *,
+    mode: ParallelMode = ParallelMode.PROCESS,
+    initializer: Callable[..., object] | None = None,
+    initargs: tuple = (),
+  ) -> None:
+    """Configure the pool; `max_workers` defaults to the number of CPUs."""
+    self.max_workers = max_workers or os.cpu_count() or 1
+    self.mode = mode
+    self.initializer = initializer
+    self.initargs = initargs
+    self._executor: Executor | None = None
+
+  @property
+  def running(self) -> bool:
+    """Return whether the pool has been started and not shut down."""
+    return self._executor is not None
+
+  def start(self) -> Executor:
+    """Start the pool if needed and return its executor."""
+    if self._executor is None:
+      self._executor = create_executor(self.mode, self.max_workers, self.initializer, self.initargs)
+    return self._executor
+
+  def submit[T](self, worker_func: Callable[..., T], /, *args: object) -> Future[T]:
+    """Schedule one call on the pool."""
+    return self.start().submit(worker_func, *args)
+
+  def stream[T](self, worker_func: Callable[[Any], T], worker_args: Iterable, *, chunksize: int = 1) -> Iterator[T]:
+    """Run `worker_func` on every argument and yield the results as their chunks complete.
+
+    Arguments are sent to the workers `chunksize` at a time, which saves one round trip
+    per argument for short calls. `worker_args` is read lazily: about two chunks per
+    worker are in flight at once, and another is submitted as each one completes, so
+    long or unbounded inputs are never held in memory. Chunks still pending are
+    cancelled if the caller stops iterating early.
+    """
+    if chunksize < 1:
+      msg = "chunksize must be at least 1"
+      raise ValueError(msg)
+    return self._stream_chunks(worker_func, _chunks(worker_args, chunksize))
+
+  def _stream_chunks[T](self, worker_func: Callable[[Any], T], chunks: Iterator[list]) -> Iterator[T]:
+    """Keep a bounded number of chunks in flight and yield their results as they complete."""
+    pending: set[Future[list[T]]] = set()
+    try:
+      pending.update(self.submit(_run_chunk, worker_func, chunk) for chunk in islice(chunks, 2 * self.max_workers))
+      while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+          chunk = next(chunks, None)
+          if chunk is not None:
+            pending.add(self.submit(_run_chunk, worker_func, chunk))
+          yield from future.result()
+    finally:
+      for future in pending:
+        future.cancel()
+
+  def collect[T](self, worker_func: Callable[[Any], T], worker_args: Iterable, *, chunksize: int = 1) -> list[T]:
+    """Execute work on the pool and collect the non-empty results in completion order."""
+    return [result for result in self.stream(worker_func, worker_args, chunksize=chunksize) if result]
 
   @staticmethod
   def execute_parallel_work(worker_func: Callable, worker_args: list, max_workers: int | None = None) -> list:
-    """Execute work in parallel and collect results."""
+    """Execute work on a temporary process pool and collect the non-empty results in completion order.
+
+    The pool is shut down before this returns; use `collect()` on a manager to keep the
+    workers between calls. A single argument is run in this process.
+    """
     if not worker_args:
       return []
 
     if len(worker_args) == 1:
       return [worker_func(worker_args[0])]
 
-    results = []
-    actual_workers = min(len(worker_args), max_workers or len(worker_args))
+    with ParallelWorkerManager(min(len(worker_args), max_workers or len(worker_args))) as workers:
+      return workers.collect(worker_func, worker_args)
+
+  def shutdown(self, *, cancel_futures: bool = False) -> None:
+    """Stop the pool, waiting for running calls, if it was started."""
+    if self._executor is not None:
+      self._executor.shutdown(cancel_futures=cancel_futures)
+      self._executor = None
 
-    with ProcessPoolExecutor(max_workers=actual_workers) as executor:
-      futures = [executor.submit(worker_func, args) for args in worker_args]
-      for future in as_completed(futures):
-        result = future.result()
-        if result:
-          results.append(result)
+  def __enter__(self) -> Self:
+    """Start the pool."""
+    self.start()
+    return self
 
-    return results
+  def __exit__(self, *exc_info: object) -> None:
+    """Shut the pool down."""
+    self.shutdown()
 
   @staticmethod
   def distribute_simulations(total_sims: int, num_workers: int) -> list[int]:
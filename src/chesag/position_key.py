@@ -2,16 +2,50 @@
 
 from __future__ import annotations
 
+from enum import Enum
 from typing import TYPE_CHECKING, cast
 
+import chess
+import numpy as np
+
 if TYPE_CHECKING:
-  from chess import Board
+  from chess import Board, Move
+
+type PositionKey = tuple[object, ...] | int
+type KeyState = tuple[int, ...]
+
+ZOBRIST_SEED = 0x5EED_C4E5
+_EMPTY_EP_SQUARE = -1
+# A white-to-move empty board hashes to zero, so full hashes are deltas from this state.
+_EMPTY_KEY_STATE: KeyState = (0, 0, 0, 0, 0, 0, 0, 0, 0, _EMPTY_EP_SQUARE, int(chess.WHITE))
+
+
+class PositionKeyMode(Enum):
+  """Representation used for transposition keys."""
+
+  TUPLE = "tuple"
+  ZOBRIST = "zobrist"
+
 
-type PositionKey = tuple[object, ...]
+def _zobrist_tables() -> tuple[tuple[tuple[int, ...], ...], tuple[int, ...], tuple[int, ...], int]:
+  """Return fixed 64-bit random tables so keys stay stable across runs and persisted caches."""
+  rng = np.random.default_rng(ZOBRIST_SEED)
+  raw = rng.integers(0, np.iinfo(np.uint64).max, size=12 * 64 + 64 + 64 + 1, dtype=np.uint64)
+  values = [int(value) for value in raw]
+  pieces = tuple(tuple(values[index * 64 : (index + 1) * 64]) for index in range(12))
+  castling = tuple(values[12 * 64 : 13 * 64])
+  en_passant = tuple(values[13 * 64 : 14 * 64])
+  return pieces, castling, en_passant, values[-1]
 
 
-def build_position_key(board: Board) -> PositionKey:
+# Piece keys are indexed by `(piece_type - 1) * 2 + color_index`, where white is 0 and black is 1.
+ZOBRIST_PIECE_KEYS, ZOBRIST_CASTLING_KEYS, ZOBRIST_EP_KEYS, ZOBRIST_BLACK_TO_MOVE_KEY = _zobrist_tables()
+
+
+def build_position_key(board: Board, mode: PositionKeyMode = PositionKeyMode.TUPLE) -> PositionKey:
   """Return a compact key that distinguishes all chess state relevant to search."""
+  if mode is PositionKeyMode.ZOBRIST:
+    return zobrist_hash(board)
   return cast(
     "PositionKey",
     (
@@ -21,3 +55,88 @@ def build_position_key(board: Board) -> PositionKey:
       board.ep_square,
     ),
   )
+
+
+def key_state(board: Board) -> KeyState:
+  """Return the raw bitboard state that a Zobrist key is derived from."""
+  return (
+    board.pawns,
+    board.knights,
+    board.bishops,
+    board.rooks,
+    board.queens,
+    board.kings,
+    board.occupied_co[chess.WHITE],
+    board.occupied_co[chess.BLACK],
+    board.clean_castling_rights(),
+    _EMPTY_EP_SQUARE if board.ep_square is None else board.ep_square,
+    int(board.turn),
+  )
+
+
+def zobrist_hash(board: Board) -> int:
+  """Return the full 64-bit Zobrist key of a board.
+
+  The key covers the same state as the tuple key: piece placement, side to move,
+  clean castling rights, and the raw en-passant square.
+  """
+  return zobrist_delta(_EMPTY_KEY_STATE, key_state(board))
+
+
+def zobrist_delta(before: KeyState, after: KeyState) -> int:
+  """Return the value to XOR into a key when the board moves from `before` to `after`."""
+  delta = 0
+  for type_index in range(6):
+    for color_index in range(2):
+      changed = (before[type_index] & before[6 + color_index]) ^ (after[type_index] & after[6 + color_index])
+      if changed:
+        piece_keys = ZOBRIST_PIECE_KEYS[type_index * 2 + color_index]
+        for square in chess.scan_forward(changed):
+          delta ^= piece_keys[square]
+
+  changed_castling = before[8] ^ after[8]
+  if changed_castling:
+    for square in chess.scan_forward(changed_castling):
+      delta ^= ZOBRIST_CASTLING_KEYS[square]
+
+  if before[9] != after[9]:
+    if before[9] != _EMPTY_EP_SQUARE:
+      delta ^= ZOBRIST_EP_KEYS[before[9]]
+    if after[9] != _EMPTY_EP_SQUARE:
+      delta ^= ZOBRIST_EP_KEYS[after[9]]
+
+  if before[10] != after[10]:
+    delta ^= ZOBRIST_BLACK_TO_MOVE_KEY
+  return delta
+
+
+class ZobristKeyStack:
+  """Zobrist keys maintained incrementally alongside a board that is searched by push/pop."""
+
+  def __init__(self, board: Board | None = None) -> None:
+    """Initialize the stack, optionally rooted at a board."""
+    self._keys: list[int] = [zobrist_hash(board) if board is not None else 0]
+
+  def reset(self, board: Board) -> None:
+    """Discard all pushed keys and re-root the stack at a board."""
+    self._keys = [zobrist_hash(board)]
+
+  @property
+  def current(self) -> int:
+    """Return the key of the current board."""
+    return self._keys[-1]
+
+  def push(self, board: Board, move: Move) -> None:
+    """Push a move on the board and derive the new key from the changed bitboards."""
+    before = key_state(board)
+    board.push(move)
+    self._keys.append(self._keys[-1] ^ zobrist_delta(before, key_state(board)))
+
+  def pop(self, board: Board) -> Move:
+    """Pop the last move from the board and restore the previous key."""
+    self._keys.pop()
+    return board.pop()
+
+  def __len__(self) -> int:
+    """Return the number of keys on the stack, including the root."""
+    return len(self._keys)
@@ -0,0 +1,241 @@
+"""Transposition-table storage for alpha-beta search."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from enum import Enum, auto
+from typing import TYPE_CHECKING, cast
+
+import numpy as np
+from chess import Move
+
+if TYPE_CHECKING:
+  from chesag.position_key import PositionKey
+
+TT_BUCKET_SIZE = 4
+BYTES_PER_MB = 1024 * 1024
+_EMPTY_BOUND = 0
+_GENERATION_MASK = 0xFF
+_SQUARE_BITS = 6
+_SQUARE_MASK = 0x3F
+
+TT_SLOT_DTYPE = np.dtype([
+  ("key", np.uint64),
+  ("score", np.float64),
+  ("depth", np.int16),
+  ("move", np.uint16),
+  ("bound", np.uint8),
+  ("generation", np.uint8),
+])
+
+
+class Bound(Enum):
+  """Bound type stored in the transposition table."""
+
+  EXACT = auto()
+  LOWER = auto()
+  UPPER = auto()
+
+
+@dataclass(slots=True)
+class TTEntry:
+  """Transposition-table entry."""
+
+  depth: int
+  score: float
+  bound: Bound
+  best_move: Move | None
+
+
+class ReplacementPolicy(Enum):
+  """How a full bucket chooses the slot to overwrite."""
+
+  DEPTH_PREFERRED = "depth"
+  ALWAYS_REPLACE = "always"
+
+
+@dataclass(slots=True)
+class TranspositionTableStats:
+  """Occupancy and replacement counters for a fixed-size table."""
+
+  capacity: int = 0
+  filled: int = 0
+  stores: int = 0
+  overwrites: int = 0
+  collisions: int = 0
+
+  @property
+  def fill_rate(self) -> float:
+    """Return the fraction of occupied slots."""
+    return self.filled / self.capacity if self.capacity else 0.0
+
+  def as_dict(self) -> dict[str, int | float]:
+    """Return a stable dict view for logging and tests."""
+    return {
+      "capacity": self.capacity,
+      "filled": self.filled,
+      "fill_rate": self.fill_rate,
+      "stores": self.stores,
+      "overwrites": self.overwrites,
+      "collisions": self.collisions,
+    }
+
+
+def pack_move(move: Move | None) -> int:
+  """Pack a move into 15 bits; `0` encodes no move."""
+  if move is None or not move:
+    return 0
+  return move.from_square | (move.to_square << _SQUARE_BITS) | ((move.promotion or 0) << (2 * _SQUARE_BITS))
+
+
+def unpack_move(packed: int) -> Move | None:
+  """Invert `pack_move()`."""
+  if packed == 0:
+    return None
+  promotion = packed >> (2 * _SQUARE_BITS)
+  return Move(packed & _SQUARE_MASK, (packed >> _SQUARE_BITS) & _SQUARE_MASK, promotion=promotion or None)
+
+
+class ArrayTranspositionTable:
+  """Bucketed, power-of-two sized transposition table backed by a NumPy structured array.
+
+  Keys must be 64-bit Zobrist keys. Each bucket holds `bucket_size` slots; a probe only
+  scans the bucket selected by the low bits of the key, so memory use is fixed by the
+  budget given at construction time.
+  """
+
+  def __init__(
+    self,
+    memory_mb: float,
+    *,
+    policy: ReplacementPolicy = ReplacementPolicy.DEPTH_PREFERRED,
+    bucket_size: int = TT_BUCKET_SIZE,
+  ) -> None:
+    """Allocate the largest power-of-two bucket count that fits the memory budget."""
+    if memory_mb <= 0:
+      msg = "Transposition table memory budget must be positive"
+      raise ValueError(msg)
+    budget_slots = int(memory_mb * BYTES_PER_MB) // TT_SLOT_DTYPE.itemsize
+    num_buckets = 1 << max(0, (budget_slots // bucket_size).bit_length() - 1)
+    self.policy = policy
+    self.bucket_size = bucket_size
+    self._bucket_mask = num_buckets - 1
+    self._slots = np.zeros(num_buckets * bucket_size, dtype=TT_SLOT_DTYPE)
+    self._keys = self._slots["key"]
+    self._scores = self._slots["score"]
+    self._depths = self._slots["depth"]
+    self._moves = self._slots["move"]
+    self._bounds = self._slots["bound"]
+    self._generations = self._slots["generation"]
+    self._generation = 0
+    self._stats = TranspositionTableStats(capacity=len(self._slots))
+
+  @property
+  def capacity(self) -> int:
+    """Return the number of slots in the table."""
+    return len(self._slots)
+
+  @property
+  def nbytes(self) -> int:
+    """Return the size of the slot storage in bytes."""
+    return self._slots.nbytes
+
+  @property
+  def stats(self) -> TranspositionTableStats:
+    """Return a snapshot of the occupancy and replacement counters."""
+    stats = self._stats
+    return TranspositionTableStats(
+      capacity=stats.capacity,
+      filled=stats.filled,
+      stores=stats.stores,
+      overwrites=stats.overwrites,
+      collisions=stats.collisions,
+    )
+
+  def new_search(self) -> None:
+    """Advance the generation so entries from earlier searches age out first."""
+    self._generation = (self._generation + 1) & _GENERATION_MASK
+
+  def clear(self) -> None:
+    """Drop every entry and reset the counters."""
+    self._slots.fill(0)
+    self._generation = 0
+    self._stats = TranspositionTableStats(capacity=len(self._slots))
+
+  def get(self, key: PositionKey) -> TTEntry | None:
+    """Return the entry stored for a key, if it is still in the table."""
+    index = self._find(cast("int", key))
+    if index is None:
+      return None
+    self._generations[index] = self._generation
+    return TTEntry(
+      depth=int(self._depths[index]),
+      score=float(self._scores[index]),
+      bound=Bound(int(self._bounds[index])),
+      best_move=unpack_move(int(self._moves[index])),
+    )
+
+  def __setitem__(self, key: PositionKey, entry: TTEntry) -> None:
+    """Store an entry, evicting a bucket neighbour according to the replacement policy."""
+    int_key = cast("int", key)
+    base = (int_key & self._bucket_mask) * self.bucket_size
+    bucket_keys = self._keys[base : base + self.bucket_size].tolist()
+    bucket_bounds = self._bounds[base : base + self.bucket_size].tolist()
+
+    target = None
+    for offset, (slot_key, bound) in enumerate(zip(bucket_keys, bucket_bounds, strict=True)):
+      if bound == _EMPTY_BOUND:
+        if target is None:
+          target = base + offset
+      elif slot_key == int_key:
+        target = base + offset
+        break
+    else:
+      if target is None:
+        self._stats.collisions += 1
+        target = self._select_victim(base, entry.depth)
+        if target is None:
+          return
+        self._stats.overwrites += 1
+      else:
+        self._stats.filled += 1
+
+    self._stats.stores += 1
+    self._keys[target] = int_key
+    self._scores[target] = entry.score
+    self._depths[target] = entry.depth
+    self._moves[target] = pack_move(entry.best_move)
+    self._bounds[target] = entry.bound.value
+    self._generations[target] = self._generation
+
+  def __contains__(self, key: object) -> bool:
+    """Return whether an integer key is currently stored."""
+    return isinstance(key, int) and self._find(key) is not None
+
+  def __len__(self) -> int:
+    """Return the number of occupied slots."""
+    return self._stats.filled
+
+  def _find(self, key: int) -> int | None:
+    base = (key & self._bucket_mask) * self.bucket_size
+    bucket_keys = self._keys[base : base + self.bucket_size].tolist()
+    for offset, slot_key in enumerate(bucket_keys):
+      if slot_key == key and self._bounds[base + offset] != _EMPTY_BOUND:
+        return base + offset
+    return None
+
+  def _select_victim(self, base: int, depth: int) -> int | None:
+    """Return the slot to overwrite in a full bucket, or `None` to keep the bucket as is."""
+    depths = self._depths[base : base + self.bucket_size].tolist()
+    ages = [
+      (self._generation - generation) & _GENERATION_MASK
+      for generation in self._generations[base : base + self.bucket_size].tolist()
+    ]
+    if self.policy is ReplacementPolicy.ALWAYS_REPLACE:
+      offset = max(range(self.bucket_size), key=lambda index: (ages[index], -depths[index]))
+      return base + offset
+
+    offset = min(range(self.bucket_size), key=lambda index: (ages[index] == 0, depths[index]))
+    if ages[offset] == 0 and depths[offset] > depth:
+      return None
+    return base + offset
@@ -0,0 +1,349 @@
+"""Texel-style tuning of the evaluation weights from game records.
+
+Every evaluation term weighted by `EvaluationWeights` is linear in its weight, so the
+leaf evaluation of a quiet, non-terminal position is the dot product of a feature row
+with the weight vector. `extract_features()` streams PGN files once into a feature
+matrix and a vector of game outcomes, and `tune_weights()` fits the weights by
+minimizing the logistic loss between `sigmoid(scale * features @ weights)` and the
+outcomes with vectorized gradient descent.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field, fields
+from pathlib import Path
+from typing import TYPE_CHECKING, TextIO
+
+import chess
+import chess.pgn
+import numpy as np
+import numpy.typing as npt
+
+from chesag.evaluation import (
+  BISHOP_PAIR_COUNT,
+  EXTENDED_CENTER_MASK,
+  KING_FILE_MASKS,
+  KING_SHIELD_MASKS,
+  PASSED_PAWN_MASKS,
+  EvaluationWeights,
+  attack_maps,
+  get_evaluation_weights,
+  material_signature,
+)
+
+if TYPE_CHECKING:
+  from collections.abc import Collection, Iterable, Iterator
+
+  from chess import Board
+
+FEATURE_NAMES = tuple(weight.name for weight in fields(EvaluationWeights))
+GAME_OUTCOMES = {"1-0": 1.0, "0-1": 0.0, "1/2-1/2": 0.5}
+DEFAULT_SKIP_PLIES = 8
+DEFAULT_CHUNK_SIZE = 1 << 16
+DEFAULT_EPOCHS = 500
+DEFAULT_LEARNING_RATE = 0.01
+SCALE_BOUNDS = (0.05, 10.0)
+SCALE_TOLERANCE = 1e-4
+_ADAM_BETAS = (0.9, 0.999)
+_ADAM_EPSILON = 1e-8
+_GOLDEN_RATIO = (math.sqrt(5) - 1) / 2
+
+
+@dataclass(slots=True)
+class TuningData:
+  """Feature rows of sampled positions and the outcome of the game each came from.
+
+  `features` has one column per name in `FEATURE_NAMES`, from white's point of view, and
+  `outcomes` holds 1.0, 0.5 or 0.0 for a white win, draw or black win.
+  """
+
+  features: npt.NDArray[np.float64]
+  outcomes: npt.NDArray[np.float64]
+
+  def __len__(self) -> int:
+    """Return the number of positions."""
+    return len(self.outcomes)
+
+  def save(self, path: str | Path) -> None:
+    """Write the matrix to a compressed `.npz` file so extraction only runs once."""
+    np.savez_compressed(path, features=self.features, outcomes=self.outcomes)
+
+  @classmethod
+  def load(cls, path: str | Path) -> TuningData:
+    """Read a matrix written by `save()`."""
+    with np.load(path) as archive:
+      return cls(features=archive["features"], outcomes=archive["outcomes"])
+
+
+@dataclass(slots=True)
+class TuningResult:
+  """Fitted weights and how the loss moved while fitting them."""
+
+  weights: EvaluationWeights
+  scale: float
+  initial_loss: float
+  final_loss: float
+  epochs: int
+  positions: int
+  losses: list[float] = field(default_factory=list)
+
+  def as_dict(self) -> dict[str, object]:
+    """Return a stable dict view for logging and tests."""
+    return {
+      "weights": self.weights.as_dict(),
+      "scale": self.scale,
+      "initial_loss": self.initial_loss,
+      "final_loss": self.final_loss,
+      "epochs": self.epochs,
+      "positions": self.positions,
+    }
+
+
+def position_features(board: Board) -> npt.NDArray[np.float64]:
+  """Return the feature row of a board, in `FEATURE_NAMES` order and from white's view.
+
+  With the current weights, `position_features(board) @ weights_vector()` equals
+  `evaluate(board, chess.WHITE)` up to rounding for every non-terminal board.
+  """
+  signature = material_signature(board)
+  attacks = attack_maps(board)
+  white_pawns = board.pawns & board.occupied_co[chess.WHITE]
+  black_pawns = board.pawns & board.occupied_co[chess.BLACK]
+  passed = sum(
+    chess.square_rank(square) / 6
+    for square in chess.scan_forward(white_pawns)
+    if not PASSED_PAWN_MASKS[chess.WHITE][square] & black_pawns
+  ) - sum(
+    (7 - chess.square_rank(square)) / 6
+    for square in chess.scan_forward(black_pawns)
+    if not PASSED_PAWN_MASKS[chess.BLACK][square] & white_pawns
+  )
+  castling = (
+    board.has_kingside_castling_rights(chess.WHITE)
+    + board.has_queenside_castling_rights(chess.WHITE)
+    - board.has_kingside_castling_rights(chess.BLACK)
+    - board.has_queenside_castling_rights(chess.BLACK)
+  )
+  white_files, white_shield = _king_cover(board, chess.WHITE)
+  black_files, black_shield = _king_cover(board, chess.BLACK)
+  return np.array(
+    [
+      *(signature[index] - signature[index + 6] for index in range(5)),
+      (signature[2] >= BISHOP_PAIR_COUNT) - (signature[8] >= BISHOP_PAIR_COUNT),
+      passed,
+      attacks.white.count(EXTENDED_CENTER_MASK) - attacks.black.count(EXTENDED_CENTER_MASK),
+      castling,
+      white_files - black_files,
+      white_shield - black_shield,
+      _legal_move_count(board, chess.WHITE) - _legal_move_count(board, chess.BLACK),
+    ],
+    dtype=np.float64,
+  )
+
+
+def _king_cover(board: Board, color: bool) -> tuple[int, int]:
+  """Return how many files next to a king lack own pawns, and how many shield squares are empty of them."""
+  king_square = board.king(color)
+  if king_square is None:
+    return 0, 0
+  own_pawns = board.pawns & board.occupied_co[color]
+  open_files = sum(not own_pawns & file_mask for file_mask in KING_FILE_MASKS[king_square])
+  missing_shield = sum(not own_pawns & shield_mask for shield_mask in KING_SHIELD_MASKS[color][king_square])
+  return open_files, missing_shield
+
+
+def _legal_move_count(board: Board, color: bool) -> int:
+  """Count the legal moves of one side by handing it the move, like `mobility_score()`."""
+  turn = board.turn
+  try:
+    board.turn = color
+    return board.legal_moves.count()
+  finally:
+    board.turn = turn
+
+
+def weights_vector(weights: EvaluationWeights | None = None) -> npt.NDArray[np.float64]:
+  """Return weights as a vector in `FEATURE_NAMES` order, defaulting to the weights in use."""
+  values = (weights or get_evaluation_weights()).as_dict()
+  return np.array([values[name] for name in FEATURE_NAMES], dtype=np.float64)
+
+
+def iter_pgn_positions(
+  handle: TextIO,
+  *,
+  skip_plies: int = DEFAULT_SKIP_PLIES,
+  sample_every: int = 1,
+  max_games: int | None = None,
+) -> Iterator[tuple[Board, float]]:
+  """Yield `(board, outcome)` for the quiet positions of every decided game in a PGN stream.
+
+  Games are read one at a time and only their main line is replayed, on a single board
+  that is yielded in place; copy it to keep a position past the next iteration. The
+  first `skip_plies` plies of each game are skipped, then one ply in `sample_every` is
+  kept unless the side to move is in check or the game is over. Games without a
+  `1-0`, `0-1` or `1/2-1/2` result are ignored.
+  """
+  games = 0
+  while max_games is None or games < max_games:
+    game = chess.pgn.read_game(handle)
+    if game is None:
+      return
+    games += 1
+    outcome = GAME_OUTCOMES.get(game.headers.get("Result", "*"))
+    if outcome is None:
+      continue
+    board = game.board()
+    for ply, move in enumerate(game.mainline_moves(), start=1):
+      board.push(move)
+      if ply < skip_plies or (ply - skip_plies) % sample_every:
+        continue
+      if board.is_check() or board.is_game_over(claim_draw=False):
+        continue
+      yield board, outcome
+
+
+def extract_features(
+  sources: Iterable[str | Path | TextIO],
+  *,
+  skip_plies: int = DEFAULT_SKIP_PLIES,
+  sample_every: int = 1,
+  max_positions: int | None = None,
+  chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> TuningData:
+  """Stream PGN files or text streams into a feature matrix.
+
+  Only the feature rows are kept: each position is turned into a row as soon as it is
+  reached, and rows are written into preallocated chunks of `chunk_size` rows that are
+  concatenated once at the end.
+  """
+  chunks: list[npt.NDArray[np.float64]] = []
+  outcome_chunks: list[npt.NDArray[np.float64]] = []
+  features = np.empty((chunk_size, len(FEATURE_NAMES)), dtype=np.float64)
+  outcomes = np.empty(chunk_size, dtype=np.float64)
+  filled = 0
+  total = 0
+  for source in sources:
+    for board, outcome in _source_positions(source, skip_plies=skip_plies, sample_every=sample_every):
+      features[filled] = position_features(board)
+      outcomes[filled] = outcome
+      filled += 1
+      total += 1
+      if filled == chunk_size:
+        chunks.append(features)
+        outcome_chunks.append(outcomes)
+        features = np.empty_like(features)
+        outcomes = np.empty_like(outcomes)
+        filled = 0
+      if max_positions is not None and total >= max_positions:
+        break
+    if max_positions is not None and total >= max_positions:
+      break
+  chunks.append(features[:filled])
+  outcome_chunks.append(outcomes[:filled])
+  return TuningData(features=np.concatenate(chunks), outcomes=np.concatenate(outcome_chunks))
+
+
+def _source_positions(
+  source: str | Path | TextIO, *, skip_plies: int, sample_every: int
+) -> Iterator[tuple[Board, float]]:
+  """Yield the sampled positions of one PGN path or already open text stream."""
+  if not isinstance(source, str | Path):
+    yield from iter_pgn_positions(source, skip_plies=skip_plies, sample_every=sample_every)
+    return
+  with Path(source).open(encoding="utf-8") as handle:
+    yield from iter_pgn_positions(handle, skip_plies=skip_plies, sample_every=sample_every)
+
+
+def logistic_loss(
+  features: npt.NDArray[np.float64], outcomes: npt.NDArray[np.float64], weights: npt.NDArray[np.float64], scale: float
+) -> float:
+  """Return the mean cross-entropy between the outcomes and `sigmoid(scale * features @ weights)`."""
+  logits = scale * (features @ weights)
+  return float(np.mean(np.logaddexp(0.0, logits) - outcomes * logits))
+
+
+def fit_scale(data: TuningData, weights: EvaluationWeights | None = None) -> float:
+  """Return the sigmoid scale that minimizes the loss of fixed weights, by golden-section search.
+
+  The scale and the weights are only determined up to a common factor, so Texel tuning
+  fixes the scale for the current weights first and then tunes the weights alone.
+  """
+  vector = weights_vector(weights)
+  scores = data.features @ vector
+  low, high = SCALE_BOUNDS
+  while high - low > SCALE_TOLERANCE:
+    left = high - _GOLDEN_RATIO * (high - low)
+    right = low + _GOLDEN_RATIO * (high - low)
+    left_loss = float(np.mean(np.logaddexp(0.0, left * scores) - data.outcomes * left * scores))
+    right_loss = float(np.mean(np.logaddexp(0.0, right * scores) - data.outcomes * right * scores))
+    if left_loss < right_loss:
+      high = right
+    else:
+      low = left
+  return (low + high) / 2
+
+
+def tune_weights(
+  data: TuningData,
+  *,
+  initial: EvaluationWeights | None = None,
+  scale: float | None = None,
+  epochs: int = DEFAULT_EPOCHS,
+  learning_rate: float = DEFAULT_LEARNING_RATE,
+  batch_size: int | None = None,
+  frozen: Collection[str] = ("pawn",),
+  seed: int = 0,
+) -> TuningResult:
+  """Fit the evaluation weights to game outcomes with Adam on the logistic loss.
+
+  Each epoch takes one full-batch step, or one step per shuffled mini-batch of
+  `batch_size` rows. The gradient of the whole batch is a single matrix product. Weights
+  named in `frozen` keep their initial values; freezing the pawn keeps scores in pawns,
+  which the search margins assume. Without `scale`, it is fitted to the initial weights
+  with `fit_scale()` first.
+  """
+  if not len(data):
+    msg = "Cannot tune weights without positions"
+    raise ValueError(msg)
+  unknown = set(frozen) - set(FEATURE_NAMES)
+  if unknown:
+    msg = f"Unknown evaluation weights: {', '.join(sorted(unknown))}"
+    raise ValueError(msg)
+
+  initial = initial or get_evaluation_weights()
+  scale = fit_scale(data, initial) if scale is None else scale
+  weights = weights_vector(initial)
+  trainable = np.array([name not in frozen for name in FEATURE_NAMES], dtype=np.float64)
+  first_moment = np.zeros_like(weights)
+  second_moment = np.zeros_like(weights)
+  beta1, beta2 = _ADAM_BETAS
+  rng = np.random.default_rng(seed)
+  batch_size = batch_size or len(data)
+  losses = [logistic_loss(data.features, data.outcomes, weights, scale)]
+  step = 0
+  for _ in range(epochs):
+    order = rng.permutation(len(data)) if batch_size < len(data) else None
+    for start in range(0, len(data), batch_size):
+      rows = slice(start, start + batch_size) if order is None else order[start : start + batch_size]
+      features = data.features[rows]
+      logits = scale * (features @ weights)
+      predictions = 0.5 * (1.0 + np.tanh(logits / 2))
+      gradient = scale * (features.T @ (predictions - data.outcomes[rows])) / len(features) * trainable
+      step += 1
+      first_moment = beta1 * first_moment + (1 - beta1) * gradient
+      second_moment = beta2 * second_moment + (1 - beta2) * gradient**2
+      corrected_first = first_moment / (1 - beta1**step)
+      corrected_second = second_moment / (1 - beta2**step)
+      weights -= learning_rate * corrected_first / (np.sqrt(corrected_second) + _ADAM_EPSILON)
+    losses.append(logistic_loss(data.features, data.outcomes, weights, scale))
+
+  return TuningResult(
+    weights=EvaluationWeights.from_dict(dict(zip(FEATURE_NAMES, weights.tolist(), strict=True))),
+    scale=scale,
+    initial_loss=losses[0],
+    final_loss=losses[-1],
+    epochs=epochs,
+    positions=len(data),
+    losses=losses,
+  )
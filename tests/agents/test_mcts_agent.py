@@ -1,11 +1,25 @@
+import threading
+import warnings
+
 import chess
+import numpy as np
 import pytest
+from cachetools import LRUCache
 
 from chesag.agents.mcts.agent import MCTSAgent, MCTSConfig
-from chesag.agents.mcts.algorithm import MCTSSearcher
+from chesag.agents.mcts.algorithm import MCTSSearcher, ParallelStrategy, init_rollout_worker
 from chesag.agents.mcts.node import Node
+from chesag.agents.mcts.tree import ROOT
+from chesag.evaluation import (
+  EvaluationWeights,
+  IncrementalEvaluator,
+  get_evaluation_weights,
+  resolve_profile,
+  set_evaluation_weights,
+)
 from chesag.move_priority import HeuristicMovePrioritizer
-from chesag.position_key import build_position_key
+from chesag.parallel import ParallelMode
+from chesag.position_key import PositionKeyMode, build_position_key, zobrist_hash
 
 ONE_MOVE_FEN = "rnb1kbnr/p1p2ppp/1p2p3/3p4/4PP2/1P4qP/P1PP4/RNBQKBNR w KQkq - 0 6"
 
@@ -40,6 +54,19 @@ def test_expand_returns_the_newly_added_child() -> None:
   assert child.move in board.legal_moves
 
 
+def test_staged_expansion_draws_moves_lazily_until_fully_expanded() -> None:
+  board = chess.Board("4k3/8/8/8/8/8/8/4K2R w K - 0 1")
+  node = Node(board=board, move_prioritizer=HeuristicMovePrioritizer(), staged_ordering=True)
+  node.visits = 1_000
+
+  children = [node.expand() for _ in range(board.legal_moves.count())]
+
+  assert node.is_fully_expanded
+  assert node.expand() is None
+  assert {child.move for child in children if child is not None} == set(board.legal_moves)
+  assert all(child is not None and child.staged_ordering for child in children)
+
+
 def test_select_child_prefers_higher_prior_when_unvisited() -> None:
   board = chess.Board()
   prioritizer = HeuristicMovePrioritizer()
@@ -91,3 +118,252 @@ def test_mcts_transposition_table_uses_position_keys() -> None:
   assert isinstance(result, float)
   assert searcher.transposition_table is not None
   assert build_position_key(board) in searcher.transposition_table
+
+
+def test_mcts_zobrist_keys_are_derived_incrementally_for_children() -> None:
+  searcher = MCTSSearcher(use_transposition_table=True, key_mode=PositionKeyMode.ZOBRIST)
+  searcher.transposition_table = LRUCache(maxsize=100)
+  root = searcher.create_root_node(chess.Board())
+  child = root.children[0]
+  grandchild = child.expand()
+
+  assert root.zobrist_key == zobrist_hash(root.board)
+  assert child.zobrist_key == zobrist_hash(child.board)
+  assert grandchild is not None
+  assert grandchild.zobrist_key == zobrist_hash(grandchild.board)
+
+  searcher.simulate(grandchild)
+
+  assert zobrist_hash(grandchild.board) in searcher.transposition_table
+
+
+def test_rollout_with_incremental_evaluator_matches_plain_rollout() -> None:
+  node = Node(board=chess.Board("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1"))
+
+  rng = np.random.default_rng(7)
+  plain = [node.rollout(rng=rng) for _ in range(3)]
+  rng = np.random.default_rng(7)
+  evaluator = IncrementalEvaluator(verify=True)
+  incremental = [node.rollout(evaluator, rng=rng) for _ in range(3)]
+
+  assert incremental == plain
+
+
+def test_batch_priors_match_per_child_priors() -> None:
+  board = chess.Board("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1")
+  node = Node(board=board)
+  batched = Node(board=board, batch_priors=True)
+  batched.visits = 1_000
+
+  children = [batched.expand() for _ in range(3)]
+
+  assert all(child is not None and child.batch_priors for child in children)
+  assert [child.prior for child in children if child is not None] == [
+    node._move_prior(child.move) for child in children if child is not None and child.move is not None
+  ]
+
+
+def test_rollout_scores_the_final_position_with_a_profile() -> None:
+  node = Node(board=chess.Board("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1"))
+  final_boards: list[chess.Board] = []
+
+  def leaf_evaluator(board: chess.Board, perspective_color: bool) -> float:
+    final_boards.append(board.copy())
+    return resolve_profile("fast").compile()(board, perspective_color)
+
+  score = node.rollout(IncrementalEvaluator(), leaf_evaluator, np.random.default_rng(7))
+
+  assert len(final_boards) == 1
+  assert score == resolve_profile("fast").compile()(final_boards[0], chess.WHITE)
+
+
+def test_mcts_agent_accepts_a_profile() -> None:
+  agent = MCTSAgent(num_simulations=5, use_transposition_table=False, profile="fast")
+
+  move = agent.get_move(chess.Board())
+
+  assert move in chess.Board().legal_moves
+  assert agent.mcts_searcher.profile is not None
+  assert agent.mcts_searcher.profile.name == "fast"
+  assert agent.mcts_searcher.leaf_evaluator is not None
+
+
+def test_mcts_agent_reuses_the_subtree_of_the_position_reached() -> None:
+  board = chess.Board()
+  agent = MCTSAgent(num_simulations=60, use_transposition_table=False)
+
+  board.push(agent.get_move(board))
+  board.push(agent.get_move(board))
+
+  assert agent.reuse_stats.searches == 2
+  assert agent.reuse_stats.reused_searches == 1
+  assert agent.reuse_stats.last_reused_visits > 0
+  assert agent.reuse_stats.released_nodes > 0
+
+  agent.get_move(chess.Board())
+
+  assert agent.reuse_stats.reused_searches == 1
+  assert agent.reuse_stats.last_reused_visits == 0
+
+
+def test_mcts_agent_can_disable_tree_reuse() -> None:
+  board = chess.Board()
+  agent = MCTSAgent(num_simulations=20, use_transposition_table=False, reuse_tree=False)
+
+  board.push(agent.get_move(board))
+  agent.get_move(board)
+
+  assert agent.reuse_stats.reused_searches == 0
+
+
+@pytest.mark.parametrize("parallel_mode", list(ParallelMode))
+def test_parallel_search_runs_every_simulation(parallel_mode: ParallelMode) -> None:
+  searcher = MCTSSearcher(use_transposition_table=False, num_workers=2, parallel_mode=parallel_mode)
+  tree = searcher.create_tree(chess.Board())
+
+  try:
+    searcher.search(tree, 12, 1.4)
+  finally:
+    searcher.shutdown()
+
+  assert int(tree.visits[ROOT]) == 12
+  assert tree.pending_simulations == 0
+  assert not tree.in_flight.any()
+  assert tree.board == chess.Board()
+  assert searcher.get_best_child(tree)[0] in chess.Board().legal_moves
+
+
+def test_leaf_parallel_rollouts_are_sent_without_the_move_stack(monkeypatch: pytest.MonkeyPatch) -> None:
+  stack_sizes = []
+
+  def record_rollout(board: chess.Board) -> float:
+    stack_sizes.append(len(board.move_stack))
+    return 0.0
+
+  monkeypatch.setattr("chesag.agents.mcts.algorithm.run_rollout", record_rollout)
+  searcher = MCTSSearcher(use_transposition_table=False, num_workers=2, parallel_mode=ParallelMode.THREAD)
+  board = chess.Board()
+  board.push_uci("e2e4")
+  tree = searcher.create_tree(board)
+
+  try:
+    searcher.search(tree, 8, 1.4)
+  finally:
+    searcher.shutdown()
+
+  assert stack_sizes
+  assert set(stack_sizes) == {0}
+
+
+def test_num_workers_turns_parallel_search_on() -> None:
+  with warnings.catch_warnings():
+    warnings.simplefilter("error")
+    config = MCTSConfig(num_workers=3)
+
+  assert config.num_workers == 3
+  assert str(config).endswith("workers=3 (leaf)")
+  assert MCTSConfig(parallel=False, num_workers=3).num_workers == 1
+
+
+def test_parallel_agent_returns_a_legal_move() -> None:
+  board = chess.Board()
+  agent = MCTSAgent(num_simulations=10, use_transposition_table=False, num_workers=2, parallel_mode=ParallelMode.THREAD)
+
+  try:
+    move = agent.get_move(board)
+  finally:
+    agent.close()
+
+  assert move in board.legal_moves
+  assert agent.mcts_searcher.workers is not None
+  assert not agent.mcts_searcher.workers.running
+
+
+def test_merge_root_results_picks_the_most_visited_move() -> None:
+  results = [("e2e4", 6, 1.2), ("d2d4", 5, -1.0), ("e2e4", 1, 0.2), ("d2d4", 4, 0.1)]
+
+  move, visits, value = MCTSSearcher.merge_root_results(results)
+
+  assert move == chess.Move.from_uci("d2d4")
+  assert visits == 9
+  assert value == pytest.approx(-0.9)
+
+
+def test_searchers_draw_rollouts_from_their_own_generators() -> None:
+  board = chess.Board("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1")
+  stats = []
+  for _ in range(2):
+    searcher = MCTSSearcher(use_transposition_table=False, seed=11)
+    tree = searcher.create_tree(board)
+    searcher.search(tree, 20, 1.4)
+    MCTSSearcher(use_transposition_table=False).search(MCTSSearcher().create_tree(board), 5, 1.4)
+    searcher.search(tree, 20, 1.4)
+    stats.append([
+      (tree.move_of(child), int(tree.visits[child]), float(tree.value_sum[child])) for child in tree.children(ROOT)
+    ])
+
+  assert repr(stats[0]) == repr(stats[1])
+
+
+def test_root_parallel_search_is_reproducible_from_its_seed() -> None:
+  board = chess.Board()
+  picks = []
+  for _ in range(2):
+    searcher = MCTSSearcher(
+      use_transposition_table=False, num_workers=2, parallel_strategy=ParallelStrategy.ROOT, seed=7
+    )
+    try:
+      picks.append([searcher.root_parallel_search(board, 12, 1.4) for _ in range(2)])
+    finally:
+      searcher.shutdown()
+
+  assert repr(picks[0]) == repr(picks[1])
+  assert picks[0][0][0] in board.legal_moves
+  assert all(visits <= 12 for _, visits, _ in picks[0])
+
+
+def _worker_knight_weight(_: object) -> float:
+  return get_evaluation_weights().knight
+
+
+@pytest.mark.parametrize("parallel_strategy", list(ParallelStrategy))
+def test_process_workers_evaluate_with_the_parent_weights(parallel_strategy: ParallelStrategy) -> None:
+  default_weights = get_evaluation_weights()
+  set_evaluation_weights(EvaluationWeights(knight=9.0))
+  try:
+    searcher = MCTSSearcher(
+      use_transposition_table=False,
+      num_workers=2,
+      parallel_mode=ParallelMode.PROCESS,
+      parallel_strategy=parallel_strategy,
+    )
+  finally:
+    set_evaluation_weights(default_weights)
+  assert searcher.workers is not None
+  try:
+    knight_weights = searcher.workers.collect(_worker_knight_weight, [None, None])
+  finally:
+    searcher.shutdown()
+
+  assert knight_weights == [9.0, 9.0]
+
+
+def test_rollout_worker_keeps_weights_already_in_use(monkeypatch: pytest.MonkeyPatch) -> None:
+  calls = []
+  monkeypatch.setattr("chesag.agents.mcts.algorithm.set_evaluation_weights", calls.append)
+
+  worker = threading.Thread(target=init_rollout_worker, args=(None, True, False, False, get_evaluation_weights()))
+  worker.start()
+  worker.join()
+
+  assert calls == []
+
+
+def test_searcher_keeps_its_own_evaluation_stats() -> None:
+  agent = MCTSAgent(num_simulations=5, use_transposition_table=False, evaluation_stats_sample_every=4)
+
+  agent.get_move(chess.Board())
+
+  stats = agent.mcts_searcher.evaluation_stats
+  assert stats is not None
+  assert stats.rollout.calls > 0
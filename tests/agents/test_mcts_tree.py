@@ -0,0 +1,155 @@
+import chess
+import numpy as np
+import pytest
+
+from chesag.agents.mcts.algorithm import MCTSSearcher
+from chesag.agents.mcts.tree import NO_NODE, ROOT, MCTSTree, decode_move, encode_move
+from chesag.position_key import PositionKeyMode, zobrist_hash
+
+TACTICAL_FEN = "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1"
+
+
+@pytest.mark.parametrize("uci", ["e2e4", "a7a8q", "h2h1n", "e1g1", "b7c8r"])
+def test_moves_round_trip_through_their_packed_code(uci: str) -> None:
+  move = chess.Move.from_uci(uci)
+
+  assert decode_move(encode_move(move)) == move
+  assert encode_move(move) < 1 << 15
+
+
+@pytest.mark.parametrize(
+  ("fen", "options"),
+  [
+    (TACTICAL_FEN, {}),
+    (TACTICAL_FEN, {"use_staged_ordering": True}),
+    (chess.STARTING_FEN, {"use_batch_priors": True}),
+  ],
+)
+def test_array_tree_search_matches_node_search(fen: str, options: dict[str, bool]) -> None:
+  stats = []
+  for use_array_tree in (False, True):
+    searcher = MCTSSearcher(use_transposition_table=False, use_array_tree=use_array_tree, **options)
+    searcher.rollout_rng = np.random.default_rng(3)
+    root = searcher.create_root(chess.Board(fen))
+    searcher.search(root, 40, 1.4)
+    if isinstance(root, MCTSTree):
+      stats.append([
+        (root.move_of(child), int(root.visits[child]), float(root.value_sum[child])) for child in root.children(ROOT)
+      ])
+    else:
+      stats.append([(child.move, child.visits, child.value) for child in root.children])
+    stats[-1].append(searcher.get_best_child(root))
+
+  # Opposite mate scores turn some value sums into NaN, which only compare equal as text.
+  assert repr(stats[0]) == repr(stats[1])
+
+
+def test_array_tree_search_leaves_the_board_at_the_root() -> None:
+  board = chess.Board(TACTICAL_FEN)
+  searcher = MCTSSearcher(use_transposition_table=False)
+  tree = searcher.create_tree(board)
+
+  searcher.search(tree, 30, 1.4)
+
+  assert tree.board == board
+  assert tree.board.move_stack == board.move_stack
+  assert int(tree.visits[ROOT]) == 30
+  assert len(tree) > 1
+
+
+def test_array_tree_derives_zobrist_keys_incrementally() -> None:
+  searcher = MCTSSearcher(use_transposition_table=False, key_mode=PositionKeyMode.ZOBRIST)
+  tree = searcher.create_tree(chess.Board())
+  searcher.search(tree, 20, 1.4)
+
+  for index in range(1, len(tree)):
+    path = []
+    node = index
+    while node != ROOT:
+      path.append(tree.move_of(node))
+      node = int(tree.parent[node])
+    board = chess.Board()
+    for move in reversed(path):
+      board.push(move)
+    assert int(tree.key[index]) == zobrist_hash(board)
+
+
+def test_array_tree_grows_past_its_initial_capacity() -> None:
+  tree = MCTSTree(chess.Board(), capacity=2)
+  searcher = MCTSSearcher(use_transposition_table=False)
+
+  searcher.search(tree, 10, 1.4)
+
+  assert len(tree) > 2
+  assert tree.capacity >= len(tree)
+  assert tree.nbytes > 0
+  assert sum(int(tree.visits[child]) for child in tree.children(ROOT)) == 10
+
+
+def test_array_tree_selects_higher_prior_when_unvisited() -> None:
+  tree = MCTSTree(chess.Board())
+  tree.visits[ROOT] = 3
+  first = tree.expand(ROOT)
+  second = tree.expand(ROOT)
+  tree.prior[first] = 0.1
+  tree.prior[second] = 0.9
+
+  assert tree.select_child(ROOT, 1.4) == second
+  assert tree.expand(ROOT) == NO_NODE
+
+
+def test_reroot_keeps_the_subtree_and_releases_the_rest() -> None:
+  searcher = MCTSSearcher(use_transposition_table=False, key_mode=PositionKeyMode.ZOBRIST)
+  tree = searcher.create_tree(chess.Board())
+  searcher.search(tree, 60, 1.4)
+  child = max(tree.children(ROOT), key=lambda index: int(tree.visits[index]))
+  move = tree.move_of(child)
+  expected = sorted(
+    (tree.move_of(grandchild).uci(), int(tree.visits[grandchild]), float(tree.value_sum[grandchild]))
+    for grandchild in tree.children(child)
+  )
+  size = len(tree)
+
+  assert tree.reroot([move]) == child
+
+  assert len(tree) < size
+  assert int(tree.parent[ROOT]) == NO_NODE
+  assert int(tree.next_sibling[ROOT]) == NO_NODE
+  assert tree.board.move_stack == [move]
+  assert int(tree.key[ROOT]) == zobrist_hash(tree.board)
+  # Opposite mate scores turn some value sums into NaN, which only compare equal as text.
+  assert repr(expected) == repr(
+    sorted(
+      (tree.move_of(index).uci(), int(tree.visits[index]), float(tree.value_sum[index]))
+      for index in tree.children(ROOT)
+    )
+  )
+  visits = int(tree.visits[ROOT])
+  searcher.search(tree, 20, 1.4)
+  assert int(tree.visits[ROOT]) == visits + 20
+
+
+def test_reroot_rejects_unexpanded_positions() -> None:
+  tree = MCTSTree(chess.Board())
+  tree.expand(ROOT)
+
+  assert tree.moves_to(chess.Board("8/8/8/8/8/8/8/K6k w - - 0 1")) is None
+  assert tree.reroot([chess.Move.from_uci("h2h4")]) == NO_NODE
+  assert len(tree) == 2
+
+
+def test_virtual_loss_steers_selection_to_other_children() -> None:
+  tree = MCTSTree(chess.Board())
+  tree.visits[ROOT] = 3
+  first = tree.expand(ROOT)
+  second = tree.expand(ROOT)
+  tree.prior[first] = 0.6
+  tree.prior[second] = 0.4
+
+  tree.add_virtual_loss(first)
+  assert tree.select_child(ROOT, 1.4) == second
+  assert int(tree.in_flight[ROOT]) == 1
+
+  tree.remove_virtual_loss(first)
+  assert tree.select_child(ROOT, 1.4) == first
+  assert not tree.in_flight.any()
@@ -1,7 +1,17 @@
 import chess
+import pytest
 
-from chesag.agents.minimax import MinimaxAgent
-from chesag.position_key import build_position_key
+from chesag.agents.minimax import QUIESCENCE_TT_DEPTH, MinimaxAgent, StandPatEvaluation, _non_pawn_material
+from chesag.evaluation import (
+  EvaluationProfile,
+  EvaluationWeights,
+  get_evaluation_weights,
+  leaf_evaluate,
+  record_evaluation_stats,
+  set_evaluation_weights,
+)
+from chesag.position_key import PositionKeyMode, build_position_key, zobrist_hash
+from chesag.transposition import ArrayTranspositionTable, ReplacementPolicy
 
 
 def test_minimax_returns_legal_move_from_start_position() -> None:
@@ -186,3 +196,374 @@ def test_quiescence_includes_promotion_moves() -> None:
   score = agent.quiescence(board, float("-inf"), float("inf"))
 
   assert score > 8.0
+
+
+def test_zobrist_key_mode_matches_tuple_key_search() -> None:
+  board = chess.Board("r1bqkb1r/pppp1ppp/2n2n2/4p2Q/2B1P3/8/PPPP1PPP/RNB1K1NR w KQkq - 4 4")
+  tuple_agent = MinimaxAgent(maxdepth=2)
+  zobrist_agent = MinimaxAgent(maxdepth=2, key_mode=PositionKeyMode.ZOBRIST)
+
+  tuple_move = tuple_agent.get_move(board)
+  zobrist_move = zobrist_agent.get_move(board)
+
+  assert zobrist_move == tuple_move
+  assert zobrist_agent.transposition_table_size == tuple_agent.transposition_table_size
+  assert zobrist_agent._tt[zobrist_hash(board)].best_move == zobrist_move
+  assert board.fen() == "r1bqkb1r/pppp1ppp/2n2n2/4p2Q/2B1P3/8/PPPP1PPP/RNB1K1NR w KQkq - 4 4"
+
+
+@pytest.mark.parametrize("policy", list(ReplacementPolicy))
+def test_array_transposition_table_matches_dict_search(policy: ReplacementPolicy) -> None:
+  board = chess.Board("6k1/8/8/8/8/8/4q3/3Q2K1 w - - 0 1")
+  agent = MinimaxAgent(maxdepth=3, tt_size_mb=0.5, tt_replacement=policy)
+
+  move = agent.get_move(board)
+
+  assert isinstance(agent._tt, ArrayTranspositionTable)
+  assert agent.key_mode is PositionKeyMode.ZOBRIST
+  assert move == MinimaxAgent(maxdepth=3).get_move(board)
+  assert agent._tt.get(zobrist_hash(board)) is not None
+
+
+def test_small_array_table_reports_overwrites_and_fill_rate() -> None:
+  agent = MinimaxAgent(maxdepth=3, tt_size_mb=0.001)
+
+  agent.get_move(chess.Board())
+  stats = agent.transposition_table_stats
+
+  assert stats is not None
+  assert agent.transposition_table_size == stats.filled <= stats.capacity
+  assert agent.last_search.tt_collisions > 0
+  assert agent.last_search.tt_overwrites > 0
+  assert agent.last_search.tt_fill_rate == pytest.approx(stats.fill_rate)
+  assert MinimaxAgent().transposition_table_stats is None
+
+
+def test_array_transposition_table_rejects_tuple_keys() -> None:
+  with pytest.raises(ValueError, match="Zobrist"):
+    MinimaxAgent(tt_size_mb=1.0, key_mode=PositionKeyMode.TUPLE)
+
+
+def test_iterative_deepening_records_each_completed_depth() -> None:
+  agent = MinimaxAgent(maxdepth=3)
+
+  move = agent.get_move(chess.Board())
+  iterations = agent.last_search.iterations
+
+  assert [iteration.depth for iteration in iterations] == [1, 2, 3]
+  assert agent.last_search.completed_depth == 3
+  assert not agent.last_search.aborted
+  assert iterations[-1].best_move == move.uci()
+  assert sum(iteration.nodes for iteration in iterations) == agent.last_search.nodes
+  assert all(iteration.elapsed_seconds >= 0.0 for iteration in iterations)
+
+
+def test_node_limit_returns_best_move_of_last_completed_depth() -> None:
+  board = chess.Board("r1bqkb1r/pppp1ppp/2n2n2/4p3/2B1P3/5Q2/PPPP1PPP/RNB1K1NR w KQkq - 4 4")
+  agent = MinimaxAgent(maxdepth=6, node_limit=400)
+
+  move = agent.get_move(board)
+  stats = agent.last_search
+
+  assert stats.aborted
+  assert 0 < stats.completed_depth < 6
+  assert move.uci() == stats.iterations[-1].best_move
+  assert stats.nodes == 401
+  assert board.fen() == "r1bqkb1r/pppp1ppp/2n2n2/4p3/2B1P3/5Q2/PPPP1PPP/RNB1K1NR w KQkq - 4 4"
+
+
+def test_iterative_deepening_stops_once_mate_is_found() -> None:
+  board = chess.Board("r1bqkb1r/pppp1ppp/2n2n2/4p2Q/2B1P3/8/PPPP1PPP/RNB1K1NR w KQkq - 4 4")
+  agent = MinimaxAgent(maxdepth=6)
+
+  move = agent.get_move(board)
+
+  assert move == chess.Move.from_uci("h5f7")
+  assert agent.last_search.completed_depth == 1
+
+
+def test_time_limit_aborts_deep_search_and_keeps_board_intact() -> None:
+  board = chess.Board()
+  agent = MinimaxAgent(maxdepth=20, time_limit=0.2, key_mode=PositionKeyMode.ZOBRIST)
+
+  move = agent.get_move(board)
+
+  assert move in board.legal_moves
+  assert agent.last_search.completed_depth < 20
+  assert board.fen() == chess.STARTING_FEN
+  assert sum(iteration.elapsed_seconds for iteration in agent.last_search.iterations) < 1.0
+
+
+@pytest.mark.parametrize(
+  "fen",
+  [
+    "4k3/pp3ppp/8/3n4/8/2N5/PP3PPP/4K3 w - - 0 1",
+    "r3k2r/ppp2ppp/8/8/8/8/PPP2PPP/R3K2R w KQkq - 0 1",
+    "6k1/8/8/8/8/8/4q3/3Q2K1 w - - 0 1",
+  ],
+)
+def test_pvs_and_aspiration_keep_root_score(fen: str) -> None:
+  plain = MinimaxAgent(maxdepth=3, use_pvs=False, use_aspiration=False)
+  windowed = MinimaxAgent(maxdepth=3)
+
+  plain_move = plain.get_move(chess.Board(fen))
+  windowed_move = windowed.get_move(chess.Board(fen))
+
+  assert windowed.last_search.iterations[-1].score == pytest.approx(plain.last_search.iterations[-1].score)
+  assert windowed_move == plain_move
+  assert plain.last_search.pvs_researches == 0
+  assert plain.last_search.aspiration_researches == 0
+
+
+def test_pvs_searches_fewer_nodes_with_null_windows() -> None:
+  board = chess.Board("r1bq1rk1/pp2bppp/2n1pn2/3p4/2PP4/2N2N2/PP2BPPP/R2QKB1R w KQ - 0 8")
+  plain = MinimaxAgent(maxdepth=3, use_pvs=False, use_aspiration=False)
+  pvs = MinimaxAgent(maxdepth=3, use_aspiration=False)
+
+  plain.get_move(board)
+  pvs.get_move(board)
+
+  assert pvs.last_search.pvs_researches > 0
+  assert pvs.last_search.nodes < plain.last_search.nodes
+
+
+def test_narrow_aspiration_window_triggers_researches() -> None:
+  agent = MinimaxAgent(maxdepth=3, aspiration_window=0.01)
+
+  agent.get_move(chess.Board("4k3/pp3ppp/8/3n4/8/2N5/PP3PPP/4K3 w - - 0 1"))
+
+  assert agent.last_search.aspiration_researches > 0
+  assert agent.last_search.as_dict()["aspiration_researches"] == agent.last_search.aspiration_researches
+
+
+def test_forward_pruning_toggles_disable_their_counters() -> None:
+  board = chess.Board("4k3/pp3ppp/8/3n4/8/2N5/PP3PPP/4K3 w - - 0 1")
+  agent = MinimaxAgent(maxdepth=4, use_null_move=False, use_lmr=False)
+
+  agent.get_move(board)
+
+  assert agent.last_search.null_move_cutoffs == 0
+  assert agent.last_search.null_move_verifications == 0
+  assert agent.last_search.lmr_reductions == 0
+  assert agent.last_search.lmr_researches == 0
+
+
+def test_null_move_and_lmr_prune_nodes_without_changing_the_move() -> None:
+  board = chess.Board("4k3/pp3ppp/8/3n4/8/2N5/PP3PPP/4K3 w - - 0 1")
+  full = MinimaxAgent(maxdepth=4, use_null_move=False, use_lmr=False)
+  pruned = MinimaxAgent(maxdepth=4)
+
+  full_move = full.get_move(board)
+  pruned_move = pruned.get_move(board)
+
+  stats = pruned.last_search
+  assert pruned_move == full_move
+  assert stats.null_move_cutoffs > 0
+  assert stats.null_move_verifications > 0
+  assert stats.lmr_reductions > 0
+  assert stats.nodes < full.last_search.nodes
+
+
+def test_null_move_is_skipped_in_pawn_endgames() -> None:
+  board = chess.Board("8/5k2/8/3pP3/3P4/8/5K2/8 w - - 0 1")
+  agent = MinimaxAgent(maxdepth=4, use_lmr=False)
+
+  agent.get_move(board)
+
+  assert _non_pawn_material(board, chess.WHITE) == 0
+  assert agent.last_search.null_move_cutoffs == 0
+  assert agent.last_search.null_move_verifications == 0
+
+
+def test_late_move_reduction_spares_killer_moves() -> None:
+  board = chess.Board()
+  agent = MinimaxAgent()
+  move = chess.Move.from_uci("a2a3")
+
+  assert agent._late_move_reduction(board, move, index=8, depth=5, ply=1) == 2
+
+  agent.move_prioritizer.record_killer(move, 1)
+
+  assert agent._late_move_reduction(board, move, index=8, depth=5, ply=1) == 0
+  assert agent._late_move_reduction(board, move, index=8, depth=5, ply=2) == 2
+  assert agent._late_move_reduction(board, move, index=1, depth=5, ply=2) == 0
+
+
+@pytest.mark.parametrize(
+  "fen",
+  [
+    chess.STARTING_FEN,
+    "4k3/pp3ppp/8/3n4/8/2N5/PP3PPP/4K3 w - - 0 1",
+    "r1bqkb1r/pppp1ppp/2n2n2/4p3/2B1P3/5Q2/PPPP1PPP/RNB1K1NR w KQkq - 4 4",
+  ],
+)
+def test_staged_ordering_keeps_move_choice(fen: str) -> None:
+  board = chess.Board(fen)
+  eager = MinimaxAgent(maxdepth=3, use_null_move=False, use_lmr=False)
+  staged = MinimaxAgent(maxdepth=3, use_null_move=False, use_lmr=False, use_staged_ordering=True)
+
+  eager_move = eager.get_move(board)
+  staged_move = staged.get_move(board)
+
+  assert staged_move == eager_move
+  assert staged.last_search.iterations[-1].score == eager.last_search.iterations[-1].score
+
+
+@pytest.mark.parametrize("use_staged_ordering", [True, False])
+def test_see_pruning_skips_losing_captures_in_quiescence(use_staged_ordering: bool) -> None:
+  board = chess.Board("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1")
+  plain = MinimaxAgent(use_see_pruning=False, use_staged_ordering=use_staged_ordering)
+  pruned = MinimaxAgent(use_staged_ordering=use_staged_ordering)
+
+  plain_score = plain.quiescence(board.copy(), float("-inf"), float("inf"))
+  pruned_score = pruned.quiescence(board.copy(), float("-inf"), float("inf"))
+
+  assert plain.last_search.see_prunes == 0
+  assert pruned.last_search.see_prunes > 0
+  assert pruned.last_search.nodes < plain.last_search.nodes
+  assert pruned_score == plain_score
+
+
+def test_quiescence_nodes_are_reported_separately() -> None:
+  agent = MinimaxAgent(maxdepth=2)
+
+  agent.get_move(chess.Board("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1"))
+
+  assert 0 < agent.last_search.qnodes < agent.last_search.nodes
+  assert agent.last_search.as_dict()["qnodes"] == agent.last_search.qnodes
+
+
+def test_quiescence_stores_and_reuses_its_own_entries() -> None:
+  board = chess.Board("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1")
+  agent = MinimaxAgent()
+
+  score = agent.quiescence(board, float("-inf"), float("inf"))
+  entry = agent._tt.get(build_position_key(board))
+  first_nodes = agent.last_search.qnodes
+  first_hits = agent.last_search.qtt_hits
+  repeated = agent.quiescence(board, float("-inf"), float("inf"))
+
+  assert entry is not None
+  assert entry.depth == QUIESCENCE_TT_DEPTH
+  assert repeated == score
+  assert agent.last_search.qnodes == first_nodes + 1
+  assert agent.last_search.qtt_hits == first_hits + 1
+
+
+def test_main_search_ignores_quiescence_entries() -> None:
+  board = chess.Board("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1")
+  agent = MinimaxAgent()
+
+  agent.quiescence(board, float("-inf"), float("inf"))
+  agent._negamax(board, 0, float("-inf"), float("inf"), ply=0)
+
+  assert agent.last_search.tt_hits == 0
+  assert agent.last_search.qtt_hits == 1
+
+
+def test_quiescence_depth_cap_returns_stand_pat() -> None:
+  board = chess.Board("4k3/8/8/3q4/4P3/8/8/4K3 w - - 0 1")
+  agent = MinimaxAgent(max_quiescence_depth=0)
+
+  score = agent.quiescence(board, float("-inf"), float("inf"))
+
+  assert score == leaf_evaluate(board, board.turn)
+  assert agent.last_search.qnodes == 1
+
+
+def test_delta_pruning_skips_captures_that_cannot_raise_alpha() -> None:
+  board = chess.Board("4k3/8/8/3p4/4P3/8/8/4K3 w - - 0 1")
+  agent = MinimaxAgent()
+
+  score = agent.quiescence(board, 5.0, 6.0)
+
+  assert score == 5.0
+  assert agent.last_search.delta_prunes == 1
+  assert agent.last_search.qnodes == 1
+
+
+def test_delta_margin_follows_the_evaluation_weights() -> None:
+  board = chess.Board("4k3/8/8/3p4/4P3/8/8/4K3 w - - 0 1")
+  agent = MinimaxAgent()
+  default = get_evaluation_weights()
+
+  set_evaluation_weights(EvaluationWeights(pawn=3.0))
+  try:
+    agent.quiescence(board, 5.0, 6.0)
+  finally:
+    set_evaluation_weights(default)
+
+  assert agent.last_search.delta_prunes == 0
+
+
+def test_order_stand_pat_uses_the_cheaper_tier() -> None:
+  board = chess.Board("4k3/8/8/3p4/4P3/8/8/4K3 w - - 0 1")
+  agent = MinimaxAgent(stand_pat=StandPatEvaluation.ORDER, use_see_pruning=False)
+
+  with record_evaluation_stats() as stats:
+    agent.quiescence(board, float("-inf"), float("inf"))
+
+  assert stats.order.calls > 0
+  assert stats.leaf.calls == 0
+
+
+@pytest.mark.parametrize("stand_pat", list(StandPatEvaluation))
+def test_incremental_evaluation_keeps_search_identical(stand_pat: StandPatEvaluation) -> None:
+  fen = "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1"
+  full = MinimaxAgent(maxdepth=2, stand_pat=stand_pat, use_incremental_eval=False)
+  incremental = MinimaxAgent(maxdepth=2, stand_pat=stand_pat, verify_incremental_eval=True)
+
+  full_move = full.get_move(chess.Board(fen))
+  incremental_move = incremental.get_move(chess.Board(fen))
+
+  assert incremental_move == full_move
+  assert incremental.last_search.nodes == full.last_search.nodes
+  assert incremental.last_search.iterations[-1].score == full.last_search.iterations[-1].score
+
+
+def test_default_profile_keeps_search_identical() -> None:
+  fen = "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1"
+  plain = MinimaxAgent(maxdepth=2)
+  profiled = MinimaxAgent(maxdepth=2, profile=EvaluationProfile())
+
+  assert profiled.get_move(chess.Board(fen)) == plain.get_move(chess.Board(fen))
+  assert profiled.last_search.nodes == plain.last_search.nodes
+  assert profiled.last_search.iterations[-1].score == plain.last_search.iterations[-1].score
+  assert "profile='default'" in str(profiled)
+
+
+def test_profile_changes_the_stand_pat_evaluation() -> None:
+  board = chess.Board("4k3/8/8/8/8/8/3PP3/4K3 w - - 0 1")
+  agent = MinimaxAgent(profile="placement")
+
+  score = agent.quiescence(board, float("-inf"), float("inf"))
+
+  assert agent.profile is not None
+  assert agent.profile.name == "placement"
+  assert score == agent._leaf_evaluator(board, board.turn)
+  assert score != leaf_evaluate(board, board.turn)
+
+
+@pytest.mark.parametrize("use_staged_ordering", [False, True])
+def test_beta_cutoffs_are_counted_per_ply(use_staged_ordering: bool) -> None:
+  board = chess.Board("4k3/pp3ppp/8/3n4/8/2N5/PP3PPP/4K3 w - - 0 1")
+  agent = MinimaxAgent(maxdepth=3, use_staged_ordering=use_staged_ordering)
+
+  agent.get_move(board)
+
+  depths = agent.last_search.as_dict()["depths"]
+  assert sum(stats["cutoffs"] for stats in depths.values()) > 0
+  assert (sum(stats["pruned"] for stats in depths.values()) > 0) is not use_staged_ordering
+
+
+def test_agent_keeps_its_own_evaluation_stats() -> None:
+  agent = MinimaxAgent(maxdepth=2, evaluation_stats_sample_every=8)
+  silent = MinimaxAgent(maxdepth=2)
+
+  agent.get_move(chess.Board())
+  calls = agent.evaluation_stats.leaf.calls + agent.evaluation_stats.order.calls
+  silent.get_move(chess.Board())
+
+  assert calls > 0
+  assert agent.evaluation_stats.leaf.calls + agent.evaluation_stats.order.calls == calls
+  assert silent.evaluation_stats is None
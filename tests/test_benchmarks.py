@@ -2,20 +2,36 @@ from typing import cast
 
 import chess
 
-from chesag.benchmarks import benchmark_evaluation_tiers, benchmark_mcts, benchmark_minimax, run_smoke_match
-from chesag.evaluation import get_evaluation_stats, reset_evaluation_stats
+from chesag.benchmarks import (
+  benchmark_batch_evaluation,
+  benchmark_evaluation_tiers,
+  benchmark_mcts,
+  benchmark_mcts_memory,
+  benchmark_mcts_parallel,
+  benchmark_minimax,
+  benchmark_quiescence,
+  run_smoke_match,
+)
+from chesag.parallel import ParallelMode
 
 
 def test_evaluation_stats_count_tier_calls() -> None:
-  reset_evaluation_stats()
-
   result = benchmark_evaluation_tiers(chess.STARTING_FEN, iterations=3)
-  stats = get_evaluation_stats()
+  stats = cast("dict[str, dict[str, int]]", result.details["stats"])
 
   assert result.repetitions == 3
-  assert stats.leaf.calls == 3
-  assert stats.order.calls == 3
-  assert stats.rollout.calls == 3
+  assert stats["leaf"]["calls"] == 3
+  assert stats["order"]["calls"] == 3
+  assert stats["rollout"]["calls"] == 3
+
+
+def test_batch_evaluation_benchmark_reports_both_timings() -> None:
+  result = benchmark_batch_evaluation(positions=10)
+
+  assert result.name == "batch_evaluation"
+  assert result.repetitions == 10
+  assert cast("float", result.details["scalar_seconds"]) > 0.0
+  assert cast("float", result.details["batch_seconds"]) > 0.0
 
 
 def test_minimax_benchmark_exposes_search_stats() -> None:
@@ -28,6 +44,15 @@ def test_minimax_benchmark_exposes_search_stats() -> None:
   assert "search" in run
 
 
+def test_quiescence_benchmark_reports_node_reduction() -> None:
+  result = benchmark_quiescence(depth=1)
+
+  runs = cast("dict[str, dict[str, object]]", result.details["runs"])
+  assert result.name == "quiescence"
+  assert runs["without_see"]["see_prunes"] == 0
+  assert cast("float", result.details["node_reduction"]) > 0.0
+
+
 def test_mcts_benchmark_exposes_cache_details() -> None:
   result = benchmark_mcts(chess.STARTING_FEN, num_simulations=1, repetitions=1, use_transposition_table=False)
 
@@ -43,3 +68,23 @@ def test_smoke_match_returns_report() -> None:
 
   assert result["games"] == 1
   assert "GAME STATISTICS" in report
+
+
+def test_mcts_memory_benchmark_compares_both_trees() -> None:
+  result = benchmark_mcts_memory(num_simulations=60)
+
+  runs = cast("dict[str, dict[str, float]]", result.details["runs"])
+  assert result.name == "mcts_memory"
+  assert runs["node"]["nodes"] == runs["array"]["nodes"]
+  assert runs["array"]["bytes_per_node"] < runs["node"]["bytes_per_node"]
+
+
+def test_mcts_parallel_benchmark_reports_rate_per_worker_count() -> None:
+  result = benchmark_mcts_parallel(num_simulations=8, worker_counts=(1, 2), parallel_mode=ParallelMode.THREAD)
+
+  runs = cast("dict[str, dict[str, float]]", result.details["runs"])
+  assert result.name == "mcts_parallel"
+  assert result.details["parallel_mode"] == "thread"
+  assert set(runs) == {"1", "2"}
+  assert runs["1"]["speedup"] == 1.0
+  assert all(run["simulations_per_second"] > 0 for run in runs.values())
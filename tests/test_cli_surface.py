@@ -1,5 +1,18 @@
-from chesag.agents import AGENTS
+import pytest
+
+from chesag.agents import AGENTS, MinimaxAgent
+from chesag.cli import build_agent
 
 
 def test_agent_registry_excludes_abstract_base_agent() -> None:
   assert "base" not in AGENTS
+
+
+def test_build_agent_passes_profiles_to_searching_agents() -> None:
+  agent = build_agent("minimax", "fast")
+
+  assert isinstance(agent, MinimaxAgent)
+  assert agent.profile is not None
+  assert agent.profile.name == "fast"
+  with pytest.raises(ValueError, match="random"):
+    build_agent("random", "fast")
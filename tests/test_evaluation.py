@@ -1,29 +1,67 @@
+import threading
 from collections.abc import Callable
 
 import chess
+import numpy as np
 import pytest
 from hypothesis import example, given
 
 from chesag.evaluation import (
   EXTENDED_CENTER,
+  PIECE_VALUES,
+  CacheStats,
+  EvaluationCache,
+  EvaluationProfile,
+  EvaluationStats,
+  EvaluationWeights,
+  IncrementalEvaluator,
+  MobilityMode,
+  PawnHashTable,
+  attack_maps,
+  batch_evaluate,
+  batch_move_evaluate,
+  batch_order_evaluate,
+  batch_rollout_evaluate,
   bishop_pair_bonus,
   center_control,
+  clear_evaluation_caches,
+  clear_pawn_hash,
+  configure_evaluation_caches,
+  disable_evaluation_stats,
+  enable_evaluation_stats,
   evaluate,
+  evaluation_stats_enabled,
   get_evaluation_stats,
+  get_evaluation_weights,
   is_passed_pawn,
   king_safety,
   leaf_evaluate,
+  load_profile,
+  load_profiles,
   material_balance,
+  material_entry,
+  material_signature,
   mobility_score,
   move_bonus,
   mvv_lva_score,
+  open_file_and_shield_penalty,
   order_evaluate,
   passed_pawn_score,
+  pseudo_legal_mobility_score,
   quick_evaluate,
+  record_evaluation_stats,
   reset_evaluation_stats,
+  resolve_profile,
   rollout_evaluate,
+  set_evaluation_weights,
+  squares_mask,
+  stack_bitboards,
+  static_exchange_evaluation,
   terminal_evaluation,
+  use_thread_evaluation_caches,
 )
+from chesag.piece_square import piece_square_score
+from chesag.position_key import ZobristKeyStack, zobrist_hash
 from tests.hypothesis_strategies import legal_boards
 
 
@@ -123,24 +161,298 @@ def test_terminal_evaluation_in_progress_is_none() -> None:
 
 
 def test_evaluation_stats_record_and_reset() -> None:
+  with record_evaluation_stats():
+    leaf_evaluate(chess.Board(), chess.WHITE)
+    leaf_evaluate(chess.Board(), chess.WHITE)
+    order_evaluate(chess.Board(), chess.WHITE)
+
+    stats = get_evaluation_stats()
+    assert stats.leaf.calls == 2
+    assert stats.leaf.total_ns >= 0
+    assert stats.order.calls == 1
+    assert stats.order.total_ns >= 0
+    assert stats.rollout.calls == 0
+
+    reset_evaluation_stats()
+    stats = get_evaluation_stats()
+    assert stats.leaf.calls == 0
+    assert stats.order.calls == 0
+    assert stats.rollout.calls == 0
+
+
+def test_evaluation_stats_are_off_by_default() -> None:
   reset_evaluation_stats()
 
   leaf_evaluate(chess.Board(), chess.WHITE)
-  leaf_evaluate(chess.Board(), chess.WHITE)
+  rollout_evaluate(chess.Board(), chess.WHITE)
+
+  assert not evaluation_stats_enabled()
+  assert get_evaluation_stats().as_dict() == EvaluationStats().as_dict()
+
+
+def test_evaluation_stats_can_be_switched_at_runtime() -> None:
+  reset_evaluation_stats()
+  enable_evaluation_stats()
+  try:
+    order_evaluate(chess.Board(), chess.WHITE)
+  finally:
+    disable_evaluation_stats()
   order_evaluate(chess.Board(), chess.WHITE)
 
-  stats = get_evaluation_stats()
-  assert stats.leaf.calls == 2
-  assert stats.leaf.total_ns >= 0
+  assert get_evaluation_stats().order.calls == 1
+  reset_evaluation_stats()
+
+
+def test_evaluation_stats_sample_one_call_in_n() -> None:
+  with record_evaluation_stats(sample_every=4) as stats:
+    for _ in range(10):
+      rollout_evaluate(chess.Board(), chess.WHITE)
+
+  assert stats.rollout.calls == 10
+  assert stats.rollout.timed_calls == 2
+  assert stats.rollout.estimated_total_ns == pytest.approx(stats.rollout.total_ns * 5)
+
+
+def test_enable_evaluation_stats_rejects_non_positive_sampling() -> None:
+  with pytest.raises(ValueError, match="sample_every"):
+    enable_evaluation_stats(sample_every=0)
+
+
+def test_record_evaluation_stats_accumulates_and_restores() -> None:
+  searcher_stats = EvaluationStats()
+
+  for _ in range(2):
+    with record_evaluation_stats(searcher_stats):
+      leaf_evaluate(chess.Board(), chess.WHITE)
+
+  assert searcher_stats.leaf.calls == 2
+  assert not evaluation_stats_enabled()
+  assert get_evaluation_stats().leaf.calls == 0
+
+
+def test_overlapping_blocks_keep_counting_until_the_last_one_exits() -> None:
+  entered = threading.Event()
+  release = threading.Event()
+  worker_stats = EvaluationStats()
+
+  def count_in_worker() -> None:
+    with record_evaluation_stats(worker_stats):
+      entered.set()
+      release.wait()
+      leaf_evaluate(chess.Board(), chess.WHITE)
+
+  worker = threading.Thread(target=count_in_worker)
+  worker.start()
+  entered.wait()
+  with record_evaluation_stats():
+    pass
+  assert evaluation_stats_enabled()
+  release.set()
+  worker.join()
+
+  assert worker_stats.leaf.calls == 1
+  assert not evaluation_stats_enabled()
+
+
+def test_evaluation_stats_are_kept_per_thread() -> None:
+  worker_stats: list[EvaluationStats] = []
+
+  def worker() -> None:
+    for _ in range(3):
+      order_evaluate(chess.Board(), chess.WHITE)
+    worker_stats.append(get_evaluation_stats())
+
+  with record_evaluation_stats() as stats:
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+    order_evaluate(chess.Board(), chess.WHITE)
+
   assert stats.order.calls == 1
-  assert stats.order.total_ns >= 0
-  assert stats.rollout.calls == 0
+  assert worker_stats[0].order.calls == 3
+
+
+def test_pawn_hash_records_hits_and_misses() -> None:
+  clear_pawn_hash()
+  board = chess.Board("4k3/pp3ppp/8/3n4/8/2N5/PP3PPP/4K3 w - - 0 1")
+
+  with record_evaluation_stats():
+    first = evaluate(board, chess.WHITE)
+    board.push_uci("c3d5")
+    evaluate(board, chess.BLACK)
+    board.pop()
+    second = evaluate(board, chess.WHITE)
+    order_evaluate(board, chess.WHITE)
+
+    stats = get_evaluation_stats()
+    assert first == second
+    assert stats.pawn_hash.misses == 1
+    assert stats.pawn_hash.hits == 2
+    assert stats.pawn_hash.hit_rate == pytest.approx(2 / 3)
+    assert stats.as_dict()["pawn_hash"] == {"hits": 2, "misses": 1}
+
+    reset_evaluation_stats()
+    assert get_evaluation_stats().pawn_hash.hits == 0
+
+
+def test_evaluation_cache_answers_both_perspectives_from_one_entry() -> None:
+  clear_evaluation_caches()
+  board = chess.Board("r1bq1rk1/pp2bppp/2n1pn2/3p4/2PP4/2N2N2/PP2BPPP/R2QKB1R w KQ - 0 8")
+
+  with record_evaluation_stats() as stats:
+    white = leaf_evaluate(board, chess.WHITE)
+    black = leaf_evaluate(board, chess.BLACK)
+    order_evaluate(board, chess.WHITE)
+    order_evaluate(board, chess.WHITE)
+
+  assert black == -white
+  assert stats.as_dict()["leaf_cache"] == {"hits": 1, "misses": 1}
+  assert stats.order_cache.hit_rate == pytest.approx(0.5)
+
+
+@given(board=legal_boards(max_plies=60))
+def test_cached_tiers_match_uncached_evaluation(board: chess.Board) -> None:
+  for color in chess.COLORS:
+    for _ in range(2):
+      assert leaf_evaluate(board, color) == evaluate(board, color)
+      assert order_evaluate(board, color) == evaluate(
+        board,
+        color,
+        use_bishop_pair=False,
+        use_passed_pawns=False,
+        use_center_extended=False,
+        use_king_safety=False,
+        use_mobility=False,
+        use_piece_squares=True,
+      )
+
+
+def test_evaluation_cache_replaces_colliding_entries() -> None:
+  cache = EvaluationCache(1)
+  boards = [chess.Board(), chess.Board("4k3/8/8/8/8/8/4P3/4K3 w - - 0 1")]
+  stats = CacheStats()
+
+  for board in boards * 2:
+    assert cache.probe(board, chess.WHITE, evaluate, stats) == evaluate(board, chess.WHITE)
+
+  assert (stats.hits, stats.misses) == (0, 4)
+  assert cache.size == 1
+
+
+def test_evaluation_cache_is_keyed_by_zobrist_hash() -> None:
+  board = chess.Board("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1")
+  cache = EvaluationCache(16)
+  stats = CacheStats()
+  keys_board = chess.Board()
+  keys = ZobristKeyStack(keys_board)
+  keys.push(keys_board, chess.Move.from_uci("e2e4"))
+
+  def unexpected(_board: chess.Board, _perspective_color: bool) -> float:
+    msg = "the cached score was not found"
+    raise AssertionError(msg)
+
+  cache.probe(board, chess.WHITE, evaluate, stats)
+  assert cache.probe(board, chess.BLACK, unexpected, stats, key=zobrist_hash(board)) == -evaluate(board, chess.WHITE)
+  assert cache.probe(keys_board, chess.WHITE, evaluate, stats, key=keys.current) == evaluate(keys_board, chess.WHITE)
+  assert cache.probe(keys_board, chess.WHITE, unexpected, stats) == evaluate(keys_board, chess.WHITE)
+  assert (stats.hits, stats.misses) == (2, 2)
+
+
+def test_incremental_evaluator_probes_with_the_keys_it_is_given() -> None:
+  board = chess.Board()
+  keys = ZobristKeyStack(board)
+  evaluator = IncrementalEvaluator(board, keys=keys)
+  clear_evaluation_caches()
 
-  reset_evaluation_stats()
-  stats = get_evaluation_stats()
-  assert stats.leaf.calls == 0
-  assert stats.order.calls == 0
-  assert stats.rollout.calls == 0
+  with record_evaluation_stats() as stats:
+    for uci in ("e2e4", "e7e5"):
+      move = chess.Move.from_uci(uci)
+      evaluator.apply(board, move)
+      keys.push(board, move)
+    score = evaluator.leaf_evaluate(board, chess.WHITE)
+    assert leaf_evaluate(board, chess.WHITE) == score
+
+  assert (stats.leaf_cache.hits, stats.leaf_cache.misses) == (1, 1)
+
+
+def test_evaluation_cache_size_must_be_power_of_two() -> None:
+  with pytest.raises(ValueError, match="power of two"):
+    EvaluationCache(3)
+
+
+def test_configure_evaluation_caches_can_disable_a_tier() -> None:
+  configure_evaluation_caches(leaf_size=0)
+  try:
+    with record_evaluation_stats() as stats:
+      leaf_evaluate(chess.Board(), chess.WHITE)
+      leaf_evaluate(chess.Board(), chess.WHITE)
+      order_evaluate(chess.Board(), chess.WHITE)
+  finally:
+    configure_evaluation_caches()
+
+  assert stats.leaf.calls == 2
+  assert stats.leaf_cache.hits + stats.leaf_cache.misses == 0
+  assert stats.order_cache.misses == 1
+
+
+@given(board=legal_boards())
+def test_pawn_hash_entries_match_direct_terms(board: chess.Board) -> None:
+  table = PawnHashTable(size=4)
+  stats = CacheStats()
+
+  entry = table.probe(board, stats)
+  cached = table.probe(board, stats)
+
+  assert cached is entry
+  assert (stats.hits, stats.misses) == (1, 1)
+  assert entry.passed_pawns == passed_pawn_score(board, chess.WHITE)
+  for color, shield in ((chess.WHITE, entry.white_shield), (chess.BLACK, entry.black_shield)):
+    king_square = board.king(color)
+    assert king_square is not None
+    assert shield == open_file_and_shield_penalty(board, king_square, color)
+
+
+@pytest.mark.parametrize("size", [0, 3, -4])
+def test_pawn_hash_size_must_be_a_power_of_two(size: int) -> None:
+  with pytest.raises(ValueError, match="power of two"):
+    PawnHashTable(size=size)
+
+
+@pytest.mark.parametrize(
+  "fen",
+  [
+    "8/8/4k3/8/8/3BK3/8/8 w - - 0 1",
+    "8/8/4k3/8/8/3NK3/8/8 w - - 0 1",
+    "8/8/3nk3/8/8/3NK3/8/8 w - - 0 1",
+    "8/8/4k3/8/8/2NNK3/8/8 w - - 0 1",
+    "8/8/4kb2/8/8/3BK3/8/8 w - - 0 1",
+    "8/8/4k1b1/8/8/3BK3/8/8 w - - 0 1",
+    "8/8/4kq2/8/8/3NK3/8/8 w - - 0 1",
+    "8/8/3bk3/8/8/3NK3/8/8 w - - 0 1",
+    "8/8/4k3/8/8/4K3/8/8 w - - 0 1",
+    "8/4p3/4k3/8/8/3BK3/8/8 w - - 0 1",
+  ],
+)
+def test_material_entry_matches_insufficient_material(fen: str) -> None:
+  board = chess.Board(fen)
+
+  entry = material_entry(material_signature(board))
+
+  assert entry.insufficient_material is board.is_insufficient_material()
+
+
+@given(board=legal_boards(max_plies=60))
+def test_material_entry_matches_piece_walk(board: chess.Board) -> None:
+  expected = 0.0
+  for piece_type, value in PIECE_VALUES.items():
+    expected += value * len(board.pieces(piece_type, chess.WHITE))
+    expected -= value * len(board.pieces(piece_type, chess.BLACK))
+
+  entry = material_entry(material_signature(board))
+
+  assert entry.material == expected
+  assert material_balance(board, chess.BLACK) == -expected
+  assert entry.insufficient_material is board.is_insufficient_material()
 
 
 def test_bishop_pair_bonus_requires_two_bishops() -> None:
@@ -178,6 +490,46 @@ def test_is_passed_pawn_true_when_no_enemy_pawns_ahead() -> None:
   assert is_passed_pawn(board, chess.E3, chess.WHITE)
 
 
+@given(board=legal_boards())
+@example(board=chess.Board("8/5pk1/6p1/1pP5/1P6/6P1/5PK1/8 w - - 0 1"))
+def test_passed_pawn_masks_match_rank_and_file_walk(board: chess.Board) -> None:
+  for color in (chess.WHITE, chess.BLACK):
+    enemy_pawns = board.pieces(chess.PAWN, not color)
+    for square in board.pieces(chess.PAWN, color):
+      file = chess.square_file(square)
+      ranks = range(chess.square_rank(square) + 1, 8) if color == chess.WHITE else range(chess.square_rank(square))
+      blocked = any(
+        chess.square(next_file, rank) in enemy_pawns
+        for rank in ranks
+        for next_file in (file - 1, file, file + 1)
+        if 0 <= next_file < 8
+      )
+
+      assert is_passed_pawn(board, square, color) is not blocked
+
+
+@given(board=legal_boards())
+@example(board=chess.Board("6k1/5ppp/8/8/8/8/PP6/1K6 w - - 0 1"))
+def test_king_shield_masks_match_square_walk(board: chess.Board) -> None:
+  for color in (chess.WHITE, chess.BLACK):
+    king_square = board.king(color)
+    assert king_square is not None
+    king_file = chess.square_file(king_square)
+    files = [file for file in (king_file - 1, king_file, king_file + 1) if 0 <= file < 8]
+    own_pawns = board.pieces(chess.PAWN, color)
+    expected = 0.0
+    for file in files:
+      if not any(chess.square(file, rank) in own_pawns for rank in range(8)):
+        expected += -0.2
+    shield_rank = chess.square_rank(king_square) + (1 if color == chess.WHITE else -1)
+    if 0 <= shield_rank < 8:
+      for file in files:
+        if chess.square(file, shield_rank) not in own_pawns:
+          expected += -0.1
+
+    assert open_file_and_shield_penalty(board, king_square, color) == expected
+
+
 def test_is_passed_pawn_false_when_blocked() -> None:
   board = chess.Board("4k3/8/8/8/4p3/4P3/8/4K3 w - - 0 1")
 
@@ -236,6 +588,108 @@ def test_mobility_score_more_moves_is_higher() -> None:
   assert score > 0.0
 
 
+class _FrozenTurnBoard(chess.Board):
+  """Board that fails any change of the side to move once frozen."""
+
+  frozen = False
+
+  def __setattr__(self, name: str, value: object) -> None:
+    if name == "turn" and self.frozen:
+      msg = "the side to move was changed"
+      raise AssertionError(msg)
+    super().__setattr__(name, value)
+
+
+@given(board=legal_boards())
+def test_mobility_score_leaves_the_board_untouched(board: chess.Board) -> None:
+  frozen = _FrozenTurnBoard(board.fen())
+  frozen.frozen = True
+  counts = []
+  for color in (chess.WHITE, chess.BLACK):
+    side_board = board.copy(stack=False)
+    side_board.turn = color
+    counts.append(side_board.legal_moves.count())
+
+  assert mobility_score(frozen, chess.WHITE) == pytest.approx(
+    (counts[0] - counts[1]) * get_evaluation_weights().mobility
+  )
+
+
+@given(board=legal_boards())
+@example(board=chess.Board("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1"))
+@example(board=chess.Board("4k3/8/8/3pP3/8/8/8/4K3 w - d6 0 1"))
+def test_pseudo_legal_mobility_counts_pseudo_legal_destinations(board: chess.Board) -> None:
+  counts = []
+  for color in (chess.WHITE, chess.BLACK):
+    side_board = board.copy(stack=False)
+    side_board.turn = color
+    destinations = {
+      (move.from_square, move.to_square)
+      for move in side_board.generate_pseudo_legal_moves()
+      if not side_board.is_castling(move)
+    }
+    counts.append(len(destinations))
+
+  expected = (counts[0] - counts[1]) * 0.05
+  assert pseudo_legal_mobility_score(board, chess.WHITE) == pytest.approx(expected)
+  assert pseudo_legal_mobility_score(board, chess.BLACK) == pytest.approx(-expected)
+
+
+def test_pseudo_legal_mobility_matches_legal_mobility_without_checks_or_castling() -> None:
+  board = chess.Board("4k3/pp3ppp/8/3n4/8/2N5/PP3PPP/4K3 w - - 0 1")
+
+  assert pseudo_legal_mobility_score(board, chess.WHITE) == pytest.approx(mobility_score(board, chess.WHITE))
+
+
+def test_evaluate_can_use_pseudo_legal_mobility() -> None:
+  board = chess.Board("4k3/8/8/8/8/8/8/R3K3 w - - 0 1")
+
+  legal = evaluate(board, chess.WHITE)
+  pseudo_legal = evaluate(board, chess.WHITE, mobility_mode=MobilityMode.PSEUDO_LEGAL)
+
+  without_mobility = evaluate(board, chess.WHITE, use_mobility=False)
+  assert legal == pytest.approx(without_mobility + mobility_score(board, chess.WHITE))
+  assert pseudo_legal == pytest.approx(without_mobility + pseudo_legal_mobility_score(board, chess.WHITE))
+
+
+@given(board=legal_boards())
+@example(board=chess.Board("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1"))
+def test_attack_maps_match_attackers_per_square(board: chess.Board) -> None:
+  maps = attack_maps(board)
+
+  for color in (chess.WHITE, chess.BLACK):
+    side = maps.side(color)
+    for square in chess.SQUARES:
+      expected = board.attackers_mask(color, square).bit_count()
+      assert side.count(chess.BB_SQUARES[square]) == expected
+      assert bool(side.union & chess.BB_SQUARES[square]) == bool(expected)
+
+
+@given(board=legal_boards())
+def test_center_control_from_attack_maps_matches_direct_scan(board: chess.Board) -> None:
+  maps = attack_maps(board)
+
+  for color in (chess.WHITE, chess.BLACK):
+    direct = center_control(board, color, EXTENDED_CENTER)
+    assert center_control(board, color, EXTENDED_CENTER, attacks=maps) == direct
+    assert pseudo_legal_mobility_score(board, color, attacks=maps) == pseudo_legal_mobility_score(board, color)
+
+
+def test_squares_mask_sets_one_bit_per_square() -> None:
+  assert squares_mask([chess.E4, chess.D5]) == chess.BB_E4 | chess.BB_D5
+  assert squares_mask([]) == chess.BB_EMPTY
+
+
+def test_mobility_score_leaves_board_unchanged() -> None:
+  board = chess.Board("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1")
+  fen = board.fen()
+
+  mobility_score(board, chess.WHITE)
+
+  assert board.fen() == fen
+  assert board.turn == chess.WHITE
+
+
 def test_mvv_lva_score_non_capture_is_zero() -> None:
   board = chess.Board()
   move = chess.Move.from_uci("e2e4")
@@ -257,6 +711,33 @@ def test_mvv_lva_score_en_passant() -> None:
   assert mvv_lva_score(board, move) > 0.0
 
 
+@pytest.mark.parametrize(
+  ("fen", "uci", "expected"),
+  [
+    ("4k3/8/8/3q4/4P3/8/8/4K3 w - - 0 1", "e4d5", 9.5),
+    ("1k1r4/1pp4p/p7/4p3/8/P5P1/1PP4P/2K1R3 w - - 0 1", "e1e5", 1.0),
+    ("1k1r3q/1ppn3p/p4b2/4p3/8/P2N2P1/1PP1R1BP/2K1Q3 w - - 0 1", "d3e5", 1.0 - 3.2),
+    ("4k3/8/2p5/3p4/8/8/3R4/3RK3 w - - 0 1", "d2d5", 1.0 - 5.1 + 1.0),
+    ("4k3/8/8/3pP3/8/8/8/4K3 w - d6 0 1", "e5d6", 1.0),
+    ("4k3/3P4/8/8/8/8/8/4K3 w - - 0 1", "d7d8q", -1.0),
+    ("3qk3/8/8/3p4/8/8/8/3QK3 w - - 0 1", "d1d5", 1.0 - 9.5),
+  ],
+)
+def test_static_exchange_evaluation(fen: str, uci: str, expected: float) -> None:
+  board = chess.Board(fen)
+
+  assert static_exchange_evaluation(board, chess.Move.from_uci(uci)) == pytest.approx(expected)
+
+
+def test_static_exchange_evaluation_counts_xray_attackers() -> None:
+  defended_by_xray = chess.Board("4k3/3r4/8/3p4/8/8/3R4/3RK3 w - - 0 1")
+  single_rook = chess.Board("4k3/3r4/8/3p4/8/8/3R4/4K3 w - - 0 1")
+  move = chess.Move.from_uci("d2d5")
+
+  assert static_exchange_evaluation(defended_by_xray, move) > 0.0
+  assert static_exchange_evaluation(single_rook, move) < 0.0
+
+
 def test_move_bonus_capture_and_check() -> None:
   board = chess.Board("4k3/8/8/8/8/8/4q3/3Q2K1 w - - 0 1")
   board.push_san("Qxe2+")
@@ -361,13 +842,21 @@ def test_evaluate_combines_multiple_components() -> None:
   assert score != material_only
 
 
-def test_order_evaluate_uses_center_basic_not_extended() -> None:
+def test_order_evaluate_uses_piece_squares_not_center_control() -> None:
   board = chess.Board("4k3/8/8/8/8/5N2/4P3/4K3 w - - 0 1")
 
   order_score = order_evaluate(board, chess.WHITE)
   extended_score = evaluate(board, chess.WHITE, use_center_extended=True, use_center_basic=False)
 
   assert order_score != extended_score
+  assert order_score == pytest.approx(material_balance(board, chess.WHITE) + piece_square_score(board, chess.WHITE))
+
+
+def test_rollout_evaluate_is_material_plus_piece_squares() -> None:
+  board = chess.Board("r1bqkb1r/pppp1ppp/2n2n2/4p3/2B1P3/5N2/PPPP1PPP/RNBQK2R b KQkq - 5 4")
+
+  expected = material_balance(board, chess.BLACK) + piece_square_score(board, chess.BLACK)
+  assert rollout_evaluate(board, chess.BLACK) == pytest.approx(expected)
 
 
 def test_is_passed_pawn_black_pawn_true() -> None:
@@ -416,23 +905,22 @@ def test_rollout_evaluate_includes_terminal() -> None:
 
 
 def test_reset_evaluation_stats_zeroes_total_ns() -> None:
-  reset_evaluation_stats()
+  with record_evaluation_stats():
+    leaf_evaluate(chess.Board(), chess.WHITE)
+    stats_before = get_evaluation_stats()
+    assert stats_before.leaf.total_ns > 0
 
-  leaf_evaluate(chess.Board(), chess.WHITE)
-  stats_before = get_evaluation_stats()
-  assert stats_before.leaf.total_ns > 0
-
-  reset_evaluation_stats()
-  stats_after = get_evaluation_stats()
-  assert stats_after.leaf.total_ns == 0
+    reset_evaluation_stats()
+    stats_after = get_evaluation_stats()
+    assert stats_after.leaf.total_ns == 0
 
 
 def test_get_evaluation_stats_returns_copy() -> None:
-  reset_evaluation_stats()
-  leaf_evaluate(chess.Board(), chess.WHITE)
+  with record_evaluation_stats():
+    leaf_evaluate(chess.Board(), chess.WHITE)
 
-  stats1 = get_evaluation_stats()
-  stats2 = get_evaluation_stats()
+    stats1 = get_evaluation_stats()
+    stats2 = get_evaluation_stats()
   stats1.leaf.calls = 999
 
   assert stats2.leaf.calls != 999
@@ -461,3 +949,237 @@ def test_evaluate_move_bonus_included_when_explicitly_enabled() -> None:
   with_bonus = evaluate(board, chess.WHITE, include_move_bonus=True)
 
   assert with_bonus != without_bonus
+
+
+@given(board=legal_boards(max_plies=40))
+@example(board=chess.Board("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1"))
+def test_incremental_evaluator_matches_tiers_along_a_line(board: chess.Board) -> None:
+  root = board.root()
+  line = list(board.move_stack)
+  evaluator = IncrementalEvaluator(root, verify=True)
+
+  for move in line:
+    evaluator.push(root, move)
+    for color in (chess.WHITE, chess.BLACK):
+      assert evaluator.leaf_evaluate(root, color) == leaf_evaluate(root, color)
+      assert evaluator.order_evaluate(root, color) == order_evaluate(root, color)
+      assert evaluator.rollout_evaluate(root, color) == rollout_evaluate(root, color)
+
+  while root.move_stack:
+    evaluator.pop(root)
+  assert len(evaluator) == 1
+  assert evaluator.leaf_evaluate(root, chess.WHITE) == leaf_evaluate(root, chess.WHITE)
+
+
+@pytest.mark.parametrize(
+  ("fen", "uci"),
+  [
+    ("4k3/8/8/3pP3/8/8/8/4K3 w - d6 0 1", "e5d6"),
+    ("1r2k3/P7/8/8/8/8/8/4K3 w - - 0 1", "a7b8b"),
+    ("4k3/8/8/8/8/8/1p6/R3K3 b Q - 0 1", "b2a1n"),
+    ("r3k2r/8/8/8/8/8/8/R3K2R w KQkq - 0 1", "e1g1"),
+    ("4k3/8/8/8/8/2b5/8/4K1B1 w - - 0 1", "g1c5"),
+  ],
+)
+def test_incremental_evaluator_handles_special_moves(fen: str, uci: str) -> None:
+  board = chess.Board(fen)
+  evaluator = IncrementalEvaluator(board, verify=True)
+
+  evaluator.push(board, chess.Move.from_uci(uci))
+
+  assert evaluator.leaf_evaluate(board, chess.WHITE) == leaf_evaluate(board, chess.WHITE)
+  assert evaluator.rollout_evaluate(board, chess.BLACK) == rollout_evaluate(board, chess.BLACK)
+
+
+def test_incremental_evaluator_reuses_terms_across_a_null_move() -> None:
+  board = chess.Board("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1")
+  evaluator = IncrementalEvaluator(board, verify=True)
+
+  evaluator.push(board, chess.Move.null())
+
+  assert evaluator.leaf_evaluate(board, board.turn) == leaf_evaluate(board, board.turn)
+  assert evaluator.pop(board) == chess.Move.null()
+
+
+def test_incremental_evaluator_verify_detects_a_stale_root() -> None:
+  evaluator = IncrementalEvaluator(chess.Board(), verify=True)
+  board = chess.Board("4k3/8/8/8/8/8/8/R3K3 w Q - 0 1")
+
+  with pytest.raises(RuntimeError, match="diverged"):
+    evaluator.order_evaluate(board, chess.WHITE)
+
+
+def test_incremental_evaluator_records_tier_stats() -> None:
+  board = chess.Board()
+  evaluator = IncrementalEvaluator(board)
+
+  with record_evaluation_stats() as stats:
+    evaluator.leaf_evaluate(board, chess.WHITE)
+    evaluator.order_evaluate(board, chess.WHITE)
+    evaluator.rollout_evaluate(board, chess.WHITE)
+
+  assert (stats.leaf.calls, stats.order.calls, stats.rollout.calls) == (1, 1, 1)
+
+
+@given(board=legal_boards(max_plies=60))
+@example(board=chess.Board("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1"))
+@example(board=chess.Board("4k3/1P6/8/3pP3/8/8/6p1/4K3 w - d6 0 1"))
+def test_batch_evaluate_matches_scalar_placement_terms(board: chess.Board) -> None:
+  bitboards = stack_bitboards([board, board])
+  extended = batch_evaluate(bitboards, [chess.WHITE, chess.BLACK])
+  basic = batch_evaluate(bitboards, chess.BLACK, use_center_basic=True, use_center_extended=False)
+  placed = batch_evaluate(bitboards, chess.WHITE, use_center_extended=False, use_piece_squares=True)
+
+  if terminal_evaluation(board, chess.WHITE) is None:
+    for index, color in enumerate((chess.WHITE, chess.BLACK)):
+      assert extended[index] == evaluate(board, color, use_king_safety=False, use_mobility=False)
+    assert basic[0] == evaluate(
+      board, chess.BLACK, use_center_basic=True, use_center_extended=False, use_king_safety=False, use_mobility=False
+    )
+    assert placed[0] == evaluate(
+      board, chess.WHITE, use_center_extended=False, use_king_safety=False, use_mobility=False, use_piece_squares=True
+    )
+  assert batch_order_evaluate([board], chess.WHITE)[0] == order_evaluate(board, chess.WHITE)
+  assert batch_rollout_evaluate([board], chess.BLACK)[0] == rollout_evaluate(board, chess.BLACK)
+
+
+def test_batch_move_evaluate_scores_every_child_like_rollout_evaluate() -> None:
+  board = chess.Board("r1bqkb1r/pppp1ppp/2n2n2/4p2Q/2B1P3/8/PPPP1PPP/RNB1K1NR w KQkq - 4 4")
+  moves = list(board.legal_moves)
+  fen = board.fen()
+
+  scores = batch_move_evaluate(board, moves)
+
+  expected = []
+  for move in moves:
+    board.push(move)
+    expected.append(rollout_evaluate(board, chess.WHITE))
+    board.pop()
+  assert scores.tolist() == expected
+  assert np.isposinf(scores).any()
+  assert board.fen() == fen
+
+
+def test_stack_bitboards_uses_one_row_of_twelve_bitboards_per_board() -> None:
+  bitboards = stack_bitboards([chess.Board(), chess.Board()])
+
+  assert bitboards.shape == (2, 12)
+  assert bitboards.dtype == np.uint64
+  assert int(bitboards[0, 0]) == chess.BB_RANK_2
+  assert int(bitboards[1, 11]) == chess.BB_E8
+  assert stack_bitboards([]).shape == (0, 12)
+
+
+def test_batch_evaluate_rejects_wrong_shape() -> None:
+  with pytest.raises(ValueError, match=r"\(N, 12\)"):
+    batch_evaluate(np.zeros((2, 6), dtype=np.uint64), chess.WHITE)
+
+
+PROFILE_TOGGLES = (
+  {},
+  {"mobility_mode": MobilityMode.PSEUDO_LEGAL},
+  {"use_center_extended": False, "use_center_basic": True, "include_move_bonus": True},
+  {"use_center_extended": False, "use_mobility": False, "use_piece_squares": True, "use_king_safety": False},
+)
+
+
+@given(board=legal_boards(max_plies=60))
+def test_compiled_profiles_match_evaluate(board: chess.Board) -> None:
+  for toggles in PROFILE_TOGGLES:
+    compiled = EvaluationProfile(**toggles).compile()
+    for color in chess.COLORS:
+      assert compiled(board, color) == evaluate(board, color, **toggles)
+
+
+def test_compiled_profile_leaves_out_disabled_terms() -> None:
+  default = EvaluationProfile().compile()
+  placement = resolve_profile("placement").compile()
+
+  assert repr(default) == "CompiledEvaluator('default', terms=6)"
+  assert repr(placement) == "CompiledEvaluator('placement', terms=5)"
+  assert resolve_profile("fast").mobility_mode is MobilityMode.PSEUDO_LEGAL
+
+
+def test_compiled_profile_binds_its_own_weights() -> None:
+  board = chess.Board("4k3/8/8/8/8/8/3NP3/4K3 w - - 0 1")
+  default = get_evaluation_weights()
+  heavy_knights = EvaluationProfile(name="heavy", weights=EvaluationWeights(knight=4.2)).compile()
+  before = heavy_knights(board, chess.WHITE)
+
+  assert before == pytest.approx(evaluate(board, chess.WHITE) + 1.0)
+  set_evaluation_weights(EvaluationWeights(mobility=0.0))
+  try:
+    assert heavy_knights(board, chess.WHITE) == before
+  finally:
+    set_evaluation_weights(default)
+
+
+def test_compiled_profile_records_leaf_stats() -> None:
+  compiled = EvaluationProfile().compile()
+
+  with record_evaluation_stats() as stats:
+    compiled(chess.Board(), chess.WHITE)
+    compiled(chess.Board(), chess.BLACK)
+
+  assert stats.leaf.calls == 2
+  assert (stats.leaf_cache.hits, stats.leaf_cache.misses) == (1, 1)
+
+
+def test_profiles_load_from_toml_and_json(tmp_path) -> None:
+  toml_path = tmp_path / "profiles.toml"
+  toml_path.write_text(
+    """
+[profiles.fast]
+mobility_mode = "pseudo_legal"
+
+[profiles.material]
+use_center_extended = false
+use_king_safety = false
+use_mobility = false
+weights = { knight = 3.0 }
+""",
+    encoding="utf-8",
+  )
+  json_path = tmp_path / "placement.json"
+  json_path.write_text('{"use_piece_squares": true, "use_mobility": false}', encoding="utf-8")
+
+  profiles = load_profiles(toml_path)
+
+  assert set(profiles) == {"fast", "material"}
+  assert profiles["fast"].mobility_mode is MobilityMode.PSEUDO_LEGAL
+  assert profiles["material"].weights.knight == 3.0
+  assert profiles["material"].weights.bishop == get_evaluation_weights().bishop
+  assert load_profile(toml_path, "material") == profiles["material"]
+  placement = resolve_profile(json_path)
+  assert placement.name == "placement"
+  assert placement.use_piece_squares
+  assert not placement.use_mobility
+  assert EvaluationProfile.from_dict(placement.as_dict()) == placement
+  with pytest.raises(ValueError, match="several"):
+    load_profile(toml_path)
+
+
+def test_profile_rejects_unknown_settings() -> None:
+  with pytest.raises(ValueError, match="use_magic"):
+    EvaluationProfile.from_dict({"use_magic": True})
+  with pytest.raises(ValueError, match="king"):
+    EvaluationProfile.from_dict({"weights": {"king": 100.0}})
+
+
+def test_threads_can_take_their_own_evaluation_caches() -> None:
+  board = chess.Board("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1")
+  expected = leaf_evaluate(board, chess.WHITE)
+  worker_stats = EvaluationStats()
+
+  def evaluate_in_worker() -> None:
+    use_thread_evaluation_caches()
+    with record_evaluation_stats(worker_stats):
+      assert leaf_evaluate(board, chess.WHITE) == expected
+      assert leaf_evaluate(board, chess.WHITE) == expected
+
+  worker = threading.Thread(target=evaluate_in_worker)
+  worker.start()
+  worker.join()
+
+  assert worker_stats.leaf_cache.misses == 1
+  assert worker_stats.leaf_cache.hits == 1
@@ -1,7 +1,8 @@
 import chess
+import pytest
 from hypothesis import example, given
 
-from chesag.move_priority import HeuristicMovePrioritizer
+from chesag.move_priority import HeuristicMovePrioritizer, MovePickStage
 from chesag.position_key import build_position_key
 from tests.hypothesis_strategies import legal_boards
 
@@ -148,3 +149,88 @@ def test_record_killer_moves_existing_to_front() -> None:
 
   killers = prioritizer.killer_moves[0]
   assert killers[0] == move
+
+
+def test_is_killer_and_history_score_read_recorded_data() -> None:
+  prioritizer = HeuristicMovePrioritizer()
+  move = chess.Move.from_uci("g1f3")
+
+  assert not prioritizer.is_killer(move, 3)
+  assert prioritizer.history_score(move) == 0
+
+  prioritizer.record_killer(move, depth=3)
+  prioritizer.record_history(move, depth=4)
+
+  assert prioritizer.is_killer(move, 3)
+  assert not prioritizer.is_killer(move, 2)
+  assert prioritizer.history_score(move) == 16
+
+
+@given(board=legal_boards())
+@example(board=chess.Board("4k3/1P6/8/3q4/4P3/8/8/4K3 w - - 0 1"))
+def test_pick_moves_yields_every_legal_move_once(board: chess.Board) -> None:
+  prioritizer = HeuristicMovePrioritizer()
+
+  picked = list(prioritizer.pick_moves(board))
+
+  assert len(picked) == len(set(picked))
+  assert set(picked) == set(board.legal_moves)
+
+
+def test_pick_moves_follows_stage_order() -> None:
+  board = chess.Board("4k3/8/8/3q4/4P3/2n5/8/R3K3 w Q - 0 1")
+  prioritizer = HeuristicMovePrioritizer()
+  prioritizer.record_killer(chess.Move.from_uci("a1a7"), depth=1)
+  prioritizer.record_history(chess.Move.from_uci("e1f2"), depth=3)
+  tt_move = chess.Move.from_uci("a1b1")
+
+  staged = list(prioritizer.pick_staged_moves(board, depth=1, tt_move=tt_move))
+
+  stages = [stage for stage, _ in staged]
+  moves = [move.uci() for _, move in staged]
+  assert moves[:4] == ["a1b1", "e4d5", "a1a7", "e1f2"]
+  assert stages[:3] == [MovePickStage.TT_MOVE, MovePickStage.GOOD_CAPTURES, MovePickStage.KILLERS]
+  assert set(stages[3:]) == {MovePickStage.QUIETS}
+
+
+def test_pick_moves_orders_captures_by_mvv_lva() -> None:
+  board = chess.Board("4k3/8/2r1q3/3P4/8/8/8/7K w - - 0 1")
+  prioritizer = HeuristicMovePrioritizer()
+
+  picked = list(prioritizer.pick_moves(board, noisy_only=True))
+
+  assert picked == [chess.Move.from_uci("d5e6"), chess.Move.from_uci("d5c6")]
+
+
+def test_pick_moves_skips_illegal_tt_and_killer_moves() -> None:
+  board = chess.Board()
+  prioritizer = HeuristicMovePrioritizer()
+  prioritizer.record_killer(chess.Move.from_uci("e1e2"), depth=0)
+
+  picked = list(prioritizer.pick_moves(board, tt_move=chess.Move.from_uci("e2e5")))
+
+  assert set(picked) == set(board.legal_moves)
+
+
+def test_pick_moves_scores_later_stages_only_when_reached(monkeypatch: pytest.MonkeyPatch) -> None:
+  board = chess.Board("4k3/8/8/3q4/4P3/8/8/4K3 w - - 0 1")
+  prioritizer = HeuristicMovePrioritizer()
+
+  def fail(*_args: object) -> float:
+    raise AssertionError
+
+  monkeypatch.setattr("chesag.move_priority.mvv_lva_score", fail)
+  monkeypatch.setattr(prioritizer, "history_score", fail)
+  picker = prioritizer.pick_moves(board, tt_move=chess.Move.from_uci("e1f2"))
+
+  assert next(picker) == chess.Move.from_uci("e1f2")
+
+
+def test_pick_moves_defers_losing_captures_to_the_last_stage() -> None:
+  board = chess.Board("4k3/8/2p5/3p4/8/8/3R4/4K3 w - - 0 1")
+  prioritizer = HeuristicMovePrioritizer()
+
+  staged = list(prioritizer.pick_staged_moves(board))
+
+  assert staged[-1] == (MovePickStage.BAD_CAPTURES, chess.Move.from_uci("d2d5"))
+  assert MovePickStage.GOOD_CAPTURES not in {stage for stage, _ in staged}
@@ -0,0 +1,91 @@
+import itertools
+import math
+import threading
+from collections.abc import Iterator
+
+import pytest
+from chess import Board, Move
+
+from chesag.agents.base import BaseAgent
+from chesag.parallel import ParallelMode, ParallelWorkerManager
+
+_WORKER = threading.local()
+
+
+def _init_worker(offset: int) -> None:
+  _WORKER.offset = offset
+
+
+def _add_offset(value: int) -> int:
+  return value + _WORKER.offset
+
+
+class _PooledAgent(BaseAgent):
+  def __init__(self) -> None:
+    self.workers = self.attach_workers(ParallelWorkerManager(2, mode=ParallelMode.THREAD))
+
+  def get_move(self, board: Board) -> Move:
+    return next(iter(board.legal_moves))
+
+
+def test_distribute_simulations_skips_idle_workers() -> None:
+  assert ParallelWorkerManager.distribute_simulations(10, 4) == [3, 3, 2, 2]
+  assert ParallelWorkerManager.distribute_simulations(2, 4) == [1, 1]
+
+
+@pytest.mark.parametrize("chunksize", [1, 3])
+def test_stream_runs_every_argument_on_initialized_workers(chunksize: int) -> None:
+  with ParallelWorkerManager(2, mode=ParallelMode.THREAD, initializer=_init_worker, initargs=(100,)) as workers:
+    results = sorted(workers.stream(_add_offset, range(7), chunksize=chunksize))
+
+  assert results == [100, 101, 102, 103, 104, 105, 106]
+  assert not workers.running
+
+
+def test_pool_persists_between_calls_until_shutdown() -> None:
+  workers = ParallelWorkerManager(2, mode=ParallelMode.PROCESS)
+
+  assert sorted(workers.collect(math.isqrt, [4, 9, 16], chunksize=2)) == [2, 3, 4]
+  executor = workers.start()
+  assert workers.collect(abs, [0, -5]) == [5]
+  assert workers.start() is executor
+
+  workers.shutdown()
+  assert not workers.running
+
+
+def test_stream_reads_unbounded_arguments_lazily() -> None:
+  consumed = []
+
+  def arguments() -> Iterator[int]:
+    for value in itertools.count():
+      consumed.append(value)
+      yield value
+
+  with ParallelWorkerManager(2, mode=ParallelMode.THREAD) as workers:
+    results = workers.stream(abs, arguments())
+    assert consumed == []
+    assert next(results) in range(5)
+    results.close()
+
+  assert len(consumed) <= 5
+
+
+def test_execute_parallel_work_runs_on_a_temporary_pool() -> None:
+  assert sorted(ParallelWorkerManager.execute_parallel_work(math.isqrt, [4, 9, 0, 16], max_workers=2)) == [2, 3, 4]
+  assert ParallelWorkerManager.execute_parallel_work(abs, [0]) == [0]
+  assert ParallelWorkerManager.execute_parallel_work(abs, []) == []
+
+
+def test_stream_rejects_empty_chunks() -> None:
+  with pytest.raises(ValueError, match="chunksize"):
+    ParallelWorkerManager(mode=ParallelMode.THREAD).stream(abs, [1], chunksize=0)
+
+
+def test_closing_an_agent_shuts_down_its_worker_pools() -> None:
+  agent = _PooledAgent()
+  assert agent.workers.submit(abs, -3).result() == 3
+
+  agent.close()
+
+  assert not agent.workers.running
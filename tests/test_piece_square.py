@@ -0,0 +1,53 @@
+import chess
+import pytest
+from hypothesis import given
+
+from chesag.piece_square import (
+  MAX_PHASE,
+  PST_EG,
+  PST_MG,
+  piece_row,
+  piece_square_score,
+  piece_square_terms,
+  square_terms,
+  tapered_score,
+)
+from tests.hypothesis_strategies import legal_boards
+
+
+def test_starting_position_is_balanced() -> None:
+  middlegame, endgame, phase = piece_square_terms(chess.Board())
+
+  assert (middlegame, endgame, phase) == (0, 0, MAX_PHASE)
+  assert piece_square_score(chess.Board(), chess.WHITE) == 0.0
+
+
+def test_tapered_score_blends_by_phase() -> None:
+  assert tapered_score(100, -100, MAX_PHASE) == 1.0
+  assert tapered_score(100, -100, 0) == -1.0
+  assert tapered_score(100, -100, MAX_PHASE // 2) == 0.0
+  assert tapered_score(100, -100, MAX_PHASE + 6) == 1.0
+
+
+def test_tables_are_signed_mirrors_of_each_other() -> None:
+  for piece_type in chess.PIECE_TYPES:
+    white = piece_row(chess.WHITE, piece_type)
+    black = piece_row(chess.BLACK, piece_type)
+    for square in chess.SQUARES:
+      assert PST_MG[white, square] == -PST_MG[black, chess.square_mirror(square)]
+      assert PST_EG[white, square] == -PST_EG[black, chess.square_mirror(square)]
+
+
+def test_square_terms_rewards_central_knights() -> None:
+  central, _ = square_terms(chess.WHITE, chess.KNIGHT, chess.E5)
+  corner, _ = square_terms(chess.WHITE, chess.KNIGHT, chess.A1)
+
+  assert central > corner
+
+
+@given(board=legal_boards(max_plies=40))
+def test_mirrored_board_negates_piece_square_terms(board: chess.Board) -> None:
+  middlegame, endgame, phase = piece_square_terms(board)
+
+  assert piece_square_terms(board.mirror()) == (-middlegame, -endgame, phase)
+  assert piece_square_score(board.mirror(), chess.BLACK) == pytest.approx(piece_square_score(board, chess.WHITE))
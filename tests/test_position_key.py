@@ -1,7 +1,8 @@
 import chess
+import numpy as np
 from hypothesis import example, given
 
-from chesag.position_key import build_position_key
+from chesag.position_key import PositionKeyMode, ZobristKeyStack, build_position_key, zobrist_hash
 from tests.hypothesis_strategies import legal_boards
 
 
@@ -59,3 +60,57 @@ def test_position_key_restored_after_push_and_pop(board: chess.Board) -> None:
 
   assert board.fen() == original_fen
   assert build_position_key(board) == original_key
+
+
+def test_zobrist_key_distinguishes_side_castling_and_en_passant() -> None:
+  board = chess.Board()
+  black_to_move = chess.Board()
+  black_to_move.turn = chess.BLACK
+  without_rights = chess.Board()
+  without_rights.castling_rights = 0
+  with_ep = chess.Board()
+  with_ep.push_san("e4")
+  without_ep = with_ep.copy()
+  without_ep.ep_square = None
+
+  keys = {zobrist_hash(b) for b in (board, black_to_move, without_rights, with_ep, without_ep)}
+
+  assert len(keys) == 5
+  assert build_position_key(board, PositionKeyMode.ZOBRIST) == zobrist_hash(board)
+  assert 0 <= zobrist_hash(board) < 2**64
+
+
+@given(legal_boards(max_plies=24))
+@example(chess.Board("r3k2r/1P6/8/3pP3/8/8/8/R3K2R w KQkq d6 0 1"))
+def test_incremental_zobrist_matches_full_hash_after_push_and_pop(board: chess.Board) -> None:
+  keys = ZobristKeyStack(board)
+  root_key = keys.current
+
+  for move in [*board.legal_moves, chess.Move.null()]:
+    keys.push(board, move)
+    assert keys.current == zobrist_hash(board)
+    keys.pop(board)
+    assert keys.current == root_key
+
+  assert len(keys) == 1
+
+
+def test_zobrist_keys_do_not_collide_where_tuple_keys_differ() -> None:
+  rng = np.random.default_rng(7)
+  zobrist_by_tuple: dict[object, int] = {}
+
+  for _ in range(40):
+    board = chess.Board()
+    keys = ZobristKeyStack(board)
+    for _ in range(80):
+      legal_moves = list(board.legal_moves)
+      if not legal_moves:
+        break
+      keys.push(board, legal_moves[int(rng.integers(0, len(legal_moves)))])
+      tuple_key = build_position_key(board)
+      assert zobrist_by_tuple.setdefault(tuple_key, keys.current) == keys.current
+
+  distinct_tuple_keys = len(zobrist_by_tuple)
+  collisions = distinct_tuple_keys - len(set(zobrist_by_tuple.values()))
+  assert distinct_tuple_keys > 2_000
+  assert collisions == 0
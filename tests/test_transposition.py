@@ -0,0 +1,118 @@
+import chess
+import pytest
+
+from chesag.transposition import (
+  TT_SLOT_DTYPE,
+  ArrayTranspositionTable,
+  Bound,
+  ReplacementPolicy,
+  TTEntry,
+  pack_move,
+  unpack_move,
+)
+
+
+def _entry(depth: int, score: float = 0.5, move: str | None = "e2e4") -> TTEntry:
+  return TTEntry(depth=depth, score=score, bound=Bound.EXACT, best_move=chess.Move.from_uci(move) if move else None)
+
+
+@pytest.mark.parametrize("uci", ["e2e4", "a7a8q", "h2h1n", "e1g1"])
+def test_pack_move_round_trips(uci: str) -> None:
+  move = chess.Move.from_uci(uci)
+
+  assert unpack_move(pack_move(move)) == move
+
+
+def test_pack_move_encodes_missing_move_as_zero() -> None:
+  assert pack_move(None) == 0
+  assert pack_move(chess.Move.null()) == 0
+  assert unpack_move(0) is None
+
+
+def test_table_size_is_power_of_two_within_budget() -> None:
+  table = ArrayTranspositionTable(1.0)
+
+  buckets = table.capacity // table.bucket_size
+  assert buckets & (buckets - 1) == 0
+  assert table.nbytes <= 1024 * 1024
+  assert table.nbytes == table.capacity * TT_SLOT_DTYPE.itemsize
+  assert table.nbytes * 2 > 1024 * 1024
+
+
+def test_table_rejects_non_positive_budget() -> None:
+  with pytest.raises(ValueError, match="positive"):
+    ArrayTranspositionTable(0)
+
+
+def test_store_and_probe_round_trip() -> None:
+  table = ArrayTranspositionTable(0.01)
+  entry = TTEntry(depth=3, score=float("-inf"), bound=Bound.LOWER, best_move=chess.Move.from_uci("b7b8r"))
+
+  table[2**64 - 1] = entry
+
+  assert table.get(2**64 - 1) == entry
+  assert 2**64 - 1 in table
+  assert table.get(12345) is None
+  assert len(table) == 1
+
+
+def test_same_key_updates_in_place() -> None:
+  table = ArrayTranspositionTable(0.01)
+
+  table[42] = _entry(1)
+  table[42] = _entry(5, score=2.0)
+
+  assert len(table) == 1
+  assert table.get(42) == _entry(5, score=2.0)
+  assert table.stats.stores == 2
+  assert table.stats.overwrites == 0
+
+
+def _colliding_keys(table: ArrayTranspositionTable, count: int) -> list[int]:
+  stride = table.capacity // table.bucket_size
+  return [7 + index * stride for index in range(count)]
+
+
+def test_depth_preferred_keeps_deeper_entries_from_current_search() -> None:
+  table = ArrayTranspositionTable(0.01, policy=ReplacementPolicy.DEPTH_PREFERRED)
+  keys = _colliding_keys(table, table.bucket_size + 2)
+  for depth, key in enumerate(keys[: table.bucket_size], start=2):
+    table[key] = _entry(depth)
+
+  table[keys[-2]] = _entry(0)
+  table[keys[-1]] = _entry(9)
+
+  stats = table.stats
+  assert table.get(keys[-2]) is None
+  assert table.get(keys[0]) is None
+  assert table.get(keys[-1]) is not None
+  assert stats.collisions == 2
+  assert stats.overwrites == 1
+  assert stats.filled == table.bucket_size
+  assert stats.fill_rate == pytest.approx(table.bucket_size / table.capacity)
+
+
+def test_always_replace_evicts_oldest_generation() -> None:
+  table = ArrayTranspositionTable(0.01, policy=ReplacementPolicy.ALWAYS_REPLACE)
+  keys = _colliding_keys(table, table.bucket_size + 1)
+  table[keys[0]] = _entry(10)
+  table.new_search()
+  for key in keys[1 : table.bucket_size]:
+    table[key] = _entry(1)
+
+  table[keys[-1]] = _entry(0)
+
+  assert table.get(keys[0]) is None
+  assert table.get(keys[-1]) is not None
+  assert table.stats.overwrites == 1
+
+
+def test_clear_resets_entries_and_counters() -> None:
+  table = ArrayTranspositionTable(0.01)
+  table[1] = _entry(1)
+
+  table.clear()
+
+  assert len(table) == 0
+  assert table.get(1) is None
+  assert table.stats.stores == 0
@@ -0,0 +1,193 @@
+import io
+import json
+import os
+import subprocess
+import sys
+
+import chess
+import numpy as np
+import pytest
+from hypothesis import given
+
+from chesag.evaluation import (
+  PIECE_VALUES,
+  EvaluationWeights,
+  evaluate,
+  get_evaluation_weights,
+  load_weights,
+  save_weights,
+  set_evaluation_weights,
+  terminal_evaluation,
+)
+from chesag.tuning import (
+  FEATURE_NAMES,
+  TuningData,
+  extract_features,
+  fit_scale,
+  iter_pgn_positions,
+  logistic_loss,
+  position_features,
+  tune_weights,
+  weights_vector,
+)
+from tests.hypothesis_strategies import legal_boards
+
+PGN = """[Result "1-0"]
+
+1. e4 e5 2. Bc4 Nc6 3. Qh5 Nf6 4. Qxf7# 1-0
+
+[Result "1/2-1/2"]
+
+1. d4 d5 2. c4 e6 1/2-1/2
+
+[Result "*"]
+
+1. e4 c5 *
+"""
+
+
+@given(board=legal_boards(max_plies=60))
+def test_position_features_reproduce_leaf_evaluation(board: chess.Board) -> None:
+  if terminal_evaluation(board, chess.WHITE) is None:
+    assert position_features(board) @ weights_vector() == pytest.approx(evaluate(board, chess.WHITE), abs=1e-9)
+
+
+def test_iter_pgn_positions_samples_quiet_positions_of_decided_games() -> None:
+  all_positions = [(board.fen(), outcome) for board, outcome in iter_pgn_positions(io.StringIO(PGN), skip_plies=0)]
+  sampled = list(iter_pgn_positions(io.StringIO(PGN), skip_plies=2, sample_every=2))
+
+  assert [outcome for _, outcome in all_positions] == [1.0] * 6 + [0.5] * 4
+  assert len(sampled) == 5
+  assert not any(chess.Board(fen).is_check() for fen, _ in all_positions)
+
+
+def test_extract_features_is_independent_of_chunk_size() -> None:
+  small = extract_features([io.StringIO(PGN)], skip_plies=0, chunk_size=3)
+  large = extract_features([io.StringIO(PGN)], skip_plies=0)
+  capped = extract_features([io.StringIO(PGN)], skip_plies=0, max_positions=4, chunk_size=3)
+
+  assert small.features.shape == (10, len(FEATURE_NAMES))
+  np.testing.assert_array_equal(small.features, large.features)
+  np.testing.assert_array_equal(small.outcomes, large.outcomes)
+  assert len(capped) == 4
+
+
+def test_extract_features_reads_pgn_paths(tmp_path) -> None:
+  path = tmp_path / "games.pgn"
+  path.write_text(PGN, encoding="utf-8")
+
+  data = extract_features([path, str(path)], skip_plies=0)
+
+  assert len(data) == 20
+
+
+def test_tuning_data_round_trips_through_npz(tmp_path) -> None:
+  data = extract_features([io.StringIO(PGN)], skip_plies=0)
+  path = tmp_path / "features.npz"
+
+  data.save(path)
+  loaded = TuningData.load(path)
+
+  np.testing.assert_array_equal(loaded.features, data.features)
+  np.testing.assert_array_equal(loaded.outcomes, data.outcomes)
+
+
+def _synthetic_data(true_weights: np.ndarray, scale: float, positions: int = 4000) -> TuningData:
+  rng = np.random.default_rng(7)
+  features = rng.normal(size=(positions, len(FEATURE_NAMES)))
+  logits = scale * (features @ true_weights)
+  return TuningData(features=features, outcomes=1 / (1 + np.exp(-logits)))
+
+
+def test_tune_weights_recovers_the_weights_behind_the_outcomes() -> None:
+  true_weights = weights_vector() * np.linspace(0.5, 1.5, len(FEATURE_NAMES))
+  true_weights[FEATURE_NAMES.index("pawn")] = 1.0
+  data = _synthetic_data(true_weights, scale=0.8)
+
+  result = tune_weights(data, scale=0.8, epochs=600, learning_rate=0.05)
+  fitted = weights_vector(result.weights)
+
+  assert result.final_loss < result.initial_loss
+  assert result.weights.pawn == get_evaluation_weights().pawn
+  np.testing.assert_allclose(fitted, true_weights, atol=0.05)
+  assert result.as_dict()["positions"] == len(data)
+
+
+def test_tune_weights_supports_mini_batches() -> None:
+  data = _synthetic_data(weights_vector(), scale=0.8)
+
+  initial = EvaluationWeights(knight=2.0, rook=6.0, mobility=0.5)
+
+  result = tune_weights(data, initial=initial, scale=0.8, epochs=5, batch_size=512, learning_rate=0.05)
+
+  assert len(result.losses) == 6
+  assert result.final_loss < result.initial_loss
+
+
+def test_fit_scale_finds_the_generating_scale() -> None:
+  data = _synthetic_data(weights_vector(), scale=1.3)
+
+  assert fit_scale(data) == pytest.approx(1.3, abs=0.05)
+  assert logistic_loss(data.features, data.outcomes, weights_vector(), 1.3) < logistic_loss(
+    data.features, data.outcomes, weights_vector(), 0.5
+  )
+
+
+def test_tune_weights_rejects_bad_input() -> None:
+  data = _synthetic_data(weights_vector(), scale=1.0, positions=10)
+
+  with pytest.raises(ValueError, match="Unknown evaluation weights"):
+    tune_weights(data, frozen=("king",))
+  with pytest.raises(ValueError, match="without positions"):
+    tune_weights(TuningData(np.empty((0, len(FEATURE_NAMES))), np.empty(0)))
+
+
+def test_weights_file_round_trips(tmp_path) -> None:
+  weights = EvaluationWeights(knight=3.0, mobility=0.07)
+  path = tmp_path / "weights.json"
+
+  save_weights(weights, path)
+
+  assert load_weights(path) == weights
+  assert json.loads(path.read_text(encoding="utf-8"))["knight"] == 3.0
+
+
+def test_weights_from_dict_rejects_unknown_names() -> None:
+  with pytest.raises(ValueError, match="king"):
+    EvaluationWeights.from_dict({"king": 100.0})
+
+
+def test_set_evaluation_weights_changes_evaluation_and_piece_values() -> None:
+  board = chess.Board("4k3/8/8/8/8/8/3NP3/4K3 w - - 0 1")
+  default = get_evaluation_weights()
+  before = evaluate(board, chess.WHITE)
+
+  set_evaluation_weights(EvaluationWeights(knight=4.2))
+  try:
+    assert PIECE_VALUES[chess.KNIGHT] == 4.2
+    assert evaluate(board, chess.WHITE) == pytest.approx(before + 1.0)
+  finally:
+    set_evaluation_weights(default)
+
+  assert evaluate(board, chess.WHITE) == before
+  assert PIECE_VALUES[chess.KNIGHT] == default.knight
+
+
+def test_weights_file_is_loaded_at_startup(tmp_path) -> None:
+  path = tmp_path / "weights.json"
+  save_weights(EvaluationWeights(bishop_pair=0.75), path)
+  env = {**os.environ, "CHESAG_WEIGHTS": str(path)}
+
+  output = subprocess.run(
+    [
+      sys.executable,
+      "-c",
+      "from chesag.evaluation import get_evaluation_weights; print(get_evaluation_weights().bishop_pair)",
+    ],
+    capture_output=True,
+    check=True,
+    env=env,
+    text=True,
+  ).stdout
+
+  assert float(output) == 0.75